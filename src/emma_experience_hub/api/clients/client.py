@@ -25,15 +25,14 @@ class Client(ABC):
     def _run_healthcheck(self, endpoint: str) -> bool:
         """Verify the server is healthy."""
         if self._is_disabled:
-            logger.debug(f"Client disabled for {self.__class__.__name__}")
+            logger.debug("Client disabled for {}", self.__class__.__name__)
             return True
 
-        with httpx.Client() as client:
-            response = client.get(endpoint)
-
         try:
+            with httpx.Client(timeout=self._timeout) as client:
+                response = client.get(endpoint)
             response.raise_for_status()
-        except httpx.HTTPStatusError:
+        except httpx.HTTPError:
             logger.exception("Unable to perform healthcheck")
             return False
 
@@ -2,6 +2,7 @@ from typing import Any, Optional
 
 import httpx
 from loguru import logger
+from pydantic import AnyHttpUrl
 
 from emma_common.datamodels import (
     DialogueUtterance,
@@ -10,10 +11,51 @@ from emma_common.datamodels import (
     TorchDataMixin,
 )
 from emma_experience_hub.api.clients.client import Client
+from emma_experience_hub.api.clients.policy_framing import (
+    FRAMED_POLICY_REQUEST_CONTENT_TYPE,
+    PolicyRequestFramer,
+)
+from emma_experience_hub.api.clients.policy_references import (
+    FEATURE_REFERENCES_CONTENT_TYPE,
+    FeatureReferenceRequestBuilder,
+)
+from emma_experience_hub.api.clients.shared_memory import SharedFeatureArena
+from emma_experience_hub.api.observability.logging import truncate_for_logging
 
 
 class EmmaPolicyClient(Client):
-    """API client for interfacing with an EMMA Policy model."""
+    """API client for interfacing with an EMMA Policy model.
+
+    If framed requests are enabled, the features for each turn in the history are only serialised
+    the first time they are sent. If feature references are enabled, features which have already
+    been sent are referred to by their hash instead, and new features are handed over through the
+    shared memory if it is given, so it must only be given if the server can open it. The policy
+    server must support either mode.
+    """
+
+    def __init__(
+        self,
+        endpoint: AnyHttpUrl,
+        timeout: Optional[int],
+        *,
+        disable: bool = False,
+        enable_framed_requests: bool = False,
+        enable_feature_references: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        shared_arena: Optional[SharedFeatureArena] = None,
+    ) -> None:
+        super().__init__(endpoint, timeout, disable=disable)
+        self._transport = transport
+
+        self._request_framer: Optional[PolicyRequestFramer] = None
+        if enable_framed_requests or enable_feature_references:
+            self._request_framer = PolicyRequestFramer()
+
+        self._reference_builder: Optional[FeatureReferenceRequestBuilder] = None
+        if enable_feature_references and self._request_framer is not None:
+            self._reference_builder = FeatureReferenceRequestBuilder(
+                self._request_framer, shared_arena=shared_arena
+            )
 
     def healthcheck(self) -> bool:
         """Verify the server is online and healthy."""
@@ -41,12 +83,25 @@ class EmmaPolicyClient(Client):
             dialogue_history=dialogue_history,
             force_stop_token=force_stop_token,
         )
-        logger.debug(f"Sending {emma_policy_request.num_images} images.")
-        logger.debug(f"Sending dialogue history: {emma_policy_request.dialogue_history}")
-        logger.debug(f"size of the history {len(environment_state_history)}")
+        logger.debug("Sending {} images.", emma_policy_request.num_images)
+        logger.debug("Sending dialogue history: {}", emma_policy_request.dialogue_history)
+        logger.debug("size of the history {}", len(environment_state_history))
 
-        with httpx.Client(timeout=None) as client:
-            response = client.post(endpoint, content=TorchDataMixin.to_bytes(emma_policy_request))
+        with httpx.Client(timeout=None, transport=self._transport) as client:
+            if self._reference_builder is not None:
+                response = self._post_with_feature_references(
+                    client, endpoint, emma_policy_request
+                )
+            elif self._request_framer is not None:
+                response = client.post(
+                    endpoint,
+                    content=self._request_framer.to_frames(emma_policy_request),
+                    headers={"content-type": FRAMED_POLICY_REQUEST_CONTENT_TYPE},
+                )
+            else:
+                response = client.post(
+                    endpoint, content=TorchDataMixin.to_bytes(emma_policy_request)
+                )
 
         try:
             response.raise_for_status()
@@ -55,5 +110,42 @@ class EmmaPolicyClient(Client):
             raise err from None
 
         json_response = response.json()
-        logger.debug(f"Response from policy endpoint `{endpoint}`: {json_response}")
+        logger.opt(lazy=True).debug(
+            "Response from policy endpoint `{}`: {}",
+            lambda: endpoint,
+            lambda: truncate_for_logging(str(json_response)),
+        )
         return json_response
+
+    def _post_with_feature_references(
+        self, client: httpx.Client, endpoint: str, emma_policy_request: EmmaPolicyRequest
+    ) -> httpx.Response:
+        """Send the request, attaching any features the server reports as missing."""
+        if self._reference_builder is None:
+            raise AssertionError("Feature references are not enabled for the client.")
+
+        body_chunks, attached_digests = self._reference_builder.build(emma_policy_request)
+        response = client.post(
+            endpoint,
+            content=body_chunks,
+            headers={"content-type": FEATURE_REFERENCES_CONTENT_TYPE},
+        )
+
+        if response.status_code == httpx.codes.CONFLICT:
+            missing_digests = response.json()["missing"]
+            logger.debug("Policy server is missing {} features", len(missing_digests))
+            self._reference_builder.forget(missing_digests)
+
+            body_chunks, attached_digests = self._reference_builder.build(
+                emma_policy_request, missing_digests=missing_digests
+            )
+            response = client.post(
+                endpoint,
+                content=body_chunks,
+                headers={"content-type": FEATURE_REFERENCES_CONTENT_TYPE},
+            )
+
+        if response.is_success:
+            self._reference_builder.mark_as_sent(attached_digests)
+
+        return response
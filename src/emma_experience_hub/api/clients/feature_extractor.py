@@ -1,9 +1,8 @@
 from io import BytesIO
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 import httpx
 import numpy as np
-import torch
 from loguru import logger
 from numpy.typing import ArrayLike
 from PIL import Image
@@ -13,6 +12,10 @@ from emma_experience_hub.api.clients.client import Client
 from emma_experience_hub.datamodels import EmmaExtractedFeatures
 
 
+if TYPE_CHECKING:
+    import torch
+
+
 class FeatureExtractorClient(Client):
     """API Client for sending requests to the feature extractor server."""
 
@@ -23,7 +26,7 @@ class FeatureExtractorClient(Client):
         """Verify the feature extractor server is healthy."""
         return self._run_healthcheck(f"{self._endpoint}/ping")
 
-    def change_device(self, device: torch.device) -> None:
+    def change_device(self, device: "torch.device") -> None:
         """Change the device used by the feature extractor.
 
         This is primarily useful for ensuring the perception and policy model are on the same GPU.
@@ -0,0 +1,142 @@
+"""Framed request bodies for the policy servers.
+
+Serialising the whole policy request on every turn means serialising the features for every turn
+in the history again, even though they have not changed. Instead, the body is split into frames,
+where each frame is prefixed with its length:
+
+1. The request without any environment history, serialised with torch.
+2. For each turn in the environment history, a JSON header with the output and the number of
+   frames for the turn, followed by the features for each frame, serialised with torch.
+
+The features for each frame are only serialised the first time they are sent.
+"""
+import struct
+from collections import OrderedDict
+from collections.abc import Iterator
+from hashlib import blake2b
+from threading import Lock
+from typing import NamedTuple
+
+import orjson
+
+from emma_common.datamodels import (
+    EmmaExtractedFeatures,
+    EmmaPolicyRequest,
+    EnvironmentStateTurn,
+    TorchDataMixin,
+)
+
+
+FRAMED_POLICY_REQUEST_CONTENT_TYPE = "application/x-emma-framed-policy-request"
+
+_frame_length = struct.Struct("<Q")
+
+
+class SerialisedFeatures(NamedTuple):
+    """Features with their serialised bytes, and a hash of the bytes."""
+
+    features: EmmaExtractedFeatures
+    data: bytes
+    digest: str
+
+
+class PolicyRequestFramer:
+    """Build framed policy requests, reusing the bytes for features which have been sent before.
+
+    Features are identified by the objects they hold, since the features for a turn are loaded
+    once and then shared by every request that includes the turn.
+    """
+
+    def __init__(self, max_cached_features: int = 256) -> None:
+        self._max_cached_features = max_cached_features
+        self._serialised_features: OrderedDict[int, SerialisedFeatures] = OrderedDict()
+        self._lock = Lock()
+
+    def to_frames(self, request: EmmaPolicyRequest) -> Iterator[bytes]:
+        """Yield the chunks of the body for the request, which can be streamed as-is."""
+        request_without_history = request.copy(update={"environment_history": []})
+        yield from frame(TorchDataMixin.to_bytes(request_without_history))
+
+        for turn in request.environment_history:
+            turn_header = {"output": turn.output, "num_features": len(turn.features)}
+            yield from frame(orjson.dumps(turn_header))
+
+            for features in turn.features:
+                yield from frame(self.serialise_features(features).data)
+
+    def serialise_features(self, features: EmmaExtractedFeatures) -> SerialisedFeatures:
+        """Serialise the features, unless they have been serialised before."""
+        features_key = id(features.bbox_features)
+
+        with self._lock:
+            cached_features = self._serialised_features.get(features_key)
+            if cached_features is not None and _is_same_features(
+                cached_features.features, features
+            ):
+                self._serialised_features.move_to_end(features_key)
+                return cached_features
+
+        features_bytes = TorchDataMixin.to_bytes(features)
+        # Keep the features to make sure their ID is not reused while they are cached
+        serialised_features = SerialisedFeatures(
+            features=features,
+            data=features_bytes,
+            digest=hash_features_bytes(features_bytes),
+        )
+
+        with self._lock:
+            self._serialised_features[features_key] = serialised_features
+            if len(self._serialised_features) > self._max_cached_features:
+                self._serialised_features.popitem(last=False)
+
+        return serialised_features
+
+
+def decode_framed_policy_request(body: bytes) -> EmmaPolicyRequest:
+    """Rebuild the policy request from a framed body."""
+    frames = split_frames(body)
+    request: EmmaPolicyRequest = TorchDataMixin.get_object(next(frames))
+
+    environment_history: list[EnvironmentStateTurn] = []
+    for turn_header_frame in frames:
+        turn_header = orjson.loads(turn_header_frame)
+        turn_features = [
+            TorchDataMixin.get_object(next(frames)) for _ in range(turn_header["num_features"])
+        ]
+        environment_history.append(
+            EnvironmentStateTurn(features=turn_features, output=turn_header["output"])
+        )
+
+    return request.copy(update={"environment_history": environment_history})
+
+
+def hash_features_bytes(features_bytes: bytes) -> str:
+    """Hash the serialised features, so they can be referred to without including them."""
+    return blake2b(features_bytes, digest_size=16).hexdigest()
+
+
+def frame(frame_bytes: bytes) -> Iterator[bytes]:
+    """Prefix the bytes with their length."""
+    yield _frame_length.pack(len(frame_bytes))
+    yield frame_bytes
+
+
+def split_frames(body: bytes) -> Iterator[bytes]:
+    """Split the body back into each frame."""
+    body_view = memoryview(body)
+    offset = 0
+    while offset < len(body_view):
+        (frame_size,) = _frame_length.unpack_from(body_view, offset)
+        offset += _frame_length.size
+        yield body_view[offset : offset + frame_size].tobytes()
+        offset += frame_size
+
+
+def _is_same_features(
+    cached_features: EmmaExtractedFeatures, features: EmmaExtractedFeatures
+) -> bool:
+    """Check whether both features hold the exact same objects."""
+    return all(
+        getattr(cached_features, field_name) is getattr(features, field_name)
+        for field_name in features.__fields__  # noqa: WPS609
+    )
@@ -0,0 +1,225 @@
+"""Policy requests which refer to features by their hash, instead of always including them.
+
+The body is framed in the same way as `policy_framing`:
+
+1. The request without any environment history, serialised with torch.
+2. A JSON header with the output and the feature hashes for each turn, and the hashes of the
+   features which are attached to the request.
+3. The attached features, serialised with torch, in the same order as in the header.
+
+When the server is on the same host, new features are written to shared memory instead of being
+attached, and the header includes a handle to them (see `shared_memory`).
+
+The client only attaches the features which it has not sent to the server before. If the server no
+longer has some of the referenced features, it responds with a 409 and the missing hashes, and the
+client sends the request again with those features attached.
+"""
+from collections import OrderedDict
+from collections.abc import Iterable
+from threading import Lock
+from typing import Optional
+
+import orjson
+
+from emma_common.datamodels import (
+    EmmaExtractedFeatures,
+    EmmaPolicyRequest,
+    EnvironmentStateTurn,
+    TorchDataMixin,
+)
+from emma_experience_hub.api.clients.policy_framing import (
+    PolicyRequestFramer,
+    SerialisedFeatures,
+    frame,
+    split_frames,
+)
+from emma_experience_hub.api.clients.shared_memory import (
+    SharedFeatureArena,
+    SharedFeatureReader,
+    SharedFeaturesHandle,
+)
+
+
+FEATURE_REFERENCES_CONTENT_TYPE = "application/x-emma-feature-references"
+
+
+class MissingFeaturesError(Exception):
+    """The request refers to features which the server does not have."""
+
+    def __init__(self, missing_digests: list[str]) -> None:
+        super().__init__(f"Missing {len(missing_digests)} features")
+        self.missing_digests = missing_digests
+
+
+class FeatureReferenceRequestBuilder:
+    """Build policy requests which only attach features that the server might not have."""
+
+    def __init__(
+        self,
+        request_framer: PolicyRequestFramer,
+        max_known_digests: int = 4096,
+        shared_arena: Optional[SharedFeatureArena] = None,
+    ) -> None:
+        self._request_framer = request_framer
+        self._shared_arena = shared_arena
+        self._max_known_digests = max_known_digests
+        self._known_digests: OrderedDict[str, None] = OrderedDict()
+        self._lock = Lock()
+
+    def build(
+        self, request: EmmaPolicyRequest, missing_digests: Iterable[str] = ()
+    ) -> tuple[list[bytes], list[str]]:
+        """Build the chunks of the body, and get the hashes of the features attached to it.
+
+        Any features the server reported as missing are attached, even if they were sent before,
+        since the server could not read them from the shared memory either.
+        """
+        missing_digests = set(missing_digests)
+
+        turn_headers = []
+        attached_features: dict[str, SerialisedFeatures] = {}
+        shared_features: dict[str, SharedFeaturesHandle] = {}
+        for turn in request.environment_history:
+            turn_digests = []
+            for features in turn.features:
+                serialised_features = self._request_framer.serialise_features(features)
+                turn_digests.append(serialised_features.digest)
+
+                if serialised_features.digest in missing_digests:
+                    attached_features[serialised_features.digest] = serialised_features
+                elif not self._is_pending(
+                    serialised_features.digest, shared_features, attached_features
+                ):
+                    self._share_or_attach(serialised_features, shared_features, attached_features)
+
+            turn_headers.append({"output": turn.output, "features": turn_digests})
+
+        request_without_history = request.copy(update={"environment_history": []})
+        header = {
+            "turns": turn_headers,
+            "attached": list(attached_features.keys()),
+            "shared": {digest: list(handle) for digest, handle in shared_features.items()},
+        }
+
+        chunks = [
+            *frame(TorchDataMixin.to_bytes(request_without_history)),
+            *frame(orjson.dumps(header)),
+        ]
+        for serialised_features in attached_features.values():
+            chunks.extend(frame(serialised_features.data))
+
+        return chunks, [*attached_features.keys(), *shared_features.keys()]
+
+    def mark_as_sent(self, digests: Iterable[str]) -> None:
+        """Remember that the server has received the features."""
+        with self._lock:
+            for digest in digests:
+                self._known_digests[digest] = None
+                self._known_digests.move_to_end(digest)
+
+            while len(self._known_digests) > self._max_known_digests:
+                self._known_digests.popitem(last=False)
+
+    def forget(self, digests: Iterable[str]) -> None:
+        """Forget that the server had the features, because it no longer does."""
+        with self._lock:
+            for digest in digests:
+                self._known_digests.pop(digest, None)
+
+    def _is_known(self, digest: str) -> bool:
+        """Has the server already received the features?"""
+        with self._lock:
+            return digest in self._known_digests
+
+    def _is_pending(
+        self,
+        digest: str,
+        shared_features: dict[str, SharedFeaturesHandle],
+        attached_features: dict[str, SerialisedFeatures],
+    ) -> bool:
+        """Has the server received the features, or are they already part of the request?"""
+        return digest in shared_features or digest in attached_features or self._is_known(digest)
+
+    def _share_or_attach(
+        self,
+        serialised_features: SerialisedFeatures,
+        shared_features: dict[str, SharedFeaturesHandle],
+        attached_features: dict[str, SerialisedFeatures],
+    ) -> None:
+        """Write the features to the shared memory if possible, otherwise attach them."""
+        shared_handle = None
+        if self._shared_arena is not None:
+            shared_handle = self._shared_arena.write(serialised_features.data)
+
+        if shared_handle is None:
+            attached_features[serialised_features.digest] = serialised_features
+        else:
+            shared_features[serialised_features.digest] = shared_handle
+
+
+class FeatureReferenceCache:
+    """Server-side cache of the features which have been sent to the server, by their hash."""
+
+    def __init__(
+        self, max_features: int = 4096, shared_reader: Optional[SharedFeatureReader] = None
+    ) -> None:
+        self._max_features = max_features
+        self._shared_reader = shared_reader
+        self._features: OrderedDict[str, EmmaExtractedFeatures] = OrderedDict()
+        self._lock = Lock()
+
+    def decode(self, body: bytes) -> EmmaPolicyRequest:
+        """Rebuild the request, using the cache for any features which are not attached.
+
+        Raises `MissingFeaturesError` if any of the referenced features are not in the cache.
+        """
+        frames = split_frames(body)
+        request: EmmaPolicyRequest = TorchDataMixin.get_object(next(frames))
+        header = orjson.loads(next(frames))
+
+        with self._lock:
+            for digest, features_bytes in zip(header["attached"], frames):
+                self._features[digest] = TorchDataMixin.get_object(features_bytes)
+                self._features.move_to_end(digest)
+
+            for digest, shared_handle in header.get("shared", {}).items():
+                features_bytes = self._read_shared_features(
+                    SharedFeaturesHandle(*shared_handle), digest
+                )
+                if features_bytes is not None:
+                    self._features[digest] = TorchDataMixin.get_object(features_bytes)
+                    self._features.move_to_end(digest)
+
+            missing_digests = [
+                digest
+                for turn_header in header["turns"]
+                for digest in turn_header["features"]
+                if digest not in self._features
+            ]
+            if missing_digests:
+                raise MissingFeaturesError(list(dict.fromkeys(missing_digests)))
+
+            environment_history = [
+                EnvironmentStateTurn(
+                    features=[self._features[digest] for digest in turn_header["features"]],
+                    output=turn_header["output"],
+                )
+                for turn_header in header["turns"]
+            ]
+
+            while len(self._features) > self._max_features:
+                self._features.popitem(last=False)
+
+        return request.copy(update={"environment_history": environment_history})
+
+    def _read_shared_features(
+        self, shared_handle: SharedFeaturesHandle, digest: str
+    ) -> Optional[bytes]:
+        """Read the features from shared memory, if the server is able to."""
+        if self._shared_reader is None:
+            return None
+        return self._shared_reader.read(shared_handle, digest)
+
+    def __len__(self) -> int:
+        """Get the number of features in the cache."""
+        return len(self._features)
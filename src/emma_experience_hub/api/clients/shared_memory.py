@@ -0,0 +1,110 @@
+"""Hand features to model servers on the same host through shared memory.
+
+The hub owns a ring of shared memory, backed by `/dev/shm`, and writes the serialised features
+into it. Requests then only include a handle to the features: the name of the segment, and the
+offset and length of the bytes within it.
+
+Older features are overwritten once the ring wraps around, so the server checks the hash of the
+bytes it reads against the hash in the request. If they do not match, the server reports the
+features as missing and the client attaches them to the request instead.
+
+Whether a server can open the shared memory cannot be told from its URL (e.g. containers do not
+share `/dev/shm` unless configured to), so each server which can must be enabled in the settings.
+"""
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import NamedTuple, Optional
+from uuid import uuid4
+
+from loguru import logger
+
+from emma_experience_hub.api.clients.policy_framing import hash_features_bytes
+
+
+class SharedFeaturesHandle(NamedTuple):
+    """Where the serialised features are within the shared memory."""
+
+    segment: str
+    offset: int
+    length: int
+
+
+class SharedFeatureArena:
+    """Ring of shared memory which the hub writes serialised features into."""
+
+    def __init__(self, size: int, name: Optional[str] = None) -> None:
+        self._memory = SharedMemory(
+            name=name or f"emma-hub-features-{uuid4().hex[:8]}", create=True, size=size
+        )
+        self._size = size
+        self._cursor = 0
+        self._lock = Lock()
+
+        logger.info("Created shared memory for features: {} ({} bytes)", self.name, size)
+
+    @property
+    def name(self) -> str:
+        """Get the name of the shared memory segment."""
+        return self._memory.name
+
+    def write(self, data: bytes) -> Optional[SharedFeaturesHandle]:
+        """Write the bytes to the ring, unless they are too large to fit."""
+        data_length = len(data)
+        if data_length > self._size:
+            return None
+
+        with self._lock:
+            if self._cursor + data_length > self._size:
+                self._cursor = 0
+            offset = self._cursor
+            self._memory.buf[offset : offset + data_length] = data
+            self._cursor += data_length
+
+        return SharedFeaturesHandle(segment=self.name, offset=offset, length=data_length)
+
+    def close(self) -> None:
+        """Release the shared memory."""
+        self._memory.close()
+        self._memory.unlink()
+
+
+class SharedFeatureReader:
+    """Read serialised features from shared memory owned by another process."""
+
+    def __init__(self) -> None:
+        self._segments: dict[str, SharedMemory] = {}
+        self._lock = Lock()
+
+    def read(self, handle: SharedFeaturesHandle, digest: str) -> Optional[bytes]:
+        """Read the bytes for the handle, if they are still the bytes with the given hash."""
+        segment = self._get_segment(handle.segment)
+        if segment is None or handle.offset + handle.length > segment.size:
+            return None
+
+        data = bytes(segment.buf[handle.offset : handle.offset + handle.length])
+        if hash_features_bytes(data) != digest:
+            return None
+        return data
+
+    def close(self) -> None:
+        """Stop reading from any shared memory segments."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+
+    def _get_segment(self, segment_name: str) -> Optional[SharedMemory]:
+        """Get the segment, attaching to it the first time."""
+        with self._lock:
+            if segment_name not in self._segments:
+                try:
+                    segment = SharedMemory(name=segment_name)
+                except FileNotFoundError:
+                    return None
+
+                # Attaching registers the segment with this process's resource tracker, which
+                # would unlink it when the process exits, even though the hub still owns it
+                resource_tracker.unregister(segment._name, "shared_memory")  # noqa: WPS437
+                self._segments[segment_name] = segment
+            return self._segments[segment_name]
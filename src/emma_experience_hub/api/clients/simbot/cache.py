@@ -9,14 +9,20 @@ data.
 The main classes that should be used are the ones at the bottom of this module. All the generics
 are just there for keep things separated and clear.
 """
+from collections.abc import Iterator
+from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Generic, Optional, TypeVar, Union
+from typing import Any, Generic, Optional, TypeVar, Union
 
-import torch
+import orjson
 
 from emma_experience_hub.api.clients.client import Client
-from emma_experience_hub.api.clients.pydantic import PydanticClientMixin, PydanticT
+from emma_experience_hub.api.clients.pydantic import (
+    PydanticClientMixin,
+    PydanticT,
+    conform_non_json_serializable_types,
+)
 from emma_experience_hub.datamodels import EmmaExtractedFeatures
 from emma_experience_hub.datamodels.simbot.payloads import SimBotAuxiliaryMetadataPayload
 
@@ -41,6 +47,16 @@ class SimBotCacheClient(Client, Generic[T]):
         """Healthcheck for the client."""
         return self._local_cache_dir.exists()
 
+    @contextmanager
+    def use_local_cache_dir(self, local_cache_dir: Path) -> Iterator[None]:
+        """Temporarily save to and load from a different directory."""
+        original_cache_dir = self._local_cache_dir
+        self._local_cache_dir = local_cache_dir
+        try:
+            yield
+        finally:
+            self._local_cache_dir = original_cache_dir
+
     def check_exist(self, session_id: str, prediction_request_id: str) -> bool:
         """Check whether or not the file exists."""
         return self._create_local_path(session_id, prediction_request_id).exists()
@@ -97,11 +113,23 @@ class SimBotPydanticCacheClient(PydanticClientMixin[PydanticT], SimBotCacheClien
 
 
 class SimBotAuxiliaryMetadataClient(SimBotPydanticCacheClient[SimBotAuxiliaryMetadataPayload]):
-    """Cache auxiliary metadata."""
+    """Cache auxiliary metadata.
+
+    The metadata is saved with the same keys as the original file, so that it can be loaded from
+    the cache without reading the original file again.
+    """
 
     model = SimBotAuxiliaryMetadataPayload
     suffix = "json"
 
+    def _pydantic_to_bytes(self, data: SimBotAuxiliaryMetadataPayload) -> bytes:
+        """Convert the metadata to bytes, using the keys from the original file."""
+        return orjson.dumps(
+            data.dict(by_alias=True),
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=conform_non_json_serializable_types,
+        )
+
 
 class SimBotExtractedFeaturesClient(SimBotCacheClient[list[EmmaExtractedFeatures]]):
     """Cache extracted features on the File system."""
@@ -122,6 +150,8 @@ class SimBotExtractedFeaturesClient(SimBotCacheClient[list[EmmaExtractedFeatures
         data_as_dict = {idx: instance.dict() for idx, instance in enumerate(data)}
 
         # Save with torch
+        import torch  # noqa: WPS433
+
         data_buffer = BytesIO()
         torch.save(data_as_dict, data_buffer)
 
@@ -131,7 +161,9 @@ class SimBotExtractedFeaturesClient(SimBotCacheClient[list[EmmaExtractedFeatures
     def load(self, session_id: str, prediction_request_id: str) -> list[EmmaExtractedFeatures]:
         """Load the extracted features from a single file."""
         # Load the raw data using torch.
-        raw_data: dict[int, dict[str, torch.Tensor]] = torch.load(
+        import torch  # noqa: WPS433
+
+        raw_data: dict[int, dict[str, Any]] = torch.load(
             BytesIO(self._load_bytes(session_id, prediction_request_id))
         )
 
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from threading import Lock
+
 from loguru import logger
 
 from emma_experience_hub.api.clients.client import Client
@@ -13,7 +16,11 @@ from emma_experience_hub.datamodels.simbot.payloads import SimBotAuxiliaryMetada
 
 
 class SimBotFeaturesClient(Client):
-    """Extract features and cache them."""
+    """Extract features and cache them.
+
+    The auxiliary metadata for the most recent turns is also kept in memory, so that it is only
+    read and validated once for each turn.
+    """
 
     def __init__(
         self,
@@ -21,12 +28,19 @@ class SimBotFeaturesClient(Client):
         feature_extractor_client: FeatureExtractorClient,
         features_cache_client: SimBotExtractedFeaturesClient,
         placeholder_vision_client: SimBotPlaceholderVisionClient,
+        max_auxiliary_metadata_in_memory: int = 8,
     ) -> None:
         self.auxiliary_metadata_cache_client = auxiliary_metadata_cache_client
         self.features_cache_client = features_cache_client
         self.feature_extractor_client = feature_extractor_client
         self.placeholder_vision_client = placeholder_vision_client
 
+        self._max_auxiliary_metadata_in_memory = max_auxiliary_metadata_in_memory
+        self._auxiliary_metadata: OrderedDict[
+            tuple[str, str], SimBotAuxiliaryMetadataPayload
+        ] = OrderedDict()
+        self._auxiliary_metadata_lock = Lock()
+
     def healthcheck(self) -> bool:
         """Verify all clients are healthy."""
         return all(
@@ -59,8 +73,33 @@ class SimBotFeaturesClient(Client):
 
         return features
 
+    def add_auxiliary_metadata(
+        self, turn: SimBotSessionTurn, auxiliary_metadata: SimBotAuxiliaryMetadataPayload
+    ) -> None:
+        """Use the auxiliary metadata that was parsed with the request for the turn.
+
+        The metadata is kept in memory for the rest of the turn, and saved to the cache if it is
+        not already there.
+        """
+        auxiliary_metadata_exists = self.auxiliary_metadata_cache_client.check_exist(
+            turn.session_id, turn.prediction_request_id
+        )
+        if not auxiliary_metadata_exists:
+            self.auxiliary_metadata_cache_client.save(
+                auxiliary_metadata, turn.session_id, turn.prediction_request_id
+            )
+
+        self._remember_auxiliary_metadata(turn, auxiliary_metadata)
+
     def get_auxiliary_metadata(self, turn: SimBotSessionTurn) -> SimBotAuxiliaryMetadataPayload:
         """Cache the auxiliary metadata for the given turn."""
+        with self._auxiliary_metadata_lock:
+            auxiliary_metadata_in_memory = self._auxiliary_metadata.get(
+                (turn.session_id, turn.prediction_request_id)
+            )
+        if auxiliary_metadata_in_memory is not None:
+            return auxiliary_metadata_in_memory
+
         # Check whether the auxiliary metadata exists within the cache
         auxiliary_metadata_exists = self.auxiliary_metadata_cache_client.check_exist(
             turn.session_id, turn.prediction_request_id
@@ -84,6 +123,7 @@ class SimBotFeaturesClient(Client):
                 turn.prediction_request_id,
             )
 
+        self._remember_auxiliary_metadata(turn, auxiliary_metadata)
         return auxiliary_metadata
 
     def get_mask_for_embiggenator(self, turn: SimBotSessionTurn) -> list[list[int]]:
@@ -92,6 +132,17 @@ class SimBotFeaturesClient(Client):
         mask = self.placeholder_vision_client.get_embiggenator_mask(image)
         return mask
 
+    def _remember_auxiliary_metadata(
+        self, turn: SimBotSessionTurn, auxiliary_metadata: SimBotAuxiliaryMetadataPayload
+    ) -> None:
+        """Keep the auxiliary metadata in memory, forgetting the least recently used."""
+        turn_key = (turn.session_id, turn.prediction_request_id)
+        with self._auxiliary_metadata_lock:
+            self._auxiliary_metadata[turn_key] = auxiliary_metadata
+            self._auxiliary_metadata.move_to_end(turn_key)
+            while len(self._auxiliary_metadata) > self._max_auxiliary_metadata_in_memory:
+                self._auxiliary_metadata.popitem(last=False)
+
     def _extract_features(
         self, auxiliary_metadata: SimBotAuxiliaryMetadataPayload
     ) -> list[EmmaExtractedFeatures]:
@@ -1,5 +1,6 @@
 import sqlite3
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from loguru import logger
@@ -45,6 +46,17 @@ class SimBotSessionDbClient:
             if connection:
                 connection.close()
 
+    @contextmanager
+    def use_db_file(self, db_file: Path) -> Iterator[None]:
+        """Temporarily store the session turns in a different database."""
+        original_db_file = self._db_file
+        self._db_file = db_file
+        try:
+            self.create_table()
+            yield
+        finally:
+            self._db_file = original_db_file
+
     def healthcheck(self) -> bool:
         """Verify that the DB can be accessed and that it is ready."""
         try:
@@ -118,22 +130,18 @@ class SimBotSessionDbClient:
             logger.exception("Could not query for session turns")
             raise query_err
 
-        with ThreadPoolExecutor() as thread_pool:
-            # Try parse everything and hope it doesn't crash
-            try:
-                parsed_responses = list(
-                    thread_pool.map(
-                        SimBotSessionTurn.parse_raw,
-                        (response_item[2] for response_item in all_raw_turns),
-                    )
-                )
-            except Exception:
-                logger.exception(
-                    "Could not parse session turns from response. Returning an empty list."
-                )
-                return []
-
-        logger.debug(f"Successfully got previous `{len(parsed_responses)}` turns")
+        # Parsing is bound by the GIL, so it would not be any faster on a thread pool
+        try:
+            parsed_responses = [
+                SimBotSessionTurn.parse_raw(response_item[2]) for response_item in all_raw_turns
+            ]
+        except Exception:
+            logger.exception(
+                "Could not parse session turns from response. Returning an empty list."
+            )
+            return []
+
+        logger.debug("Successfully got previous `{}` turns", len(parsed_responses))
 
         # Sort the responses by the sort key before returning
         sorted_responses = sorted(parsed_responses, key=lambda turn: turn.idx)
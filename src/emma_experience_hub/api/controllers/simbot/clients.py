@@ -1,8 +1,10 @@
 import signal
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from threading import Event
 from time import sleep
-from typing import Any
+from typing import Any, Optional
 
 from loguru import logger
 from pydantic import BaseModel
@@ -17,6 +19,7 @@ from emma_experience_hub.api.clients.simbot import (
     SimBotPlaceholderVisionClient,
     SimBotSessionDbClient,
 )
+from emma_experience_hub.api.clients.shared_memory import SharedFeatureArena
 from emma_experience_hub.common.settings import SimBotSettings
 
 
@@ -31,8 +34,15 @@ class SimBotControllerClients(BaseModel, arbitrary_types_allowed=True):
     session_db: SimBotSessionDbClient
 
     @classmethod
-    def from_simbot_settings(cls, simbot_settings: SimBotSettings) -> "SimBotControllerClients":
-        """Instantiate all the clients from the SimBot settings."""
+    def from_simbot_settings(
+        cls,
+        simbot_settings: SimBotSettings,
+        shared_feature_arena: Optional[SharedFeatureArena] = None,
+    ) -> "SimBotControllerClients":
+        """Instantiate all the clients from the SimBot settings.
+
+        The shared memory is only given to the policy servers which are set as able to open it.
+        """
         return cls(
             features=SimBotFeaturesClient(
                 auxiliary_metadata_cache_client=SimBotAuxiliaryMetadataClient(
@@ -56,13 +66,54 @@ class SimBotControllerClients(BaseModel, arbitrary_types_allowed=True):
             cr_intent=SimBotCRIntentClient(
                 endpoint=simbot_settings.cr_predictor_url,
                 timeout=simbot_settings.client_timeout,
+                enable_framed_requests=simbot_settings.feature_flags.enable_framed_policy_requests,
+                enable_feature_references=(
+                    simbot_settings.feature_flags.enable_policy_feature_references
+                ),
+                shared_arena=(
+                    shared_feature_arena if simbot_settings.cr_predictor_shares_memory else None
+                ),
             ),
             action_predictor=SimbotActionPredictionClient(
                 endpoint=simbot_settings.action_predictor_url,
                 timeout=simbot_settings.client_timeout,
+                enable_framed_requests=simbot_settings.feature_flags.enable_framed_policy_requests,
+                enable_feature_references=(
+                    simbot_settings.feature_flags.enable_policy_feature_references
+                ),
+                shared_arena=(
+                    shared_feature_arena
+                    if simbot_settings.action_predictor_shares_memory
+                    else None
+                ),
             ),
         )
 
+    @contextmanager
+    def use_temporary_storage(self, storage_dir: Path) -> Iterator[None]:
+        """Temporarily persist the caches and the session turns within the given directory.
+
+        This is not thread-safe, so no other requests must be handled while it is in use.
+        """
+        metadata_cache_dir = storage_dir.joinpath("metadata")
+        features_cache_dir = storage_dir.joinpath("features")
+        metadata_cache_dir.mkdir(parents=True, exist_ok=True)
+        features_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with ExitStack() as exit_stack:
+            exit_stack.enter_context(
+                self.features.auxiliary_metadata_cache_client.use_local_cache_dir(
+                    metadata_cache_dir
+                )
+            )
+            exit_stack.enter_context(
+                self.features.features_cache_client.use_local_cache_dir(features_cache_dir)
+            )
+            exit_stack.enter_context(
+                self.session_db.use_db_file(storage_dir.joinpath("sessions.db"))
+            )
+            yield
+
     def healthcheck(self, attempts: int = 1, interval: int = 0) -> bool:
         """Perform healthcheck, with retry intervals.
 
@@ -1,8 +1,15 @@
+from pathlib import Path
+from typing import Optional
+
 from loguru import logger
 
 from emma_common.datamodels import SpeakerRole
+from emma_experience_hub.api.clients.shared_memory import SharedFeatureArena
 from emma_experience_hub.api.controllers.simbot.clients import SimBotControllerClients
+from emma_experience_hub.api.controllers.simbot.executor import SimBotIOExecutor
+from emma_experience_hub.api.controllers.simbot.health_monitor import SimBotHealthMonitor
 from emma_experience_hub.api.controllers.simbot.pipelines import SimBotControllerPipelines
+from emma_experience_hub.api.controllers.simbot.session_lock import SimBotSessionLock
 from emma_experience_hub.common.settings import SimBotSettings
 from emma_experience_hub.datamodels.simbot import (
     SimBotIntentType,
@@ -21,34 +28,76 @@ class SimBotController:
         settings: SimBotSettings,
         clients: SimBotControllerClients,
         pipelines: SimBotControllerPipelines,
+        session_lock: SimBotSessionLock,
+        health_monitor: SimBotHealthMonitor,
+        executor: Optional[SimBotIOExecutor] = None,
+        shared_feature_arena: Optional[SharedFeatureArena] = None,
     ) -> None:
         self.settings = settings
         self.clients = clients
         self.pipelines = pipelines
+        self.session_lock = session_lock
+        self.health_monitor = health_monitor
+        self.executor = executor
+        self.shared_feature_arena = shared_feature_arena
 
     @classmethod
     def from_simbot_settings(cls, simbot_settings: SimBotSettings) -> "SimBotController":
         """Instantiate the controller from the settings."""
-        clients = SimBotControllerClients.from_simbot_settings(simbot_settings)
-        pipelines = SimBotControllerPipelines.from_clients(clients, simbot_settings)
+        shared_feature_arena = None
+        can_share_memory = (
+            simbot_settings.cr_predictor_shares_memory
+            or simbot_settings.action_predictor_shares_memory
+        )
+        if simbot_settings.feature_flags.enable_shared_memory_features and can_share_memory:
+            shared_feature_arena = SharedFeatureArena(simbot_settings.shared_features_memory_size)
 
-        return cls(settings=simbot_settings, clients=clients, pipelines=pipelines)
+        clients = SimBotControllerClients.from_simbot_settings(
+            simbot_settings, shared_feature_arena
+        )
+        executor = SimBotIOExecutor(
+            max_workers=simbot_settings.io_executor_max_workers,
+            max_queue_size=simbot_settings.io_executor_max_queue_size,
+        )
+        pipelines = SimBotControllerPipelines.from_clients(clients, simbot_settings, executor)
+        session_lock = SimBotSessionLock(Path(simbot_settings.session_lock_dir))
+        health_monitor = SimBotHealthMonitor(clients, simbot_settings.healthcheck_interval)
+
+        return cls(
+            settings=simbot_settings,
+            clients=clients,
+            pipelines=pipelines,
+            session_lock=session_lock,
+            health_monitor=health_monitor,
+            executor=executor,
+            shared_feature_arena=shared_feature_arena,
+        )
 
     def healthcheck(self, attempts: int = 1, interval: int = 0) -> bool:
         """Check the healthy of all the connected services."""
         return self.clients.healthcheck(attempts, interval)
 
+    @property
+    def is_healthy(self) -> bool:
+        """Were all the connected services healthy when the health monitor last checked them?"""
+        return self.health_monitor.is_healthy
+
     def handle_request_from_simbot_arena(self, request: SimBotRequest) -> SimBotResponse:
-        """Handle an incoming request from the SimBot arena."""
-        session = self.load_session_from_request(request)
-        session = self._clear_queue_if_needed(session)
-        session = self.split_utterance_if_needed(session)
-        session = self.get_utterance_from_queue_if_needed(session)
-        session = self.extract_intent_from_user_utterance(session)
-        session = self.extract_intent_from_environment_feedback(session)
-        session = self.decide_what_the_agent_should_do(session)
-        session = self.generate_interaction_action_if_needed(session)
-        self._upload_session_turn_to_database(session)
+        """Handle an incoming request from the SimBot arena.
+
+        Requests for the same session are handled one at a time, so that each turn is always built
+        on top of the previous one.
+        """
+        with self.session_lock.acquire(request.header.session_id):
+            session = self.load_session_from_request(request)
+            session = self._clear_queue_if_needed(session)
+            session = self.split_utterance_if_needed(session)
+            session = self.get_utterance_from_queue_if_needed(session)
+            session = self.extract_intent_from_user_utterance(session)
+            session = self.extract_intent_from_environment_feedback(session)
+            session = self.decide_what_the_agent_should_do(session)
+            session = self.generate_interaction_action_if_needed(session)
+            self._upload_session_turn_to_database(session)
 
         return session.current_turn.convert_to_simbot_response()
 
@@ -75,8 +124,10 @@ class SimBotController:
 
         session = self.pipelines.request_processing.run(simbot_request)
 
-        # Cache the auxiliary metadata for the turn
-        self.clients.features.get_auxiliary_metadata(session.current_turn)
+        # Cache the auxiliary metadata for the turn, which was already loaded with the request
+        self.clients.features.add_auxiliary_metadata(
+            session.current_turn, simbot_request.auxiliary_metadata
+        )
 
         return session
 
@@ -86,12 +137,13 @@ class SimBotController:
         if not session.current_turn.speech:
             return session
 
-        logger.info(f"[REQUEST] Utterance: `{session.current_turn.speech.utterance}`")
+        logger.info("[REQUEST] Utterance: `{}`", session.current_turn.speech.utterance)
 
         # If the user has an intent --- i.e. it is not valid --- do not overwrite it.
         if session.current_turn.intent.user:
             logger.debug(
-                f"User intent (`{session.current_turn.intent.user}`) already exists for turn; using that."
+                "User intent (`{}`) already exists for turn; using that.",
+                session.current_turn.intent.user,
             )
             if session.current_state.last_user_utterance.is_not_empty:
                 session.current_state.last_user_utterance.pop_from_head()
@@ -102,7 +154,7 @@ class SimBotController:
 
         user_intent = self.pipelines.user_intent_extractor.run(session)
 
-        logger.info(f"[INTENT] User: `{user_intent}`")
+        logger.info("[INTENT] User: `{}`", user_intent)
         user_intent_is_not_act = user_intent != SimBotIntentType.act
         if user_intent_is_not_act and session.current_state.last_user_utterance.is_not_empty:
             session.current_state.last_user_utterance.pop_from_head()
@@ -118,7 +170,7 @@ class SimBotController:
             session
         )
 
-        logger.info(f"[INTENT] Environment: `{session.current_turn.intent.environment}`")
+        logger.info("[INTENT] Environment: `{}`", session.current_turn.intent.environment)
         return session
 
     def get_utterance_from_queue_if_needed(self, session: SimBotSession) -> SimBotSession:
@@ -141,7 +193,8 @@ class SimBotController:
         # Pop the utterance from the queue and add it to the turn
         if all(should_get_utterance_from_queue):
             logger.info(
-                f"[REQUEST]: Get utterance from the session queue ({len(session.current_state.utterance_queue) - 1} remaining"
+                "[REQUEST]: Get utterance from the session queue ({} remaining",
+                len(session.current_state.utterance_queue) - 1,
             )
             queue_elem = session.current_state.utterance_queue.pop_from_head()
             session.current_turn.speech = SimBotUserSpeech.update_user_utterance(
@@ -160,9 +213,11 @@ class SimBotController:
         session.current_turn.intent.physical_interaction = agent_intents[0]
         session.current_turn.intent.verbal_interaction = agent_intents[1]
 
-        logger.info(f"[INTENT] Interaction: `{session.current_turn.intent.physical_interaction}`")
         logger.info(
-            f"[INTENT] Language Condition: `{session.current_turn.intent.verbal_interaction}`"
+            "[INTENT] Interaction: `{}`", session.current_turn.intent.physical_interaction
+        )
+        logger.info(
+            "[INTENT] Language Condition: `{}`", session.current_turn.intent.verbal_interaction
         )
         return session
 
@@ -182,7 +237,7 @@ class SimBotController:
                 session
             )
 
-        logger.info(f"[ACTION] Interaction: `{session.current_turn.actions.interaction}`")
+        logger.info("[ACTION] Interaction: `{}`", session.current_turn.actions.interaction)
         return session
 
     def _upload_session_turn_to_database(self, session: SimBotSession) -> None:
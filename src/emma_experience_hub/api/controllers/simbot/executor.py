@@ -0,0 +1,65 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, TypeVar
+
+from emma_experience_hub.api.observability.metrics import metrics
+
+
+T = TypeVar("T")
+
+
+class SimBotIOExecutor(Executor):
+    """Shared thread pool for I/O-bound work, such as loading features from the cache.
+
+    The pool is created once by the controller, instead of for every request. Submitting blocks
+    once too many tasks are waiting to run, and the number of waiting tasks is recorded as a gauge.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 32) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="io")
+        self._slots = BoundedSemaphore(max_workers + max_queue_size)
+
+        self._queue_depth = 0
+        self._queue_depth_lock = Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Get the number of tasks which are waiting to run."""
+        return self._queue_depth
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+        """Submit the task, waiting for a free slot if too many tasks are already queued."""
+        self._slots.acquire()
+        self._update_queue_depth(1)
+
+        try:
+            future = self._executor.submit(self._run, fn, *args, **kwargs)
+        except Exception as submit_err:
+            self._update_queue_depth(-1)
+            self._slots.release()
+            raise submit_err
+
+        future.add_done_callback(self._release_slot)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the threads once all the tasks have finished."""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run the task, now that it has left the queue."""
+        self._update_queue_depth(-1)
+        return fn(*args, **kwargs)
+
+    def _release_slot(self, future: "Future[Any]") -> None:
+        """Let another task be submitted, now that this one is done."""
+        # Cancelled tasks never leave the queue by running
+        if future.cancelled():
+            self._update_queue_depth(-1)
+        self._slots.release()
+
+    def _update_queue_depth(self, change: int) -> None:
+        """Update the number of tasks waiting to run."""
+        with self._queue_depth_lock:
+            self._queue_depth += change
+            metrics.set_gauge("io_executor_queue_depth", self._queue_depth)
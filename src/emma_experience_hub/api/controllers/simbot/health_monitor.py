@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Event, Thread
+from time import perf_counter
+from typing import Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+from emma_experience_hub.api.clients import Client
+from emma_experience_hub.api.controllers.simbot.clients import SimBotControllerClients
+from emma_experience_hub.api.observability import metrics
+
+
+class SimBotClientHealth(BaseModel):
+    """Result of the most recent healthcheck for a client."""
+
+    is_healthy: bool = False
+    latency: Optional[float] = None
+    last_checked: Optional[datetime] = None
+
+
+class SimBotHealthMonitor:
+    """Check the health of every client in the background.
+
+    All the clients are checked concurrently on an interval, and the results are cached so that the
+    healthcheck endpoints can answer without making any requests.
+    """
+
+    def __init__(self, clients: SimBotControllerClients, interval: float = 5) -> None:
+        self._clients: dict[str, Client] = dict(clients)
+        self._interval = interval
+
+        self._health: dict[str, SimBotClientHealth] = {
+            client_name: SimBotClientHealth() for client_name in self._clients
+        }
+
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._clients), thread_name_prefix="healthcheck"
+        )
+
+    @property
+    def is_healthy(self) -> bool:
+        """Were all the clients healthy when they were last checked?"""
+        return all(client_health.is_healthy for client_health in self._health.values())
+
+    @property
+    def health(self) -> dict[str, SimBotClientHealth]:
+        """Get the most recent health of each client."""
+        return dict(self._health)
+
+    def start(self) -> None:
+        """Start checking the clients in the background."""
+        if self._thread is not None:
+            return
+
+        self._thread = Thread(target=self._run, name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking the clients."""
+        self._stop.set()
+        self._executor.shutdown(wait=False)
+
+    def refresh(self) -> bool:
+        """Check every client now, and return whether they are all healthy."""
+        health_per_client = self._executor.map(self._check_client, self._clients.items())
+        self._health = dict(zip(self._clients.keys(), health_per_client))
+
+        metrics.set_gauge("clients_healthy", int(self.is_healthy))
+        return self.is_healthy
+
+    def _run(self) -> None:
+        """Keep checking the clients until the monitor is stopped."""
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Unable to check the health of the clients")
+
+            self._stop.wait(self._interval)
+
+    def _check_client(self, named_client: tuple[str, Client]) -> SimBotClientHealth:
+        """Check the health of a single client."""
+        client_name, client = named_client
+        start_time = perf_counter()
+
+        try:
+            is_healthy = client.healthcheck()
+        except Exception:
+            logger.warning(f"Healthcheck for client `{client_name}` raised an error")
+            is_healthy = False
+
+        latency = perf_counter() - start_time
+        metrics.observe(f"healthcheck_seconds:{client_name}", latency)
+
+        if not is_healthy:
+            logger.error(f"Client `{client_name}` is not healthy")
+
+        return SimBotClientHealth(
+            is_healthy=is_healthy, latency=latency, last_checked=datetime.now()
+        )
@@ -1,7 +1,11 @@
+from concurrent.futures import Executor
+from typing import Optional
+
 from pydantic import BaseModel
 
 from emma_experience_hub.api.controllers.simbot.clients import SimBotControllerClients
 from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.functions.simbot import CRIntentCache
 from emma_experience_hub.parsers.simbot import (
     SimBotActionPredictorOutputParser,
     SimBotCROutputParser,
@@ -28,10 +32,14 @@ class SimBotControllerPipelines(BaseModel, arbitrary_types_allowed=True):
     agent_intent_selector: SimBotAgentIntentSelectionPipeline
     agent_action_generator: SimBotAgentActionGenerationPipeline
     find_object: SimBotFindObjectPipeline
+    cr_intent_cache: Optional[CRIntentCache] = None
 
     @classmethod
     def from_clients(
-        cls, clients: SimBotControllerClients, simbot_settings: SimBotSettings
+        cls,
+        clients: SimBotControllerClients,
+        simbot_settings: SimBotSettings,
+        executor: Optional[Executor] = None,
     ) -> "SimBotControllerPipelines":
         """Create the pipelines from the clients."""
         find_object = SimBotFindObjectPipeline.from_planner_type(
@@ -43,8 +51,29 @@ class SimBotControllerPipelines(BaseModel, arbitrary_types_allowed=True):
             gfh_location_type=simbot_settings.feature_flags.gfh_location_type,
             _enable_scanning_found_object=simbot_settings.feature_flags.enable_scanning_during_search,
             scan_area_threshold=simbot_settings.feature_arguments.scan_area_threshold,
+            enable_batched_grounding=simbot_settings.feature_flags.enable_batched_search_grounding,
+            enable_cross_room_grab_from_history=(
+                simbot_settings.feature_flags.enable_cross_room_grab_from_history
+            ),
+        )
+        agent_action_generator = SimBotAgentActionGenerationPipeline(
+            features_client=clients.features,
+            action_predictor_client=clients.action_predictor,
+            action_predictor_response_parser=SimBotActionPredictorOutputParser(),
+            previous_action_parser=SimBotPreviousActionParser(),
+            find_object_pipeline=find_object,
+            executor=executor,
+            enable_speculative_prediction=(
+                simbot_settings.feature_flags.enable_speculative_action_prediction
+            ),
         )
-        action_predictor_response_parser = SimBotActionPredictorOutputParser()
+        cr_intent_cache = None
+        if simbot_settings.feature_flags.enable_cr_intent_cache:
+            cr_intent_cache = CRIntentCache(
+                max_size=simbot_settings.cr_intent_cache_max_size,
+                ttl=simbot_settings.cr_intent_cache_ttl,
+            )
+
         return cls(
             find_object=find_object,
             request_processing=SimBotRequestProcessingPipeline(
@@ -64,12 +93,9 @@ class SimBotControllerPipelines(BaseModel, arbitrary_types_allowed=True):
                 _enable_search_actions=simbot_settings.feature_flags.enable_search_actions,
                 _enable_search_after_no_match=simbot_settings.feature_flags.enable_search_after_no_match,
                 _enable_search_after_missing_inventory=simbot_settings.feature_flags.enable_search_after_missing_inventory,
+                speculate_action_fn=agent_action_generator.speculate_action,
+                cr_intent_cache=cr_intent_cache,
             ),
-            agent_action_generator=SimBotAgentActionGenerationPipeline(
-                features_client=clients.features,
-                action_predictor_client=clients.action_predictor,
-                action_predictor_response_parser=action_predictor_response_parser,
-                previous_action_parser=SimBotPreviousActionParser(),
-                find_object_pipeline=find_object,
-            ),
+            agent_action_generator=agent_action_generator,
+            cr_intent_cache=cr_intent_cache,
         )
@@ -0,0 +1,107 @@
+import fcntl
+import hashlib
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import TextIO
+
+from loguru import logger
+
+from emma_experience_hub.api.observability.metrics import metrics
+
+
+class SimBotSessionLock:
+    """Serialise the requests for each session, across threads and worker processes.
+
+    Each turn is built from the history of the session, so two requests for the same session must
+    never be handled at the same time. An in-process lock keeps threads within a worker from
+    interleaving, and an advisory file lock keeps other workers out. Requests for different
+    sessions never wait on each other.
+
+    Acquiring the lock blocks the calling thread, so it must not be called from the event loop.
+    The lock file is removed when the lock is released, so that the lock directory does not grow
+    with every session.
+    """
+
+    def __init__(self, lock_dir: Path) -> None:
+        self._lock_dir = lock_dir
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+
+        self._guard = Lock()
+        self._thread_locks: dict[str, Lock] = {}
+        self._thread_lock_users: dict[str, int] = {}
+
+    @contextmanager
+    def acquire(self, session_id: str) -> Iterator[None]:
+        """Hold the lock for the session until the context exits."""
+        start_time = perf_counter()
+        thread_lock = self._checkout_thread_lock(session_id)
+
+        lock_path = self._create_lock_path(session_id)
+
+        try:
+            with thread_lock, self._lock_file(lock_path) as lock_file:
+                wait_time = perf_counter() - start_time
+                metrics.observe("session_lock_wait_seconds", wait_time)
+                logger.debug("Acquired lock for session after {:.3f} seconds", wait_time)
+
+                try:
+                    yield
+                finally:
+                    # Remove the file before unlocking it, so nobody else can lock it afterwards
+                    lock_path.unlink(missing_ok=True)
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            self._return_thread_lock(session_id)
+
+    def _lock_file(self, lock_path: Path) -> TextIO:
+        """Open and lock the file, waiting for any other worker which holds it.
+
+        If the worker which held the lock removed the file while this one was waiting, the lock is
+        on a file which no longer exists, so try again with the new file.
+        """
+        while True:
+            lock_file = lock_path.open("a")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            if self._is_same_file(lock_file, lock_path):
+                return lock_file
+
+            lock_file.close()
+
+    def _is_same_file(self, lock_file: TextIO, lock_path: Path) -> bool:
+        """Is the open file still the file at the path?"""
+        try:
+            path_stat = lock_path.stat()
+        except FileNotFoundError:
+            return False
+
+        file_stat = os.fstat(lock_file.fileno())
+        return (file_stat.st_dev, file_stat.st_ino) == (path_stat.st_dev, path_stat.st_ino)
+
+    def _checkout_thread_lock(self, session_id: str) -> Lock:
+        """Get the in-process lock for the session, creating it if needed."""
+        with self._guard:
+            thread_lock = self._thread_locks.setdefault(session_id, Lock())
+            self._thread_lock_users[session_id] = self._thread_lock_users.get(session_id, 0) + 1
+        return thread_lock
+
+    def _return_thread_lock(self, session_id: str) -> None:
+        """Forget the in-process lock for the session once nothing is using it."""
+        with self._guard:
+            self._thread_lock_users[session_id] -= 1
+
+            if not self._thread_lock_users[session_id]:
+                self._thread_lock_users.pop(session_id)
+                self._thread_locks.pop(session_id)
+
+    def _create_lock_path(self, session_id: str) -> Path:
+        """Build the path to the lock file for the session.
+
+        Session IDs are hashed so that they are always safe to use as file names.
+        """
+        session_hash = hashlib.sha1(session_id.encode(), usedforsecurity=False).hexdigest()
+        return self._lock_dir.joinpath(f"{session_hash}.lock")
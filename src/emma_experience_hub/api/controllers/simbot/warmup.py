@@ -0,0 +1,98 @@
+import uuid
+from base64 import b64encode
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any
+
+from loguru import logger
+from PIL import Image
+
+from emma_experience_hub.api.controllers.simbot.controller import SimBotController
+from emma_experience_hub.api.observability import metrics
+from emma_experience_hub.constants.simbot import get_warmup_session_template
+from emma_experience_hub.datamodels.simbot import SimBotRequest
+
+
+WARMUP_IMAGE_SIZE = (300, 300)
+
+WARMUP_METADATA_URI = "efs://warmup/metadata.json"
+
+
+def _create_encoded_image() -> str:
+    """Create a blank image, encoded the same way as the images from the arena."""
+    image_buffer = BytesIO()
+    Image.new("RGB", WARMUP_IMAGE_SIZE).save(image_buffer, format="PNG")
+    return b64encode(image_buffer.getvalue()).decode("utf-8")
+
+
+def _create_warmup_metadata(session_template: dict[str, Any]) -> dict[str, Any]:
+    """Create the auxiliary metadata for the synthetic session.
+
+    The metadata is included within the request, so that it is never read from or written to the
+    auxiliary metadata directory.
+    """
+    encoded_image = _create_encoded_image()
+    return {
+        "uri": WARMUP_METADATA_URI,
+        "colorImages": {"0": encoded_image},
+        "depthImages": {"0": encoded_image},
+        "robotInfo": session_template["robotInfo"],
+        "viewPoints": session_template["viewPoints"],
+    }
+
+
+def _create_warmup_request(utterance: str, metadata: dict[str, Any]) -> SimBotRequest:
+    """Create a request from the arena for a new session which starts with the utterance."""
+    return SimBotRequest.parse_obj(
+        {
+            "header": {
+                "sessionId": f"warmup-{uuid.uuid4()}",
+                "predictionRequestId": str(uuid.uuid4()),
+            },
+            "request": {
+                "sensors": [
+                    {
+                        "type": "SpeechRecognition",
+                        "recognition": {
+                            "tokens": [
+                                {"value": token, "confidence": {"score": 1, "bin": "HIGH"}}
+                                for token in utterance.split(" ")
+                            ]
+                        },
+                    },
+                    {"type": "GameMetaData", "metaData": metadata},
+                ],
+                "previousActions": [],
+            },
+        }
+    )
+
+
+def warm_up_controller(controller: SimBotController) -> None:
+    """Replay a synthetic session through the controller, without persisting anything.
+
+    This pays for everything that is otherwise lazily initialised by the first request: compiling
+    the models, loading the constants, connecting to the services, and so on. Everything that the
+    session would persist is kept in a temporary directory, so no other requests must be handled
+    until it has finished. Failures are logged and ignored, since the healthcheck still reports
+    whether the services are available.
+    """
+    start_time = perf_counter()
+    session_template = get_warmup_session_template()
+    metadata = _create_warmup_metadata(session_template)
+
+    with TemporaryDirectory(prefix="simbot-warmup-") as storage_dir:
+        with controller.clients.use_temporary_storage(Path(storage_dir)):
+            for utterance in session_template["utterances"]:
+                try:
+                    controller.handle_request_from_simbot_arena(
+                        _create_warmup_request(utterance, metadata)
+                    )
+                except Exception:
+                    logger.exception(f"Unable to warm up the controller with `{utterance}`")
+
+    warmup_time = perf_counter() - start_time
+    metrics.observe("startup_warmup_seconds", warmup_time)
+    logger.info(f"Finished warming up the controller in {warmup_time:.2f} seconds")
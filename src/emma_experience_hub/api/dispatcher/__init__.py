@@ -0,0 +1,2 @@
+from emma_experience_hub.api.dispatcher.hash_ring import ConsistentHashRing
+from emma_experience_hub.api.dispatcher.worker_pool import SimBotWorkerPool
@@ -0,0 +1,153 @@
+import asyncio
+from contextlib import suppress
+from typing import Any, Literal, Optional
+
+import httpx
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from loguru import logger
+
+from emma_experience_hub.api.dispatcher.hash_ring import ConsistentHashRing
+from emma_experience_hub.api.observability import metrics
+from emma_experience_hub.common.settings import SimBotSettings
+
+
+app = FastAPI(title="SimBot Challenge Session Dispatcher")
+
+
+state: dict[Literal["settings", "ring", "client", "monitor"], Any] = {}
+
+
+def get_backend_urls(simbot_settings: SimBotSettings) -> list[str]:
+    """Get the URL for every backend server."""
+    return [
+        f"{simbot_settings.scheme}://127.0.0.1:{port}"
+        for port in simbot_settings.dispatcher_backend_ports
+    ]
+
+
+async def is_backend_alive(client: httpx.AsyncClient, backend_url: str) -> bool:
+    """Check whether the backend server is accepting requests."""
+    try:
+        backend_response = await client.get(f"{backend_url}/metrics", timeout=2)
+    except httpx.HTTPError:
+        return False
+
+    return backend_response.status_code == status.HTTP_200_OK
+
+
+async def monitor_backends(
+    client: httpx.AsyncClient, ring: ConsistentHashRing, simbot_settings: SimBotSettings
+) -> None:
+    """Keep only the backends that are alive on the ring.
+
+    Backends that stop responding are removed, and they are added back when they come back up.
+    """
+    backend_urls = get_backend_urls(simbot_settings)
+
+    while True:  # noqa: WPS457
+        is_alive_per_backend = await asyncio.gather(
+            *(is_backend_alive(client, backend_url) for backend_url in backend_urls)
+        )
+        for backend_url, is_alive in zip(backend_urls, is_alive_per_backend):
+            if is_alive and backend_url not in ring:
+                logger.info(f"Adding backend `{backend_url}` to the ring")
+                ring.add(backend_url)
+            if not is_alive and backend_url in ring:
+                logger.warning(f"Removing backend `{backend_url}` from the ring")
+                ring.remove(backend_url)
+
+        metrics.set_gauge("dispatcher_backends_alive", len(ring))
+        await asyncio.sleep(simbot_settings.dispatcher_healthcheck_interval)
+
+
+@app.on_event("startup")
+async def startup_event() -> None:
+    """Handle the startup of the dispatcher."""
+    simbot_settings = SimBotSettings.from_env()
+
+    state["settings"] = simbot_settings
+    state["ring"] = ConsistentHashRing()
+    state["client"] = httpx.AsyncClient(timeout=None)
+    state["monitor"] = asyncio.create_task(
+        monitor_backends(state["client"], state["ring"], simbot_settings)
+    )
+
+    logger.info("Dispatcher for the SimBot Arena is ready.")
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop monitoring the backends and close all the connections."""
+    state["monitor"].cancel()
+    with suppress(asyncio.CancelledError):
+        await state["monitor"]
+
+    await state["client"].aclose()
+
+
+def get_session_id(raw_body: bytes) -> Optional[str]:
+    """Get the session ID from the body of the request, if it has one."""
+    try:
+        return orjson.loads(raw_body)["header"]["sessionId"]
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+async def forward_request(backend_url: str, request: Request, raw_body: bytes) -> Response:
+    """Forward the request to the backend and return its response."""
+    backend_response = await state["client"].request(
+        request.method,
+        f"{backend_url}{request.url.path}",
+        content=raw_body,
+        headers={"content-type": request.headers.get("content-type", "application/json")},
+    )
+    return Response(
+        content=backend_response.content,
+        status_code=backend_response.status_code,
+        media_type=backend_response.headers.get("content-type"),
+    )
+
+
+@app.get("/ping")
+@app.get("/healthcheck")
+async def healthcheck(request: Request) -> Response:
+    """Perform a healthcheck on any backend that is alive."""
+    ring: ConsistentHashRing = state["ring"]
+
+    for backend_url in ring.nodes:
+        with suppress(httpx.HTTPError):
+            return await forward_request(backend_url, request, b"")
+
+    return Response(content="failed", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@app.post("/v1/predict")
+async def handle_request_from_simbot_arena(request: Request) -> Response:
+    """Send the request to the backend which owns the session."""
+    raw_body = await request.body()
+    session_id = get_session_id(raw_body) or ""
+    ring: ConsistentHashRing = state["ring"]
+
+    # If the backend that owns the session has died, remove it and try the next owner.
+    while (backend_url := ring.get_node(session_id)) is not None:
+        try:
+            backend_response = await forward_request(backend_url, request, raw_body)
+        except httpx.TransportError:
+            logger.exception(f"Unable to reach backend `{backend_url}`")
+            ring.remove(backend_url)
+            continue
+
+        metrics.increment(f"dispatcher_requests_routed:{backend_url}")
+        return backend_response
+
+    logger.error("There are no backends available to handle the request")
+    return Response(
+        content="No backends available", status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+@app.get("/metrics", status_code=status.HTTP_200_OK)
+async def get_metrics() -> dict[str, Any]:
+    """Get the metrics recorded by the dispatcher."""
+    return metrics.snapshot()
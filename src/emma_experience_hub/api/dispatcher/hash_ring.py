@@ -0,0 +1,79 @@
+import bisect
+import hashlib
+from collections.abc import Iterable
+from threading import Lock
+from typing import Optional
+
+
+def _hash_key(key: str) -> int:
+    """Hash the key onto the ring."""
+    return int(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()[:16], 16)
+
+
+class ConsistentHashRing:
+    """Consistent hash ring which maps keys to nodes.
+
+    Each node is placed on the ring many times to spread the keys evenly. Adding or removing a node
+    only moves the keys that belong to that node, so every other key stays where it was.
+    """
+
+    def __init__(self, nodes: Optional[Iterable[str]] = None, replicas: int = 128) -> None:
+        self._replicas = replicas
+        self._lock = Lock()
+
+        self._nodes: set[str] = set()
+        self._ring_hashes: list[int] = []
+        self._ring_nodes: list[str] = []
+
+        for node in nodes or []:
+            self.add(node)
+
+    def __contains__(self, node: str) -> bool:
+        """Is the node on the ring?"""
+        return node in self._nodes
+
+    def __len__(self) -> int:
+        """Get the number of nodes on the ring."""
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> list[str]:
+        """Get all the nodes on the ring."""
+        return sorted(self._nodes)
+
+    def add(self, node: str) -> None:
+        """Add the node to the ring, if it is not already on it."""
+        with self._lock:
+            if node in self._nodes:
+                return
+
+            self._nodes.add(node)
+            for replica_idx in range(self._replicas):
+                node_hash = _hash_key(f"{node}#{replica_idx}")
+                insert_idx = bisect.bisect(self._ring_hashes, node_hash)
+                self._ring_hashes.insert(insert_idx, node_hash)
+                self._ring_nodes.insert(insert_idx, node)
+
+    def remove(self, node: str) -> None:
+        """Remove the node from the ring, if it is on it."""
+        with self._lock:
+            if node not in self._nodes:
+                return
+
+            self._nodes.remove(node)
+            remaining = [
+                (node_hash, ring_node)
+                for node_hash, ring_node in zip(self._ring_hashes, self._ring_nodes)
+                if ring_node != node
+            ]
+            self._ring_hashes = [node_hash for node_hash, _ in remaining]
+            self._ring_nodes = [ring_node for _, ring_node in remaining]
+
+    def get_node(self, key: str) -> Optional[str]:
+        """Get the node that the key belongs to, or None if the ring is empty."""
+        with self._lock:
+            if not self._ring_hashes:
+                return None
+
+            ring_idx = bisect.bisect(self._ring_hashes, _hash_key(key)) % len(self._ring_hashes)
+            return self._ring_nodes[ring_idx]
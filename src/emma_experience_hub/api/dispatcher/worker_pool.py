@@ -0,0 +1,72 @@
+import signal
+from multiprocessing import Process
+from time import sleep
+from types import FrameType
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+class SimBotWorkerPool:
+    """Run and supervise a set of server processes.
+
+    Every process is restarted if it exits, until the pool is stopped. Processes are started from
+    a separate supervisor process --- rather than from within a server --- so that each one can be
+    tracked and reaped independently.
+    """
+
+    def __init__(self, poll_interval: float = 1) -> None:
+        self._poll_interval = poll_interval
+        self._targets: dict[str, tuple[Callable[..., None], tuple[Any, ...]]] = {}
+        self._processes: dict[str, Process] = {}
+        self._is_running = False
+
+    def add(self, name: str, target: Callable[..., None], *args: Any) -> None:
+        """Add a new process to the pool."""
+        self._targets[name] = (target, args)
+
+    def run(self) -> None:
+        """Start all the processes and keep them running until the pool is stopped."""
+        self._is_running = True
+        signal.signal(signal.SIGINT, self._handle_exit_signal)
+        signal.signal(signal.SIGTERM, self._handle_exit_signal)
+
+        for name in self._targets:
+            self._start_process(name)
+
+        try:
+            while self._is_running:
+                self._restart_exited_processes()
+                sleep(self._poll_interval)
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop all the processes in the pool."""
+        self._is_running = False
+
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        for process in self._processes.values():
+            process.join()
+
+    def _start_process(self, name: str) -> None:
+        """Start the process with the given name."""
+        target, args = self._targets[name]
+        process = Process(target=target, args=args, name=name, daemon=False)
+        process.start()
+        self._processes[name] = process
+        logger.info(f"Started `{name}` (pid {process.pid})")
+
+    def _restart_exited_processes(self) -> None:
+        """Restart any process that has exited."""
+        for name, process in list(self._processes.items()):
+            if self._is_running and not process.is_alive():
+                logger.warning(f"`{name}` exited with code {process.exitcode}; restarting it")
+                self._start_process(name)
+
+    def _handle_exit_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        """Stop the pool on the next poll."""
+        self._is_running = False
@@ -1 +1,6 @@
-from emma_experience_hub.api.observability.logging import create_logger_context
+from emma_experience_hub.api.observability.logging import (
+    create_logger_context,
+    setup_enqueued_logging,
+    truncate_for_logging,
+)
+from emma_experience_hub.api.observability.metrics import MetricsRegistry, metrics
@@ -1,13 +1,64 @@
 from __future__ import annotations
 
+import logging
+from typing import Union
+
 import loguru
+from rich.logging import RichHandler
 
+from emma_experience_hub.common.settings import Settings
 from emma_experience_hub.datamodels.simbot import SimBotRequest
 
 
+MAX_LOGGED_BODY_LENGTH = 2000
+
+
 def create_logger_context(request: SimBotRequest) -> loguru.Contextualizer:
     """Contextualise the logger for the current request."""
     return loguru.logger.contextualize(
         session_id=request.header.session_id,
         prediction_request_id=request.header.prediction_request_id,
     )
+
+
+def truncate_for_logging(body: str, max_length: int = MAX_LOGGED_BODY_LENGTH) -> str:
+    """Cap the length of a body before it is logged, noting how much of it was left out."""
+    if len(body) <= max_length:
+        return body
+
+    return f"{body[:max_length]}... ({len(body) - max_length} more characters)"
+
+
+class InterceptHandler(logging.Handler):
+    """Send the records from the standard `logging` module to loguru."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Log the record with loguru, from where it was originally logged."""
+        try:
+            level: Union[str, int] = loguru.logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        # Find the caller from outside the logging module
+        frame, depth = logging.currentframe(), 2
+        while frame is not None and frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
+
+        loguru.logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+def setup_enqueued_logging() -> None:
+    """Write the logs from a background thread, so that requests never wait on the log output.
+
+    Messages below the level from the settings are dropped before they are formatted. Any logs
+    from the standard `logging` module are also sent through loguru.
+    """
+    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    loguru.logger.remove()
+    loguru.logger.add(
+        RichHandler(markup=False, rich_tracebacks=True, tracebacks_show_locals=False),
+        level=Settings.from_env().log_level.upper(),
+        format="{message}",
+        enqueue=True,
+    )
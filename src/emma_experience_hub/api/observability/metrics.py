@@ -0,0 +1,70 @@
+from threading import Lock
+from typing import Any
+
+
+class TimingMetric:
+    """Summary statistics for a timed operation."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, duration: float) -> None:
+        """Record a new observation."""
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def as_dict(self) -> dict[str, float]:
+        """Convert the statistics to a dictionary."""
+        mean = self.total / self.count if self.count else 0
+        return {"count": self.count, "total": self.total, "mean": mean, "max": self.max}
+
+
+class MetricsRegistry:
+    """In-process registry of counters, gauges and timings.
+
+    Each worker keeps its own registry, which is exposed through the `/metrics` endpoint of the
+    API.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, TimingMetric] = {}
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:  # noqa: WPS110
+        """Set the current value of a gauge."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, duration: float) -> None:
+        """Record the duration of an operation, in seconds."""
+        with self._lock:
+            self._timings.setdefault(name, TimingMetric()).observe(duration)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the current value of every metric."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": {name: timing.as_dict() for name, timing in self._timings.items()},
+            }
+
+    def reset(self) -> None:
+        """Remove all the recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,107 @@
+from typing import Any, Callable, Optional
+
+import httpx
+import orjson
+from fastapi import FastAPI, Request, Response, status
+
+from emma_common.datamodels import EmmaPolicyRequest, TorchDataMixin
+from emma_experience_hub.api.clients.policy_framing import (
+    FRAMED_POLICY_REQUEST_CONTENT_TYPE,
+    decode_framed_policy_request,
+)
+from emma_experience_hub.api.clients.policy_references import (
+    FEATURE_REFERENCES_CONTENT_TYPE,
+    FeatureReferenceCache,
+    MissingFeaturesError,
+)
+from emma_experience_hub.api.clients.shared_memory import SharedFeatureReader
+from emma_experience_hub.constants.model import END_OF_TRAJECTORY_TOKEN, MODEL_EOS_TOKEN
+
+
+def _generate_stop_action(request: EmmaPolicyRequest) -> str:
+    """Always predict the agent should stop."""
+    return f"{END_OF_TRAJECTORY_TOKEN} {MODEL_EOS_TOKEN}"
+
+
+class PolicyStandIn:
+    """Stand-in for a policy server, which understands every request format the clients send.
+
+    It keeps the server-side cache of features for requests that refer to features by their hash,
+    and reads any features handed over through shared memory, so that the protocols can be tested
+    without the policy service.
+    """
+
+    def __init__(
+        self,
+        generate_fn: Callable[[EmmaPolicyRequest], Any] = _generate_stop_action,
+        max_features: int = 4096,
+    ) -> None:
+        self.feature_cache = FeatureReferenceCache(
+            max_features, shared_reader=SharedFeatureReader()
+        )
+        self.received_requests: list[EmmaPolicyRequest] = []
+        self.received_bytes: list[int] = []
+
+        self._generate_fn = generate_fn
+
+    def handle(self, body: bytes, content_type: Optional[str]) -> tuple[int, Any]:
+        """Respond to a request, with the status code and the JSON content of the response."""
+        self.received_bytes.append(len(body))
+
+        try:
+            policy_request = self.decode(body, content_type)
+        except MissingFeaturesError as missing_err:
+            return status.HTTP_409_CONFLICT, {"missing": missing_err.missing_digests}
+
+        self.received_requests.append(policy_request)
+        return status.HTTP_200_OK, self._generate_fn(policy_request)
+
+    def decode(self, body: bytes, content_type: Optional[str]) -> EmmaPolicyRequest:
+        """Decode the request, using the content type to know how it was encoded."""
+        if content_type == FEATURE_REFERENCES_CONTENT_TYPE:
+            return self.feature_cache.decode(body)
+
+        if content_type == FRAMED_POLICY_REQUEST_CONTENT_TYPE:
+            return decode_framed_policy_request(body)
+
+        return TorchDataMixin.get_object(body)
+
+    def as_transport(self) -> httpx.MockTransport:
+        """Handle the requests from a client in-process, without running a server."""
+
+        def handle_request(request: httpx.Request) -> httpx.Response:  # noqa: WPS430
+            if request.url.path.endswith("/ping"):
+                return httpx.Response(status.HTTP_200_OK)
+
+            status_code, response_content = self.handle(
+                request.read(), request.headers.get("content-type")
+            )
+            return httpx.Response(status_code, content=orjson.dumps(response_content))
+
+        return httpx.MockTransport(handle_request)
+
+
+def create_policy_stand_in_app(stand_in: Optional[PolicyStandIn] = None) -> FastAPI:
+    """Create an API which runs the stand-in as a local policy server."""
+    policy_stand_in = stand_in if stand_in is not None else PolicyStandIn()
+    app = FastAPI(title="EMMA Policy Stand-In")
+
+    @app.get("/ping", status_code=status.HTTP_200_OK)
+    async def healthcheck() -> str:  # noqa: WPS430
+        """Report that the stand-in is healthy."""
+        return "success"
+
+    @app.post("/generate")
+    @app.post("/generate_find")
+    async def generate(request: Request) -> Response:  # noqa: WPS430
+        """Generate a response for the policy request."""
+        status_code, response_content = policy_stand_in.handle(
+            await request.body(), request.headers.get("content-type")
+        )
+        return Response(
+            content=orjson.dumps(response_content),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    return app
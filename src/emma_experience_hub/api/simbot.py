@@ -1,11 +1,19 @@
-from typing import Literal
+from threading import Event, Thread
+from typing import Any, Literal
 
+import orjson
 from fastapi import BackgroundTasks, FastAPI, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 
 from emma_experience_hub.api.controllers import SimBotController
-from emma_experience_hub.api.observability import create_logger_context
-from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.api.controllers.simbot.warmup import warm_up_controller
+from emma_experience_hub.api.observability import (
+    create_logger_context,
+    metrics,
+    truncate_for_logging,
+)
+from emma_experience_hub.common.settings import get_simbot_settings
 from emma_experience_hub.datamodels.simbot import SimBotRequest, SimBotResponse
 
 
@@ -14,44 +22,100 @@ app = FastAPI(title="SimBot Challenge Inference")
 
 state: dict[Literal["controller"], SimBotController] = {}
 
+is_warmed_up = Event()
+
+
+def _warm_up_controller(controller: SimBotController) -> None:
+    """Warm up the controller, and then allow the API to report as healthy."""
+    try:
+        warm_up_controller(controller)
+    finally:
+        is_warmed_up.set()
+
 
 @app.on_event("startup")
 async def startup_event() -> None:
-    """Handle the startup of the API."""
-    simbot_settings = SimBotSettings.from_env()
+    """Handle the startup of the API.
+
+    If the warm-up is enabled, the healthcheck responds with a 503 until it has finished, and any
+    requests that are received in the meantime wait for it.
+    """
+    simbot_settings = get_simbot_settings()
 
     state["controller"] = SimBotController.from_simbot_settings(simbot_settings)
+    state["controller"].health_monitor.start()
+
+    if simbot_settings.feature_flags.enable_startup_warmup:
+        Thread(target=_warm_up_controller, args=(state["controller"],), daemon=True).start()
+    else:
+        is_warmed_up.set()
 
     logger.info("API for the SimBot Arena is ready.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop checking the health of the clients, and release the shared resources."""
+    state["controller"].health_monitor.stop()
+    if state["controller"].executor is not None:
+        state["controller"].executor.shutdown(wait=False)
+    state["controller"].pipelines.agent_action_generator.shutdown()
+    if state["controller"].shared_feature_arena is not None:
+        state["controller"].shared_feature_arena.close()
+
+
 @app.get("/ping", status_code=status.HTTP_200_OK)
 @app.get("/healthcheck", status_code=status.HTTP_200_OK)
 async def healthcheck(response: Response) -> str:
-    """Perform a healthcheck across all the clients."""
-    try:
-        healthcheck_result = state["controller"].healthcheck()
-    except Exception:
-        logger.exception("The API is not currently healthy")
-        healthcheck_result = False
+    """Report the health of all the clients, as of when they were last checked."""
+    if not is_warmed_up.is_set():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return "warming up"
 
-    if not healthcheck_result:
+    if not state["controller"].is_healthy:
         response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         return "failed"
 
     return "success"
 
 
-@app.post("/v1/predict")
+@app.get("/healthcheck/details", status_code=status.HTTP_200_OK)
+async def healthcheck_details() -> dict[str, Any]:
+    """Report the health and latency of each client, as of when they were last checked."""
+    return {
+        client_name: client_health.dict()
+        for client_name, client_health in state["controller"].health_monitor.health.items()
+    }
+
+
+@app.get("/metrics", status_code=status.HTTP_200_OK)
+async def get_metrics() -> dict[str, Any]:
+    """Get the metrics recorded by this worker.
+
+    If the CR intent cache is enabled, this includes the utterances which have hit it the most.
+    """
+    worker_metrics = metrics.snapshot()
+    cr_intent_cache = state["controller"].pipelines.cr_intent_cache
+    if cr_intent_cache is not None:
+        worker_metrics["cr_intent_cache_most_used_utterances"] = dict(
+            cr_intent_cache.get_most_used_utterances()
+        )
+    return worker_metrics
+
+
+@app.post("/v1/predict", response_model=SimBotResponse)
 async def handle_request_from_simbot_arena(
     request: Request, response: Response, background_tasks: BackgroundTasks
-) -> SimBotResponse:
-    """Handle a new request from the SimBot API."""
-    raw_request = await request.json()
+) -> Response:
+    """Handle a new request from the SimBot API.
+
+    The response is rendered once, and the same body is both logged and returned.
+    """
+    raw_request_body = await request.body()
 
     # Parse the request from the server
     try:
-        simbot_request = SimBotRequest.parse_obj(raw_request)
+        simbot_request = SimBotRequest.parse_obj(orjson.loads(raw_request_body))
     except Exception as request_err:
         logger.exception("Unable to parse request")
         response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -59,11 +123,21 @@ async def handle_request_from_simbot_arena(
 
     with create_logger_context(simbot_request):
         # Log the incoming request
-        logger.info(f"Received request: {raw_request}")
-
-        # Handle the request
-        simbot_response = state["controller"].handle_request_from_simbot_arena(simbot_request)
+        logger.opt(lazy=True).info(
+            "Received request: {}", lambda: truncate_for_logging(raw_request_body.decode())
+        )
+
+        # Handle the request in a thread, since it waits on the session lock and the models
+        metrics.increment("requests_received")
+        if not is_warmed_up.is_set():
+            await run_in_threadpool(is_warmed_up.wait)
+        simbot_response = await run_in_threadpool(
+            state["controller"].handle_request_from_simbot_arena, simbot_request
+        )
 
         # Return response
-        logger.info(f"Returning the response {simbot_response.json(by_alias=True)}")
-        return simbot_response
+        response_body = simbot_response.to_json_bytes()
+        logger.opt(lazy=True).info(
+            "Returning the response {}", lambda: truncate_for_logging(response_body.decode())
+        )
+        return Response(content=response_body, media_type="application/json")
@@ -1,15 +1,17 @@
+import gc
+import json
 import os
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.syntax import Syntax
 
-from emma_common.api.gunicorn import create_gunicorn_server
-from emma_common.logging import setup_rich_logging
-from emma_experience_hub.api.simbot import app as simbot_api
-from emma_experience_hub.common.settings import SimBotSettings
+
+if TYPE_CHECKING:
+    from emma_experience_hub.common.settings import SimBotSettings
 
 
 SERVICES_COMPOSE_PATH = Path("docker/docker-compose.yaml")
@@ -25,6 +27,59 @@ def build_compose_file_options(*, with_gpu: bool = False) -> str:
     return compose_file_option
 
 
+def preload_read_only_data() -> None:
+    """Load the read-only data in the main process, so that forked workers share it.
+
+    Everything that exists at this point is moved out of the reach of the garbage collector, so
+    that collections within the workers do not write to --- and therefore copy --- those pages.
+    """
+    from emma_experience_hub.constants.simbot import preload_simbot_constants  # noqa: WPS433
+
+    preload_simbot_constants()
+
+    gc.collect()
+    gc.freeze()
+
+
+def run_simbot_api_backend(port: int, timeout: int) -> None:
+    """Run a single-worker server which only accepts requests from the dispatcher."""
+    from emma_common.api.gunicorn import create_gunicorn_server  # noqa: WPS433
+    from emma_experience_hub.api.simbot import app as simbot_api  # noqa: WPS433
+
+    create_gunicorn_server(simbot_api, "127.0.0.1", port, 1, timeout=timeout).run()
+
+
+def run_dispatcher_api(host: str, port: int, timeout: int) -> None:
+    """Run the dispatcher which routes each session to the same backend."""
+    from emma_common.api.gunicorn import create_gunicorn_server  # noqa: WPS433
+    from emma_experience_hub.api.dispatcher.app import app as dispatcher_api  # noqa: WPS433
+
+    create_gunicorn_server(dispatcher_api, host, port, 1, timeout=timeout).run()
+
+
+def run_controller_api_with_session_affinity(
+    simbot_settings: "SimBotSettings", workers: int, timeout: int
+) -> None:
+    """Run a backend server per worker behind a dispatcher.
+
+    Every request for a session is sent to the same backend, so that any caches within the backend
+    are reused across the turns of the session.
+    """
+    from emma_experience_hub.api.dispatcher import SimBotWorkerPool  # noqa: WPS433
+
+    backend_ports = [simbot_settings.port + worker_idx + 1 for worker_idx in range(workers)]
+    os.environ["SIMBOT_DISPATCHER_BACKEND_PORTS"] = json.dumps(backend_ports)
+
+    worker_pool = SimBotWorkerPool()
+    for backend_port in backend_ports:
+        worker_pool.add(f"backend:{backend_port}", run_simbot_api_backend, backend_port, timeout)
+
+    worker_pool.add(
+        "dispatcher", run_dispatcher_api, simbot_settings.host, simbot_settings.port, timeout
+    )
+    worker_pool.run()
+
+
 app = typer.Typer(
     add_completion=False,
     no_args_is_help=True,
@@ -118,15 +173,32 @@ def run_controller_api(
     timeout: int = typer.Option(
         default=100, min=10, help="Set the number of seconds until the timeout."
     ),
+    session_affinity: bool = typer.Option(
+        False,  # noqa: WPS425
+        "--session-affinity",
+        is_flag=True,
+        help="Route every request for a session to the same worker.",
+    ),
 ) -> None:
     """Run the inference server."""
+    from emma_common.api.gunicorn import create_gunicorn_server  # noqa: WPS433
+    from emma_experience_hub.api.observability import setup_enqueued_logging  # noqa: WPS433
+    from emma_experience_hub.api.simbot import app as simbot_api  # noqa: WPS433
+    from emma_experience_hub.common.settings import SimBotSettings  # noqa: WPS433
+
     os.environ["SIMBOT_AUXILIARY_METADATA_DIR"] = str(auxiliary_metadata_dir)
     os.environ["SIMBOT_AUXILIARY_METADATA_CACHE_DIR"] = str(auxiliary_metadata_cache_dir)
     os.environ["SIMBOT_EXTRACTED_FEATURES_CACHE_DIR"] = str(extracted_features_cache_dir)
 
     simbot_settings = SimBotSettings.from_env()
 
-    setup_rich_logging(rich_traceback_show_locals=False)
+    setup_enqueued_logging()
+
+    preload_read_only_data()
+
+    if session_affinity:
+        run_controller_api_with_session_affinity(simbot_settings, workers, timeout)
+        return
 
     server = create_gunicorn_server(
         simbot_api,
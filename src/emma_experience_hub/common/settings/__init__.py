@@ -1,2 +1,2 @@
 from emma_experience_hub.common.settings.settings import Settings
-from emma_experience_hub.common.settings.simbot import SimBotSettings
+from emma_experience_hub.common.settings.simbot import SimBotSettings, get_simbot_settings
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Optional
 
 from pydantic import AnyHttpUrl, BaseModel, BaseSettings, DirectoryPath, root_validator, validator
@@ -18,12 +19,20 @@ class SimBotFeatureFlags(BaseModel):
     enable_offline_evaluation: bool = True
 
     enable_always_highlight_before_object_action: bool = False
+    enable_batched_search_grounding: bool = False
     enable_clarification_questions: bool = True
+    enable_cr_intent_cache: bool = False
+    enable_cross_room_grab_from_history: bool = False
+    enable_framed_policy_requests: bool = False
     enable_grab_from_history: bool = True
+    enable_policy_feature_references: bool = False
     enable_scanning_during_search: bool = True
     enable_search_actions: bool = True
     enable_search_after_missing_inventory: bool = True
     enable_search_after_no_match: bool = True
+    enable_shared_memory_features: bool = False
+    enable_speculative_action_prediction: bool = False
+    enable_startup_warmup: bool = False
 
     search_planner_type: SearchPlannerType = SearchPlannerType.greedy_max_vertex_cover
     gfh_location_type: GFHLocationType = GFHLocationType.location
@@ -54,7 +63,16 @@ class SimBotSettings(BaseSettings):
     port: int = 5000
     scheme: str = "http"
 
+    dispatcher_backend_ports: list[int] = []
+    dispatcher_healthcheck_interval: float = 5
+
     client_timeout: Optional[int] = 5
+    healthcheck_interval: float = 5
+
+    io_executor_max_workers: int = 4
+    io_executor_max_queue_size: int = 32
+
+    shared_features_memory_size: int = 64 * 1024 * 1024
 
     auxiliary_metadata_dir: DirectoryPath
     auxiliary_metadata_cache_dir: DirectoryPath
@@ -63,13 +81,18 @@ class SimBotSettings(BaseSettings):
 
     session_db_memory_table_name: str = "SIMBOT_MEMORY_TABLE"
     session_local_db_file: str = "storage/local_sessions.db"
+    session_lock_dir: str = "storage/session_locks"
 
     feature_extractor_url: AnyHttpUrl = AnyHttpUrl(url=f"{scheme}://0.0.0.0:5500", scheme=scheme)
 
     cr_predictor_url: AnyHttpUrl = AnyHttpUrl(url=f"{scheme}://0.0.0.0:5501", scheme=scheme)
+    cr_predictor_shares_memory: bool = False
     cr_predictor_intent_type_delimiter: str = " "
+    cr_intent_cache_max_size: int = 1024
+    cr_intent_cache_ttl: float = 300
 
     action_predictor_url: AnyHttpUrl = AnyHttpUrl(url=f"{scheme}://0.0.0.0:5502", scheme=scheme)
+    action_predictor_shares_memory: bool = False
 
     placeholder_vision_url: AnyHttpUrl = AnyHttpUrl(url=f"{scheme}://0.0.0.0:5506", scheme=scheme)
 
@@ -99,6 +122,12 @@ class SimBotSettings(BaseSettings):
         return not self.feature_flags.enable_offline_evaluation
 
 
+@lru_cache(maxsize=1)
+def get_simbot_settings() -> SimBotSettings:
+    """Get the settings from the environment, which are only read the first time."""
+    return SimBotSettings.from_env()
+
+
 class SimBotRoomSearchBudget(BaseModel):
     """Seach budget settings."""
 
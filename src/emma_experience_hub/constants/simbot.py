@@ -21,7 +21,7 @@ def get_arena_definitions() -> dict[str, Any]:
     return orjson.loads(path.read_bytes())
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=2)
 def get_simbot_objects_to_indices_map(lowercase_keys: bool = False) -> dict[str, int]:
     """Load map of object labels to their index."""
     ignored_objects = ["Unassigned", "TAM Prototype"]
@@ -38,7 +38,7 @@ def get_simbot_objects_to_indices_map(lowercase_keys: bool = False) -> dict[str,
     return mapping
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=2)
 def get_simbot_object_id_to_class_name_map(lowercase_keys: bool = False) -> dict[str, str]:
     """Load map of objects from their Arena ID to the object class name."""
     mapping = get_arena_definitions()["object_id_to_class_name"]
@@ -49,7 +49,7 @@ def get_simbot_object_id_to_class_name_map(lowercase_keys: bool = False) -> dict
     return mapping
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=2)
 def get_simbot_object_label_to_class_name_map(lowercase_keys: bool = False) -> dict[str, str]:
     """Load map of object labels to their class name."""
     mapping = get_arena_definitions()["label_to_class_name"]
@@ -60,7 +60,7 @@ def get_simbot_object_label_to_class_name_map(lowercase_keys: bool = False) -> d
     return mapping
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=2)
 def get_simbot_room_names(lowercase: bool = False) -> set[str]:
     """Load room name identifiers."""
     room_names = set(get_arena_definitions()["room_names"])
@@ -87,6 +87,34 @@ def get_search_budget() -> dict[str, SimBotRoomSearchBudget]:
     return {room: SimBotRoomSearchBudget(**search_budget[room]) for room in rooms}
 
 
+@lru_cache(maxsize=1)
+def get_warmup_session_template() -> dict[str, Any]:
+    """Load the synthetic session which is used to warm up the API."""
+    path = constants_absolute_path.joinpath("simbot", "warmup_session.json")
+    return orjson.loads(path.read_bytes())
+
+
+def preload_simbot_constants() -> None:
+    """Load every constant for the Arena, with all of their variants, into the caches.
+
+    When this is called before the server forks its workers, every worker shares the same copy of
+    the constants instead of loading their own.
+    """
+    get_arena_definitions()
+    get_simbot_room_name_map()
+    get_search_budget()
+
+    # The caches are keyed on how the arguments are given, so these match how they are called.
+    get_simbot_objects_to_indices_map()
+    get_simbot_objects_to_indices_map(lowercase_keys=True)
+    get_simbot_object_id_to_class_name_map()
+    get_simbot_object_id_to_class_name_map(lowercase_keys=True)
+    get_simbot_object_label_to_class_name_map()
+    get_simbot_object_label_to_class_name_map(lowercase_keys=True)
+    get_simbot_room_names()
+    get_simbot_room_names(lowercase=True)
+
+
 ACTION_SYNONYMS: Mapping[SimBotActionType, set[str]] = MappingProxyType(
     {
         SimBotActionType.Goto: {"GoTo", "goto", "Goto"},
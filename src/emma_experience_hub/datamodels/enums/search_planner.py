@@ -6,3 +6,4 @@ class SearchPlannerType(Enum):
 
     basic = "basic"
     greedy_max_vertex_cover = "greedy_max_vertex_cover"
+    greedy_max_vertex_cover_tour = "greedy_max_vertex_cover_tour"
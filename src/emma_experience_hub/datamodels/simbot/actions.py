@@ -81,6 +81,38 @@ class SimBotAction(BaseModel):
             SimBotActionType: lambda action_type: action_type.base_type.name,
         }
 
+    @classmethod
+    def from_payload(
+        cls,
+        action_type: SimBotActionType,
+        payload: SimBotPayload,
+        raw_output: Optional[str] = None,
+        action_id: int = 0,
+    ) -> "SimBotAction":
+        """Create an action from within the controller, without validating it again.
+
+        The validators only change an action when its type has aliases, when it is a dialog
+        action, or when the raw output is missing the action delimiter. Otherwise, the action is
+        built directly, which is much faster. Any other action is validated as usual.
+        """
+        can_skip_validation = (
+            action_type not in SimBotActionType.base_type_to_aliases()
+            and action_type not in SimBotActionType.language()
+            and (raw_output is None or raw_output.endswith(PREDICTED_ACTION_DELIMITER))
+        )
+        if not can_skip_validation:
+            return cls(id=action_id, type=action_type, payload=payload, raw_output=raw_output)
+
+        payload_key = action_type.base_type.value.strip()
+        return cls.construct(
+            id=action_id,
+            type=action_type,
+            payload=payload,
+            status=None,
+            raw_output=raw_output,
+            **{payload_key: payload},
+        )
+
     @root_validator(pre=True)
     @classmethod
     def check_payload_exists_for_all_necessary_keys(
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import numpy as np
+from numpy import typing
+from pydantic import BaseModel, Field, PrivateAttr
 
 from emma_experience_hub.datamodels import EmmaExtractedFeatures
 from emma_experience_hub.datamodels.common import ArenaLocation, Position, RotationQuaternion
@@ -9,6 +11,7 @@ from emma_experience_hub.datamodels.simbot.payloads import (
     SimBotObjectInteractionPayload,
     SimBotObjectMaskType,
 )
+from emma_experience_hub.functions.rle import rle_area
 
 
 class SimBotMemoryEntity(BaseModel):
@@ -18,6 +21,7 @@ class SimBotMemoryEntity(BaseModel):
     area: float
     location: ArenaLocation
     interaction_turn: int = -1
+    last_seen_turn: int = -1
 
 
 SimBotRoomMemoryType = dict[str, SimBotMemoryEntity]
@@ -25,16 +29,21 @@ SimBotRoomMemoryType = dict[str, SimBotMemoryEntity]
 
 def get_area_from_compressed_mask(mask: SimBotObjectMaskType) -> float:
     """Compute the area of a compressed mask."""
-    if not mask:
-        return 0
-    return sum([offset for _, offset in mask])
+    return rle_area(mask)
 
 
 class SimBotObjectMemory(BaseModel):
-    """Track all the observed objects and their closest viewpoints."""
+    """Track all the observed objects and their closest viewpoints.
+
+    An index from each object label to the rooms it has been seen in is kept alongside the memory,
+    so that finding an object across the arena does not need to check every room. The index is not
+    stored with the session, and is rebuilt the first time it is needed.
+    """
 
     memory: dict[str, SimBotRoomMemoryType] = {}
 
+    _label_index: Optional[dict[str, set[str]]] = PrivateAttr(default=None)
+
     def update_from_action(  # noqa: WPS231
         self,
         room_name: str,
@@ -63,7 +72,7 @@ class SimBotObjectMemory(BaseModel):
 
         # if the action added something to the inventory then we can't find in the environment.
         if action.adds_object_to_inventory and action.payload.entity_name is not None:
-            self.memory[room_name].pop(action.payload.entity_name.lower(), None)
+            self._forget(room_name, action.payload.entity_name.lower())
         # if the action transformed the object type then we can't find in the environment.
         if action.transforms_object and action.payload.entity_name is not None and action_history:
             machine = action.payload.entity_name.lower()
@@ -75,7 +84,7 @@ class SimBotObjectMemory(BaseModel):
                 )
 
                 if should_update_memory:
-                    self.memory[room_name].pop(past_inventory, None)  # type: ignore[arg-type]
+                    self._forget(room_name, past_inventory)  # type: ignore[arg-type]
                     break
                 # Does the past action transform the object?
                 previous_interaction = (
@@ -122,12 +131,29 @@ class SimBotObjectMemory(BaseModel):
 
     def read_memory_entity_in_arena(self, object_label: str) -> list[tuple[str, ArenaLocation]]:
         """Find all objects in memory matching the object_label."""
-        found_object_locations = []
-        for room in self.memory:
-            memory_location = self.read_memory_entity_in_room(room, object_label)
-            if memory_location is not None:
-                found_object_locations.append((room, memory_location))
-        return found_object_locations
+        return [
+            (room_name, memory_entity.location)
+            for room_name, memory_entity in self.read_memory_entities_in_arena(object_label)
+        ]
+
+    def read_memory_entities_in_arena(
+        self, object_label: str
+    ) -> list[tuple[str, SimBotMemoryEntity]]:
+        """Find the object in every room it has been seen in.
+
+        The rooms are ordered by how well the object was seen, from the largest area to the
+        smallest, and then from the most recently seen.
+        """
+        object_label = object_label.lower()
+        room_names = self._get_label_index().get(object_label, set())
+        memory_entities = [
+            (room_name, self.memory[room_name][object_label]) for room_name in room_names
+        ]
+        return sorted(
+            memory_entities,
+            key=lambda room_entity: (room_entity[1].area, room_entity[1].last_seen_turn),
+            reverse=True,
+        )
 
     def object_in_memory(self, object_label: str, current_room: str) -> bool:
         """Is the object in the current room or prior memory?"""
@@ -143,15 +169,29 @@ class SimBotObjectMemory(BaseModel):
         rotation: RotationQuaternion,
         viewpoint: str,
         extracted_features: list[EmmaExtractedFeatures],
+        turn_index: int = -1,
     ) -> None:
-        """Write new object entities in memory."""
-        for frame_features in extracted_features:
-            self._write_frame_entities(
+        """Write new object entities in memory.
+
+        The largest area of each object across every frame is found first, so each object is only
+        written once, and only if it is now seen better than before.
+        """
+        object_labels, object_areas = self._get_largest_area_per_label(extracted_features)
+        if not object_labels:
+            return
+
+        # This is the first time an entity is written in memory for that room
+        self.memory.setdefault(room_name, {})
+
+        for object_label, object_area in zip(object_labels, object_areas):
+            self._write(
                 room_name=room_name,
                 position=position,
                 rotation=rotation,
                 viewpoint=viewpoint,
-                frame_features=frame_features,
+                object_label=object_label,
+                area=object_area,
+                turn_index=turn_index,
             )
 
     def write_inventory_entity_in_room(
@@ -178,34 +218,32 @@ class SimBotObjectMemory(BaseModel):
             area=get_area_from_compressed_mask(action.payload.object.mask),
         )
 
-    def _write_frame_entities(
-        self,
-        room_name: str,
-        position: Position,
-        rotation: RotationQuaternion,
-        viewpoint: str,
-        frame_features: EmmaExtractedFeatures,
-    ) -> None:
-        object_labels = frame_features.entity_labels
-        bbox_areas = frame_features.bbox_areas.tolist()
+    def _get_largest_area_per_label(
+        self, extracted_features: list[EmmaExtractedFeatures]
+    ) -> tuple[list[str], list[float]]:
+        """Get the largest area of each object label across all the frames."""
+        object_labels: list[str] = []
+        object_areas: list[typing.NDArray[np.float64]] = []
+        for frame_features in extracted_features:
+            if not frame_features.entity_labels:
+                raise AssertionError("Frame features does not have entity labels")
 
-        if not object_labels:
-            raise AssertionError("Frame features does not have entity labels")
+            num_objects = min(len(frame_features.entity_labels), len(frame_features.bbox_areas))
+            object_labels.extend(
+                object_label.lower()
+                for object_label in frame_features.entity_labels[:num_objects]
+            )
+            object_areas.append(
+                np.asarray(frame_features.bbox_areas[:num_objects], dtype=np.float64)
+            )
 
-        for object_label, object_area in zip(object_labels, bbox_areas):
-            memory_room = self.memory.get(room_name, None)
-            # This is the first time an entity is written in memory for that room
-            if memory_room is None:
-                self.memory[room_name] = {}
+        if not object_labels:
+            return [], []
 
-            self._write(
-                room_name=room_name,
-                position=position,
-                rotation=rotation,
-                viewpoint=viewpoint,
-                object_label=object_label,
-                area=object_area,
-            )
+        unique_labels, label_indices = np.unique(object_labels, return_inverse=True)
+        largest_areas = np.full(len(unique_labels), -np.inf)
+        np.maximum.at(largest_areas, label_indices, np.concatenate(object_areas))
+        return unique_labels.tolist(), largest_areas.tolist()
 
     def _write(
         self,
@@ -215,6 +253,7 @@ class SimBotObjectMemory(BaseModel):
         viewpoint: str,
         object_label: str,
         area: float,
+        turn_index: int = -1,
     ) -> None:
         object_label = object_label.lower()
         memory_entity = self.memory[room_name].get(object_label, None)
@@ -226,7 +265,25 @@ class SimBotObjectMemory(BaseModel):
                 area=area,
                 location=location,
                 interaction_turn=interaction_turn,
+                last_seen_turn=turn_index,
             )
+            self._get_label_index().setdefault(object_label, set()).add(room_name)
+        else:
+            memory_entity.last_seen_turn = max(memory_entity.last_seen_turn, turn_index)
+
+    def _forget(self, room_name: str, object_label: str) -> None:
+        """Remove the object from the room, since it can no longer be found there."""
+        self.memory[room_name].pop(object_label, None)
+        self._get_label_index().get(object_label, set()).discard(room_name)
+
+    def _get_label_index(self) -> dict[str, set[str]]:
+        """Get the rooms that each object has been seen in, building the index if needed."""
+        if self._label_index is None:
+            self._label_index = {}
+            for room_name, memory_room in self.memory.items():
+                for object_label in memory_room:
+                    self._label_index.setdefault(object_label, set()).add(room_name)
+        return self._label_index
 
     def _action_places_object_to_transform(
         self, past_action: SimBotAction, machine: str, past_inventory: Optional[str]
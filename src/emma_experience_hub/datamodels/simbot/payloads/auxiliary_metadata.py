@@ -8,7 +8,7 @@ from loguru import logger
 from PIL import Image
 from pydantic import AnyUrl, BaseModel, Field, FilePath, root_validator
 
-from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.common.settings import get_simbot_settings
 from emma_experience_hub.datamodels.common import Position, RotationQuaternion
 from emma_experience_hub.datamodels.simbot.payloads.payload import SimBotPayload
 
@@ -111,6 +111,11 @@ class SimBotAuxiliaryMetadata(BaseModel):
         return {viewpoint.split("_")[0] for viewpoint in self.viewpoints}
 
 
+_GAME_METADATA_KEYS = frozenset(
+    field.alias for field in SimBotAuxiliaryMetadata.__fields__.values()  # noqa: WPS609
+)
+
+
 class SimBotAuxiliaryMetadataPayload(SimBotPayload, SimBotAuxiliaryMetadata):
     """SimBot Action for the game metadata, which automatically parses it.
 
@@ -129,18 +134,25 @@ class SimBotAuxiliaryMetadataPayload(SimBotPayload, SimBotAuxiliaryMetadata):
     @root_validator(pre=True)
     @classmethod
     def load_game_metadata_file(cls, values: dict[str, Any]) -> dict[str, Any]:  # noqa: WPS110
-        """Load the game metadata from the file to fill in the remaining fields."""
+        """Load the game metadata from the file to fill in the remaining fields.
+
+        If the metadata is already included (e.g. when loading it from the cache), the file is not
+        read again.
+        """
         uri = values.get("uri")
         if uri is None:
             raise AssertionError("URI for the metadata file does not exist.")
 
+        if _GAME_METADATA_KEYS.issubset(values.keys()):
+            return values
+
         # Convert the EFS URi to a full path
         efs_uri = (
             uri
             if isinstance(uri, SimBotAuxiliaryMetadataUri)
             else SimBotAuxiliaryMetadataUri(url=str(uri), scheme="efs")
         )
-        metadata_path = efs_uri.resolve_path(SimBotSettings.from_env().auxiliary_metadata_dir)
+        metadata_path = efs_uri.resolve_path(get_simbot_settings().auxiliary_metadata_dir)
 
         # Load the raw metadata and update the values dict
         raw_metadata: dict[str, Any] = orjson.loads(metadata_path.read_bytes())
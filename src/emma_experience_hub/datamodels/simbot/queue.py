@@ -33,7 +33,7 @@ class SimBotQueueUtterance(BaseModel):
         }
 
 
-class SimBotQueue(GenericModel, Generic[QueueType], validate_assignment=True):
+class SimBotQueue(GenericModel, Generic[QueueType]):
     """Generic queue which can be used to track multiple aspects.
 
     A deque object is used for the queue, and multiple methods are used to allow for consistnet
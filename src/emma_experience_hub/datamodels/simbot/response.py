@@ -1,11 +1,26 @@
+from typing import Any
+
+import orjson
 from pydantic import BaseModel, Field, validator
+from pydantic.json import pydantic_encoder
 
-from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.common.settings import get_simbot_settings
 from emma_experience_hub.datamodels.simbot.actions import SimBotAction
 from emma_experience_hub.datamodels.simbot.enums import SimBotActionType
 from emma_experience_hub.datamodels.simbot.payloads import SimBotObjectOutputType
 
 
+def _convert_action_types(obj: Any) -> Any:
+    """Convert every action type within the object to the name of its base type."""
+    if isinstance(obj, SimBotActionType):
+        return obj.base_type.name
+    if isinstance(obj, dict):
+        return {key: _convert_action_types(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_convert_action_types(element) for element in obj]
+    return obj
+
+
 class SimBotResponse(BaseModel):
     """API response for the SimBot arena."""
 
@@ -33,13 +48,20 @@ class SimBotResponse(BaseModel):
             SimBotActionType: lambda action_type: action_type.base_type.name,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialise the response with orjson, in the same format as `.json(by_alias=True)`."""
+        # orjson serialises enums by value, so the action types need converting first, wherever
+        # they are in the response
+        response_dict = _convert_action_types(self.dict(by_alias=True))
+        return orjson.dumps(response_dict, default=pydantic_encoder)
+
     @validator("actions")
     @classmethod
     def add_highlight_before_object_interactions(
         cls, actions: list[SimBotAction]
     ) -> list[SimBotAction]:
         """If the feature is enabled, add a highlight action before every interaction action."""
-        settings = SimBotSettings.from_env()
+        settings = get_simbot_settings()
 
         if not settings.feature_flags.enable_always_highlight_before_object_action:
             return actions
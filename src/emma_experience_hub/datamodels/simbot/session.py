@@ -1,14 +1,14 @@
 import itertools
 from collections.abc import Iterator
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor
 from contextlib import suppress
 from datetime import datetime
-from functools import cached_property
-from typing import Callable, Optional, Union
+from functools import cached_property, partial
+from typing import Any, Callable, Optional, Union
 
 from loguru import logger
 from overrides import overrides
-from pydantic import BaseModel, Field, root_validator, validator
+from pydantic import BaseModel, Field, PrivateAttr, root_validator, validator
 
 from emma_common.datamodels import (
     DialogueUtterance,
@@ -36,7 +36,12 @@ from emma_experience_hub.datamodels.simbot.queue import SimBotQueue, SimBotQueue
 from emma_experience_hub.datamodels.simbot.request import SimBotRequest
 from emma_experience_hub.datamodels.simbot.response import SimBotResponse
 from emma_experience_hub.datamodels.simbot.speech import SimBotUserSpeech
-from emma_experience_hub.functions.coordinates import get_closest_position_index_to_reference
+from emma_experience_hub.functions.coordinates import (
+    RoomSpatialIndex,
+    ViewpointLayoutKey,
+    get_viewpoint_layout_key,
+    get_viewpoint_spatial_index,
+)
 
 
 class SimBotSessionTurnTimestamp(BaseModel):
@@ -137,14 +142,15 @@ class SimBotSessionTurnIntent(BaseModel):
         return all_intent_types
 
 
-class SimBotSessionTurnActions(BaseModel, validate_assignment=True):
+class SimBotSessionTurnActions(BaseModel):
     """Actions generated by the agent.
 
     This class constrains us to never return more than one interaction action or dialog action for
     a given turn.
 
-    The validators are called when the attributes are assigned to, making sure that the actions
-    always have the correct IDs.
+    The action IDs are updated whenever the actions are created or assigned to, making sure that
+    the actions always have the correct IDs. Assigning does not validate the whole model again,
+    since the actions are always created by the controller.
     """
 
     interaction: Optional[SimBotAction] = None
@@ -159,18 +165,26 @@ class SimBotSessionTurnActions(BaseModel, validate_assignment=True):
         """Get the number of actions in the arena."""
         return len(self.to_list())
 
+    @overrides(check_signature=False)
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: WPS110
+        """Set the attribute, and then update the action IDs."""
+        super().__setattr__(name, value)
+        self._set_action_ids(self.interaction, self.dialog)
+
     @root_validator
     @classmethod
     def update_action_ids(
         cls, values: dict[str, Optional[SimBotAction]]  # noqa: WPS110
     ) -> dict[str, Optional[SimBotAction]]:
-        """Update the action IDs for the returned actions.
-
-        Interaction actions are always first.
-        """
-        interaction_action = values.get("interaction")
-        dialog_action = values.get("dialog")
+        """Update the action IDs for the returned actions."""
+        cls._set_action_ids(values.get("interaction"), values.get("dialog"))
+        return values
 
+    @staticmethod
+    def _set_action_ids(
+        interaction_action: Optional[SimBotAction], dialog_action: Optional[SimBotAction]
+    ) -> None:
+        """Set the action IDs, where interaction actions are always first."""
         # Always set the interaction action ID to 0
         if interaction_action:
             interaction_action.id = 0
@@ -179,8 +193,6 @@ class SimBotSessionTurnActions(BaseModel, validate_assignment=True):
         if dialog_action:
             dialog_action.id = 1 if interaction_action is not None else 0
 
-        return values
-
     @property
     def object_output_type(self) -> SimBotObjectOutputType:
         """Get the object output type used by the actions.
@@ -259,7 +271,11 @@ class SimBotSessionTurnActions(BaseModel, validate_assignment=True):
 
 
 class SimBotSessionTurnEnvironment(BaseModel):
-    """Get environment information for the robot and any relevant locations."""
+    """Get environment information for the robot and any relevant locations.
+
+    The key for the layout of the viewpoints is kept once it has been built, since the viewpoints
+    do not change within a turn. It is not stored with the session.
+    """
 
     current_room: str
     current_position: Position
@@ -268,6 +284,8 @@ class SimBotSessionTurnEnvironment(BaseModel):
     unique_room_names: set[str]
     viewpoints: dict[str, Position]
 
+    _viewpoint_layout_key: Optional[ViewpointLayoutKey] = PrivateAttr(default=None)
+
     @property
     def viewpoints_in_current_room(self) -> dict[str, Position]:
         """Only return the viewpoints within the same room the agent is in."""
@@ -277,20 +295,24 @@ class SimBotSessionTurnEnvironment(BaseModel):
             if viewpoint_name.startswith(self.current_room)
         }
 
-    def get_closest_viewpoint_name(self) -> str:
-        """Get the name of the closest viewpoint to the agent.
+    @property
+    def current_room_spatial_index(self) -> RoomSpatialIndex:
+        """Get the spatial index of the viewpoints in the current room.
 
-        Adapted from: https://codereview.stackexchange.com/a/28210
+        The index is shared with every other turn and session that has the same viewpoints.
         """
-        viewpoint_index = get_closest_position_index_to_reference(
-            self.current_position, self.viewpoints_in_current_room.values()
-        )
-        # Use the index to get the name of the viewpoint
-        viewpoint_name = list(self.viewpoints_in_current_room.keys())[viewpoint_index]
-        return viewpoint_name
+        if self._viewpoint_layout_key is None:
+            self._viewpoint_layout_key = get_viewpoint_layout_key(self.viewpoints)
+
+        spatial_index = get_viewpoint_spatial_index(self.viewpoints, self._viewpoint_layout_key)
+        return spatial_index.get_room(self.current_room)
+
+    def get_closest_viewpoint_name(self) -> str:
+        """Get the name of the closest viewpoint to the agent."""
+        return self.current_room_spatial_index.get_nearest(self.current_position)
 
 
-class SimBotSessionState(BaseModel, validate_assignment=True):
+class SimBotSessionState(BaseModel):
     """Track the state of the entire session, within each turn.
 
     IMPORTANT: This state is copied to the newly created session turn, therefore storing anything
@@ -438,8 +460,10 @@ class SimBotSession(BaseModel):
         """Sort the session turns from oldest to newest."""
         sorted_turns = sorted(turns, key=lambda turn: turn.idx)
 
-        logger.debug(
-            f"Sorting session turns; {[turn.idx for turn in turns]} -> {[turn.idx for turn in sorted_turns]}"
+        logger.opt(lazy=True).debug(
+            "Sorting session turns; {} -> {}",
+            lambda: [turn.idx for turn in turns],
+            lambda: [turn.idx for turn in sorted_turns],
         )
 
         return sorted_turns
@@ -620,6 +644,7 @@ class SimBotSession(BaseModel):
             rotation=current_rotation,
             viewpoint=closest_viewpoint,
             extracted_features=extracted_features,
+            turn_index=self.current_turn.idx,
         )
 
     @staticmethod
@@ -648,43 +673,59 @@ class SimBotSession(BaseModel):
         return [turn for turn in turns if turn.actions.interaction is not None]
 
     @staticmethod
-    def get_environment_state_history_from_turns(  # noqa: WPS602
+    def get_turns_which_change_visual_frames(  # noqa: WPS602
         turns: list[SimBotSessionTurn],
-        extracted_features_load_fn: Callable[[SimBotSessionTurn], list[EmmaExtractedFeatures]],
-    ) -> list[EnvironmentStateTurn]:
-        """Get the environment state history from a set of turns.
-
-        Since we use the threadpool to load features, it does not naturally maintain the order.
-        Therefore for each turn submitted, we also track its index to ensure the returned features
-        are ordered.
-        """
-        # Only keep turns which have been used to change the visual frames
-        relevant_turns: Iterator[SimBotSessionTurn] = (
+    ) -> list[SimBotSessionTurn]:
+        """Get the turns which have been used to change the visual frames."""
+        return [
             turn
             for turn in turns
             if turn.intent.physical_interaction
             and turn.intent.physical_interaction.type == SimBotIntentType.act_one_match
+        ]
+
+    @staticmethod
+    def get_environment_state_history_from_turns(  # noqa: WPS602
+        turns: list[SimBotSessionTurn],
+        extracted_features_load_fn: Callable[[SimBotSessionTurn], list[EmmaExtractedFeatures]],
+        executor: Optional[Executor] = None,
+    ) -> list[EnvironmentStateTurn]:
+        """Get the environment state history from a set of turns."""
+        return list(
+            SimBotSession.stream_environment_state_history_from_turns(
+                turns, extracted_features_load_fn, executor
+            )
         )
 
-        environment_history: dict[int, EnvironmentStateTurn] = {}
-
-        with ThreadPoolExecutor() as executor:
-            # On submitting, the future can be used a key to map to the session turn it came from
-            future_to_turn: dict[Future[list[EmmaExtractedFeatures]], SimBotSessionTurn] = {
-                executor.submit(extracted_features_load_fn, turn): turn for turn in relevant_turns
-            }
-
-            for future in as_completed(future_to_turn):
-                turn = future_to_turn[future]
-                raw_output = (
-                    turn.actions.interaction.raw_output if turn.actions.interaction else None
-                )
-                try:
-                    environment_history[turn.idx] = EnvironmentStateTurn(
-                        features=future.result(), output=raw_output
-                    )
-                except Exception:
-                    logger.exception("Unable to get features for the turn")
-
-        # Ensure the environment history is sorted properly and return them
-        return list(dict(sorted(environment_history.items())).values())
+    @staticmethod
+    def stream_environment_state_history_from_turns(  # noqa: WPS602
+        turns: list[SimBotSessionTurn],
+        extracted_features_load_fn: Callable[[SimBotSessionTurn], list[EmmaExtractedFeatures]],
+        executor: Optional[Executor] = None,
+    ) -> Iterator[EnvironmentStateTurn]:
+        """Yield the environment state for each turn, in order, as soon as it has been loaded.
+
+        If there is an executor, the features for every turn are loaded concurrently. Otherwise,
+        they are loaded one at a time.
+        """
+        relevant_turns = SimBotSession.get_turns_which_change_visual_frames(turns)
+
+        loaded_features: Iterator[Callable[[], list[EmmaExtractedFeatures]]]
+        if executor is None:
+            loaded_features = (
+                partial(extracted_features_load_fn, turn) for turn in relevant_turns
+            )
+        else:
+            loaded_features = iter(
+                [
+                    executor.submit(extracted_features_load_fn, turn).result
+                    for turn in relevant_turns
+                ]
+            )
+
+        for turn, get_features in zip(relevant_turns, loaded_features):
+            raw_output = turn.actions.interaction.raw_output if turn.actions.interaction else None
+            try:
+                yield EnvironmentStateTurn(features=get_features(), output=raw_output)
+            except Exception:
+                logger.exception("Unable to get features for the turn")
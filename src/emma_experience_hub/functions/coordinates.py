@@ -1,6 +1,10 @@
+from collections import OrderedDict
 from collections.abc import Iterable
+from threading import Lock
+from typing import Optional
 
 import numpy as np
+from numpy import typing
 
 from emma_experience_hub.datamodels.common import Position
 
@@ -20,3 +24,168 @@ def get_closest_position_index_to_reference(
     index = np.argmin(distances)
 
     return int(index)
+
+
+class RoomSpatialIndex:
+    """Names and coordinates of the viewpoints within a room, for nearest-neighbour queries."""
+
+    def __init__(self, viewpoints: dict[str, Position]) -> None:
+        self.names = list(viewpoints.keys())
+        self.coords = np.array(
+            [position.as_list() for position in viewpoints.values()], dtype=np.float64
+        ).reshape(-1, 3)
+
+    def __len__(self) -> int:
+        """Get the number of viewpoints in the room."""
+        return len(self.names)
+
+    def get_coords(self, viewpoint_name: str) -> list[float]:
+        """Get the coordinates of the viewpoint."""
+        return self.coords[self.names.index(viewpoint_name)].tolist()
+
+    def get_squared_distances(self, reference: Position) -> typing.NDArray[np.float64]:
+        """Get the squared distance from the reference to every viewpoint."""
+        delta_to_reference = self.coords - np.asarray(reference.as_list())
+        return np.einsum("ij,ij->i", delta_to_reference, delta_to_reference)
+
+    def get_nearest_index(self, reference: Position) -> int:
+        """Get the index of the viewpoint closest to the reference."""
+        return int(np.argmin(self.get_squared_distances(reference)))
+
+    def get_nearest(self, reference: Position) -> str:
+        """Get the name of the viewpoint closest to the reference."""
+        return self.names[self.get_nearest_index(reference)]
+
+    def get_k_nearest(self, reference: Position, k: int) -> list[str]:
+        """Get the names of the k viewpoints closest to the reference, closest first."""
+        sorted_indices = np.argsort(self.get_squared_distances(reference), kind="stable")
+        return [self.names[viewpoint_idx] for viewpoint_idx in sorted_indices[:k]]
+
+
+class ViewpointSpatialIndex:
+    """Spatial index over all the viewpoints in an arena layout, split by room.
+
+    The index for each room is built the first time the room is queried.
+    """
+
+    def __init__(self, viewpoints: dict[str, Position]) -> None:
+        self._viewpoints = viewpoints
+        self._rooms: dict[str, RoomSpatialIndex] = {}
+        self._lock = Lock()
+
+    def get_room(self, room_name: str) -> RoomSpatialIndex:
+        """Get the index for the viewpoints within the room."""
+        room_index = self._rooms.get(room_name)
+        if room_index is not None:
+            return room_index
+
+        room_index = RoomSpatialIndex(
+            {
+                viewpoint_name: position
+                for viewpoint_name, position in self._viewpoints.items()
+                if viewpoint_name.startswith(room_name)
+            }
+        )
+        with self._lock:
+            return self._rooms.setdefault(room_name, room_index)
+
+
+ViewpointLayoutKey = tuple[tuple[str, float, float, float], ...]
+
+_layout_indices: OrderedDict[ViewpointLayoutKey, ViewpointSpatialIndex] = OrderedDict()
+_layout_indices_lock = Lock()
+MAX_CACHED_LAYOUTS = 64
+
+
+def get_viewpoint_layout_key(viewpoints: dict[str, Position]) -> ViewpointLayoutKey:
+    """Get the key which identifies the layout of the viewpoints."""
+    return tuple(
+        (viewpoint_name, position.x, position.y, position.z)
+        for viewpoint_name, position in viewpoints.items()
+    )
+
+
+def get_viewpoint_spatial_index(
+    viewpoints: dict[str, Position], layout_key: Optional[ViewpointLayoutKey] = None
+) -> ViewpointSpatialIndex:
+    """Get the spatial index for the viewpoints, which is shared by every identical layout.
+
+    If the key for the layout is given, it is not built from the viewpoints again.
+    """
+    if layout_key is None:
+        layout_key = get_viewpoint_layout_key(viewpoints)
+
+    with _layout_indices_lock:
+        layout_index = _layout_indices.get(layout_key)
+        if layout_index is not None:
+            _layout_indices.move_to_end(layout_key)
+            return layout_index
+
+        layout_index = ViewpointSpatialIndex(dict(viewpoints))
+        _layout_indices[layout_key] = layout_index
+        if len(_layout_indices) > MAX_CACHED_LAYOUTS:
+            _layout_indices.popitem(last=False)
+
+    return layout_index
+
+
+def get_path_length(start: typing.ArrayLike, coords: typing.ArrayLike) -> float:
+    """Get the length of the path from the start through each of the coordinates in order."""
+    coords_array = np.asarray(coords, dtype=np.float64)
+    if not len(coords_array):
+        return 0.0
+
+    path = np.vstack([np.asarray(start, dtype=np.float64), coords_array])
+    return float(np.linalg.norm(np.diff(path, axis=0), axis=1).sum())
+
+
+def get_short_path_order(start: typing.ArrayLike, coords: typing.ArrayLike) -> list[int]:
+    """Order the coordinates to give a short path from the start, which does not return.
+
+    The path is built by always going to the nearest unvisited coordinate, and then improved with
+    2-opt until reversing any section of it no longer makes it shorter. If the given order is
+    already shorter than the nearest neighbour path, it is improved instead, so the path is never
+    longer than the given order.
+    """
+    coords_array = np.asarray(coords, dtype=np.float64)
+    if not len(coords_array):
+        return []
+
+    path = np.vstack([np.asarray(start, dtype=np.float64), coords_array])
+    distances = np.linalg.norm(path[:, None] - path[None, :], axis=-1)
+    num_stops = len(path)
+
+    # Nearest neighbour from the start, which is always index 0
+    order = [0]
+    unvisited = set(range(1, num_stops))
+    while unvisited:
+        nearest = min(unvisited, key=lambda stop: (distances[order[-1], stop], stop))
+        order.append(nearest)
+        unvisited.remove(nearest)
+
+    given_order = list(range(num_stops))
+    if _get_order_length(distances, given_order) <= _get_order_length(distances, order):
+        order = given_order
+
+    # 2-opt, where the start is fixed and the end of the path is open
+    is_improved = True
+    while is_improved:
+        is_improved = False
+        for first in range(1, num_stops - 1):
+            for last in range(first + 1, num_stops):
+                removed_length = distances[order[first - 1], order[first]]
+                added_length = distances[order[first - 1], order[last]]
+                if last < num_stops - 1:
+                    removed_length += distances[order[last], order[last + 1]]
+                    added_length += distances[order[first], order[last + 1]]
+
+                if added_length < removed_length - 1e-9:  # noqa: WPS432
+                    order[first : last + 1] = reversed(order[first : last + 1])
+                    is_improved = True
+
+    return [stop - 1 for stop in order[1:]]
+
+
+def _get_order_length(distances: typing.NDArray[np.float64], order: list[int]) -> float:
+    """Get the length of the path which visits the stops in order."""
+    return float(distances[order[:-1], order[1:]].sum())
@@ -0,0 +1,113 @@
+"""Run-length encoding for binary masks.
+
+Masks are encoded the same way as the arena expects them: the mask is flattened in row-major order,
+and each run of ones is stored as `[start_index, run_length]`.
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import numpy as np
+from numpy import typing
+
+
+RunLengthEncoding = list[list[int]]
+
+
+def _encode_flat_masks(flat_masks: typing.NDArray[np.bool_]) -> list[RunLengthEncoding]:
+    """Encode each row of a 2D array of flattened masks."""
+    num_masks = flat_masks.shape[0]
+
+    # Pad either side so that every run has both a start and an end
+    padded_masks = np.zeros((num_masks, flat_masks.shape[1] + 2), dtype=np.int8)
+    padded_masks[:, 1:-1] = flat_masks
+    changes = np.diff(padded_masks, axis=1)
+
+    start_rows, starts = np.nonzero(changes == 1)
+    ends = np.nonzero(changes == -1)[1]
+    runs = np.stack([starts, ends - starts], axis=1)
+
+    # Split the runs by the mask they belong to
+    split_indices = np.searchsorted(start_rows, np.arange(1, num_masks))
+    return [mask_runs.tolist() for mask_runs in np.split(runs, split_indices)]
+
+
+def encode_rle(mask: typing.ArrayLike) -> RunLengthEncoding:
+    """Encode a single binary mask."""
+    flat_mask = np.asarray(mask).astype(bool).reshape(1, -1)
+    return _encode_flat_masks(flat_mask)[0]
+
+
+def encode_rle_batch(masks: typing.ArrayLike) -> list[RunLengthEncoding]:
+    """Encode a stack of binary masks, where the first dimension is the mask index."""
+    masks_array = np.asarray(masks).astype(bool)
+    if not len(masks_array):
+        return []
+    return _encode_flat_masks(masks_array.reshape(masks_array.shape[0], -1))
+
+
+def decode_rle(rle: RunLengthEncoding, shape: Sequence[int]) -> typing.NDArray[np.bool_]:
+    """Decode the runs back into a binary mask of the given shape."""
+    flat_mask = np.zeros(int(np.prod(shape)), dtype=np.int8)
+
+    runs = _as_runs(rle)
+    if runs.size:
+        # Mark where each run starts and ends, and fill in between with a cumulative sum
+        np.add.at(flat_mask, runs[:, 0], 1)
+        run_ends = runs[:, 0] + runs[:, 1]
+        np.add.at(flat_mask, run_ends[run_ends < flat_mask.size], -1)
+        flat_mask = np.cumsum(flat_mask, dtype=np.int8)
+
+    return flat_mask.astype(bool).reshape(shape)
+
+
+def rle_area(rle: RunLengthEncoding) -> int:
+    """Get the number of pixels within the mask."""
+    if not rle:
+        return 0
+    return int(_as_runs(rle)[:, 1].sum())
+
+
+def rle_intersection_area(rle: RunLengthEncoding, other_rle: RunLengthEncoding) -> int:
+    """Get the number of pixels that are within both masks."""
+    return _get_overlap_areas(rle, other_rle)[0]
+
+
+def rle_union_area(rle: RunLengthEncoding, other_rle: RunLengthEncoding) -> int:
+    """Get the number of pixels that are within either mask."""
+    return _get_overlap_areas(rle, other_rle)[1]
+
+
+def rle_iou(rle: RunLengthEncoding, other_rle: RunLengthEncoding) -> float:
+    """Get the intersection over union of both masks."""
+    intersection_area, union_area = _get_overlap_areas(rle, other_rle)
+    if not union_area:
+        return 0
+    return intersection_area / union_area
+
+
+def _as_runs(rle: Union[RunLengthEncoding, typing.NDArray[np.int64]]) -> typing.NDArray[np.int64]:
+    """Convert the runs to an array with a row per run."""
+    return np.asarray(rle, dtype=np.int64).reshape(-1, 2)
+
+
+def _get_overlap_areas(rle: RunLengthEncoding, other_rle: RunLengthEncoding) -> tuple[int, int]:
+    """Get the intersection and union areas of both masks, without decoding them.
+
+    Every run start and end is treated as an event which changes how many masks cover the pixels
+    that follow it. Sweeping over the sorted events gives the length of each segment and how many
+    masks cover it.
+    """
+    runs = np.concatenate([_as_runs(rle), _as_runs(other_rle)])
+    if not runs.size:
+        return 0, 0
+
+    positions = np.concatenate([runs[:, 0], runs[:, 0] + runs[:, 1]])
+    coverage_changes = np.concatenate([np.ones(len(runs)), -np.ones(len(runs))])
+
+    event_order = np.argsort(positions, kind="stable")
+    segment_lengths = np.diff(positions[event_order])
+    segment_coverage = np.cumsum(coverage_changes[event_order])[:-1]
+
+    intersection_area = int(segment_lengths[segment_coverage >= 2].sum())
+    union_area = int(segment_lengths[segment_coverage >= 1].sum())
+    return intersection_area, union_area
@@ -2,11 +2,17 @@ from emma_experience_hub.functions.simbot.actions import (
     SimBotDeconstructedAction,
     get_simbot_action_from_tokens,
 )
+from emma_experience_hub.functions.simbot.cr_intent_cache import CRIntentCache
+from emma_experience_hub.functions.simbot.environment_history import EnvironmentHistoryCache
 from emma_experience_hub.functions.simbot.grab_from_history import GrabFromHistory
-from emma_experience_hub.functions.simbot.masks import compress_segmentation_mask
+from emma_experience_hub.functions.simbot.masks import (
+    compress_bbox_segmentation_mask,
+    compress_segmentation_mask,
+)
 from emma_experience_hub.functions.simbot.search import (
     BasicSearchPlanner,
     GreedyMaximumVertexCoverSearchPlanner,
+    GreedyMaximumVertexCoverTourSearchPlanner,
     SearchPlanner,
 )
 from emma_experience_hub.functions.simbot.special_tokens import (
@@ -17,3 +23,7 @@ from emma_experience_hub.functions.simbot.special_tokens import (
     get_correct_frame_index,
     get_mask_from_special_tokens,
 )
+from emma_experience_hub.functions.simbot.speculative_action_prediction import (
+    ActionPredictionInputs,
+    SpeculativeActionPredictions,
+)
@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from loguru import logger
 
-from emma_common.datamodels import EnvironmentStateTurn, SpeakerRole
+from emma_common.datamodels import EmmaExtractedFeatures, EnvironmentStateTurn, SpeakerRole
 from emma_experience_hub.api.clients.simbot import (
     SimbotActionPredictionClient,
     SimBotCRIntentClient,
@@ -18,11 +18,17 @@ from emma_experience_hub.datamodels.simbot import (
     SimBotUtterance,
 )
 from emma_experience_hub.datamodels.simbot.queue import SimBotQueueUtterance
+from emma_experience_hub.functions.simbot.cr_intent_cache import CRIntentCache
 from emma_experience_hub.parsers import NeuralParser
 
 
 class SimBotActHandler:
-    """Determine the agent intents after a new instruction."""
+    """Determine the agent intents after a new instruction.
+
+    If a function to speculate the action is given, the action is predicted while CR is running,
+    and the prediction is discarded unless CR decides that the agent should act. If a CR intent
+    cache is given, requests which have recently been sent to CR reuse the intent from before.
+    """
 
     def __init__(
         self,
@@ -35,12 +41,16 @@ class SimBotActHandler:
         _enable_search_after_no_match: bool = True,
         _enable_search_after_missing_inventory: bool = True,
         _enable_high_level_planner: bool = True,
+        speculate_action_fn: Optional[Callable[[SimBotSession], Callable[[], None]]] = None,
+        cr_intent_cache: Optional[CRIntentCache] = None,
     ) -> None:
         self._features_client = features_client
 
         self._cr_intent_client = cr_intent_client
         self._cr_intent_parser = cr_intent_parser
+        self._cr_intent_cache = cr_intent_cache
         self._action_predictor_client = action_predictor_client
+        self._speculate_action_fn = speculate_action_fn
 
         self._enable_clarification_questions = _enable_clarification_questions
         self._enable_search_actions = _enable_search_actions
@@ -58,13 +68,19 @@ class SimBotActHandler:
             )
 
         # Otherwise, use the CR to detect it
-        intents = self._process_utterance_with_cr(session)
+        extracted_features = self._features_client.get_features(session.current_turn)
+        discard_speculative_action = self._speculate_action(session)
+
+        intents = self._process_utterance_with_cr(session, extracted_features)
         if self._should_search_target_object(session, intents):
             intents = self._handle_act_no_match_intent(session=session, intents=intents)
         elif self._should_search_missing_inventory(session, intents):
             intents = self._handle_act_missing_inventory_intent(session=session, intents=intents)
 
-        return self._handle_search_holding_object(session=session, intents=intents)
+        intents = self._handle_search_holding_object(session=session, intents=intents)
+        if not self._is_act_one_match(intents):
+            discard_speculative_action()
+        return intents
 
     def _utterance_has_been_processed_by_cr(self, session: SimBotSession) -> bool:
         """Determine if the utterance has already been processed by the CR.
@@ -78,22 +94,30 @@ class SimBotActHandler:
             and session.previous_turn.actions.is_successful
         )
 
-    def _process_utterance_with_cr(self, session: SimBotSession) -> SimBotAgentIntents:
+    def _speculate_action(self, session: SimBotSession) -> Callable[[], None]:
+        """Start predicting the action, and get a function which discards the prediction."""
+        if self._speculate_action_fn is None:
+            return lambda: None
+        return self._speculate_action_fn(session)
+
+    def _is_act_one_match(self, intents: SimBotAgentIntents) -> bool:
+        """Will the agent act on the instruction now, with the action predicted by the policy?"""
+        return (
+            intents.physical_interaction is not None
+            and intents.physical_interaction.type == SimBotIntentType.act_one_match
+        )
+
+    def _process_utterance_with_cr(
+        self, session: SimBotSession, extracted_features: list[EmmaExtractedFeatures]
+    ) -> SimBotAgentIntents:
         """Perform CR on the utterance to determine what the agent should do next.
 
         This is primarily used to determine whether the agent should act or ask for more
         information.
         """
-        extracted_features = self._features_client.get_features(session.current_turn)
-        intent = self._cr_intent_parser(
-            self._cr_intent_client.generate(
-                dialogue_history=session.current_turn.utterances,
-                environment_state_history=[EnvironmentStateTurn(features=extracted_features)],
-                inventory_entity=session.current_state.inventory.entity,
-            )
-        )
+        intent = self._get_cr_intent(session, extracted_features)
         session.update_agent_memory(extracted_features)
-        logger.debug(f"Extracted intent: {intent}")
+        logger.debug("Extracted intent: {}", intent)
 
         if not intent.type.triggers_question_to_user and session.current_turn.speech is not None:
             new_utterance = session.current_turn.speech.utterance.split("<<driver>>")[0].strip()
@@ -144,6 +168,34 @@ class SimBotActHandler:
             "All CR intents are not accounted for. This means that CR has returned an intent which does not map to either an interaction intent, or a response intent."
         )
 
+    def _get_cr_intent(
+        self, session: SimBotSession, extracted_features: list[EmmaExtractedFeatures]
+    ) -> SimBotIntent[SimBotCRIntentType]:
+        """Get the CR intent from the cache, or from the CR model if it is not cached."""
+        cache_key = None
+        if self._cr_intent_cache is not None:
+            cache_key = self._cr_intent_cache.create_key(
+                session.current_turn.utterances,
+                session.current_state.inventory.entity,
+                extracted_features,
+            )
+            cached_intent = self._cr_intent_cache.get(cache_key)
+            if cached_intent is not None:
+                logger.debug("Using cached CR intent: {}", cached_intent)
+                return cached_intent
+
+        intent = self._cr_intent_parser(
+            self._cr_intent_client.generate(
+                dialogue_history=session.current_turn.utterances,
+                environment_state_history=[EnvironmentStateTurn(features=extracted_features)],
+                inventory_entity=session.current_state.inventory.entity,
+            )
+        )
+
+        if self._cr_intent_cache is not None and cache_key is not None:
+            self._cr_intent_cache.set(cache_key, intent)
+        return intent
+
     def _handle_act_no_match_intent(
         self, session: SimBotSession, intents: SimBotAgentIntents
     ) -> SimBotAgentIntents:
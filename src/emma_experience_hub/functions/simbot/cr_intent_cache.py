@@ -0,0 +1,121 @@
+import heapq
+import re
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from time import monotonic
+from typing import NamedTuple, Optional
+
+from emma_common.datamodels import DialogueUtterance, EmmaExtractedFeatures
+from emma_experience_hub.api.observability.metrics import metrics
+from emma_experience_hub.datamodels.simbot import SimBotCRIntentType, SimBotIntent
+
+
+class CRIntentCacheKey(NamedTuple):
+    """Everything that the CR intent for a turn is assumed to depend on."""
+
+    utterance: str
+    inventory_entity: Optional[str]
+    entity_signature: str
+
+
+class _CachedIntent(NamedTuple):
+    """The parsed intent, when it stops being valid, and how many times it has been used."""
+
+    intent: SimBotIntent[SimBotCRIntentType]
+    expires_at: float
+    hits: int = 0
+
+
+class CRIntentCache:
+    """Keep the parsed CR intents for recent requests, across every session.
+
+    The same short instructions are sent to CR with the same objects in view many times, so the
+    intent is cached on the normalised utterance, the inventory entity, and the entity labels which
+    are visible. Intents expire after the TTL, and the least recently used are dropped once the
+    cache is full. Each intent counts how many times it has been used, so that the most common
+    requests can be found without keeping anything after the intent is dropped.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._intents: OrderedDict[CRIntentCacheKey, _CachedIntent] = OrderedDict()
+        self._lock = Lock()
+
+    def create_key(
+        self,
+        utterances: list[DialogueUtterance],
+        inventory_entity: Optional[str],
+        extracted_features: list[EmmaExtractedFeatures],
+    ) -> CRIntentCacheKey:
+        """Create the key for the CR request."""
+        return CRIntentCacheKey(
+            utterance=" | ".join(
+                f"{utterance.role.name}: {normalise_utterance(utterance.utterance)}"
+                for utterance in utterances
+            ),
+            inventory_entity=inventory_entity.lower() if inventory_entity else None,
+            entity_signature=get_entity_signature(extracted_features),
+        )
+
+    def get(self, cache_key: CRIntentCacheKey) -> Optional[SimBotIntent[SimBotCRIntentType]]:
+        """Get the intent for the key, if it is cached and has not expired."""
+        with self._lock:
+            cached_intent = self._intents.get(cache_key)
+            if cached_intent is not None and cached_intent.expires_at <= monotonic():
+                self._intents.pop(cache_key)
+                cached_intent = None
+            if cached_intent is not None:
+                cached_intent = cached_intent._replace(hits=cached_intent.hits + 1)
+                self._intents[cache_key] = cached_intent
+                self._intents.move_to_end(cache_key)
+
+        if cached_intent is None:
+            metrics.increment("cr_intent_cache_misses")
+            return None
+
+        metrics.increment("cr_intent_cache_hits")
+        return cached_intent.intent.copy()
+
+    def set(self, cache_key: CRIntentCacheKey, intent: SimBotIntent[SimBotCRIntentType]) -> None:
+        """Cache the intent for the key."""
+        with self._lock:
+            self._intents[cache_key] = _CachedIntent(
+                intent=intent.copy(), expires_at=monotonic() + self._ttl
+            )
+            self._intents.move_to_end(cache_key)
+            while len(self._intents) > self._max_size:
+                self._intents.popitem(last=False)
+
+    def get_most_used_utterances(self, num_utterances: int = 10) -> list[tuple[str, int]]:
+        """Get the utterances of the cached intents which have been used the most."""
+        with self._lock:
+            utterance_hits = [
+                (cache_key.utterance, cached_intent.hits)
+                for cache_key, cached_intent in self._intents.items()
+                if cached_intent.hits
+            ]
+        return heapq.nlargest(num_utterances, utterance_hits, key=lambda utterance: utterance[1])
+
+    def __len__(self) -> int:
+        """Get the number of cached intents, including any that have expired."""
+        return len(self._intents)
+
+
+def normalise_utterance(utterance: str) -> str:
+    """Normalise the utterance, so that trivial differences do not change the key."""
+    utterance = re.sub(r"[^\w\s<>]", " ", utterance.lower())
+    return " ".join(utterance.split())
+
+
+def get_entity_signature(extracted_features: list[EmmaExtractedFeatures]) -> str:
+    """Get a compact signature of the entity labels which are visible in any of the frames."""
+    entity_labels = sorted(
+        {
+            entity_label.lower()
+            for frame_features in extracted_features
+            for entity_label in frame_features.entity_labels or []
+        }
+    )
+    return blake2b("\n".join(entity_labels).encode(), digest_size=8).hexdigest()
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import partial
+from threading import Lock
+from typing import Callable, Optional
+
+from loguru import logger
+
+from emma_common.datamodels import EmmaExtractedFeatures, EnvironmentStateTurn
+from emma_experience_hub.datamodels.simbot import SimBotSession, SimBotSessionTurn
+
+
+# The features for each turn in the window, which are None if they could not be loaded
+WindowFeatures = list[tuple[str, Optional[list[EmmaExtractedFeatures]]]]
+
+
+class EnvironmentHistoryCache:
+    """Keep the features for the interaction window of each recent session.
+
+    Each turn only needs to load the features for the turns that have been added to the window
+    since the previous turn. When a new window starts, the features from the old window are
+    dropped. The output for each turn is read from the turns every time, since it is only known
+    once the action for the turn has been predicted.
+    """
+
+    def __init__(self, max_sessions: int = 64) -> None:
+        self._max_sessions = max_sessions
+        self._windows: OrderedDict[str, WindowFeatures] = OrderedDict()
+        self._lock = Lock()
+
+    def get_environment_state_history(
+        self,
+        session_id: str,
+        turns: list[SimBotSessionTurn],
+        extracted_features_load_fn: Callable[[SimBotSessionTurn], list[EmmaExtractedFeatures]],
+        executor: Optional[Executor] = None,
+    ) -> list[EnvironmentStateTurn]:
+        """Get the environment state history for the turns in the window."""
+        relevant_turns = SimBotSession.get_turns_which_change_visual_frames(turns)
+
+        with self._lock:
+            window = self._windows.pop(session_id, [])
+
+        window = self._keep_window_for_turns(window, relevant_turns)
+        turns_to_load = relevant_turns[len(window) :]
+        window.extend(self._load_features(turns_to_load, extracted_features_load_fn, executor))
+
+        with self._lock:
+            self._windows[session_id] = window
+            if len(self._windows) > self._max_sessions:
+                self._windows.popitem(last=False)
+
+        return [
+            EnvironmentStateTurn(
+                features=features,
+                output=turn.actions.interaction.raw_output if turn.actions.interaction else None,
+            )
+            for turn, (_, features) in zip(relevant_turns, window)
+            if features is not None
+        ]
+
+    def _keep_window_for_turns(
+        self, window: WindowFeatures, turns: list[SimBotSessionTurn]
+    ) -> WindowFeatures:
+        """Keep the features for the turns at the start of the window which are still in it."""
+        num_kept = 0
+        for (prediction_request_id, features), turn in zip(window, turns):
+            if prediction_request_id != turn.prediction_request_id or features is None:
+                break
+            num_kept += 1
+
+        return window[:num_kept]
+
+    def _load_features(
+        self,
+        turns: list[SimBotSessionTurn],
+        extracted_features_load_fn: Callable[[SimBotSessionTurn], list[EmmaExtractedFeatures]],
+        executor: Optional[Executor],
+    ) -> WindowFeatures:
+        """Load the features for each turn, in order."""
+        get_features_fns: list[Callable[[], list[EmmaExtractedFeatures]]]
+        if executor is None:
+            get_features_fns = [partial(extracted_features_load_fn, turn) for turn in turns]
+        else:
+            get_features_fns = [
+                executor.submit(extracted_features_load_fn, turn).result for turn in turns
+            ]
+
+        window: WindowFeatures = []
+        for turn, get_features in zip(turns, get_features_fns):
+            try:
+                window.append((turn.prediction_request_id, get_features()))
+            except Exception:
+                logger.exception("Unable to get features for the turn")
+                window.append((turn.prediction_request_id, None))
+
+        return window
@@ -11,7 +11,14 @@ from emma_experience_hub.functions.simbot.search import SearchPlanner
 
 
 class GrabFromHistory:
-    """Grab from History class."""
+    """Grab from History class.
+
+    If `enable_cross_room` is set and the object has only been seen in other rooms, go to the room
+    where it was seen best before searching for it.
+    """
+
+    def __init__(self, enable_cross_room: bool = False) -> None:
+        self.enable_cross_room = enable_cross_room
 
     def __call__(
         self,
@@ -35,13 +42,37 @@ class GrabFromHistory:
         )
         # If yes, start the search from that location
         if gfh_location is not None:
-            logger.debug(f"Found object {searchable_object} in location {gfh_location}")
+            logger.debug("Found object {} in location {}", searchable_object, gfh_location)
             if gfh_location == session.current_turn.environment.current_position:
                 gfh_location = None
             return search_planner.run(session, gfh_location=gfh_location)
 
+        # Have we seen the object in any other room?
+        if self._can_goto_room_before_search(session):
+            memory_entities = session.current_state.memory.read_memory_entities_in_arena(
+                searchable_object
+            )
+            if memory_entities:
+                room_name, _ = memory_entities[0]
+                logger.debug("Found object {} in room {}", searchable_object, room_name)
+                return self._goto_room_before_search(session, room_name, searchable_object)
+
         return search_planner.run(session)
 
+    def _can_goto_room_before_search(self, session: SimBotSession) -> bool:
+        """Can we go to another room before searching?
+
+        Do not go to another room if the previous action was already going to a room, otherwise the
+        agent could keep trying to reach a room it cannot get to.
+        """
+        if not self.enable_cross_room:
+            return False
+
+        previous_turn = session.previous_valid_turn
+        if previous_turn is None or previous_turn.actions.interaction is None:
+            return True
+        return previous_turn.actions.interaction.type != SimBotActionType.GotoRoom
+
     def _goto_room_before_search(
         self, session: SimBotSession, room: str, searchable_object: str
     ) -> list[SimBotAction]:
@@ -60,9 +91,8 @@ class GrabFromHistory:
 
     def _create_goto_room_action(self, room: str) -> SimBotAction:
         """Create action for going to a room."""
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.GotoRoom,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.GotoRoom,
             raw_output=f"goto {room} {END_OF_TRAJECTORY_TOKEN}{PREDICTED_ACTION_DELIMITER}",
             payload=SimBotGotoRoomPayload(object=SimBotGotoRoom(officeRoom=room)),
         )
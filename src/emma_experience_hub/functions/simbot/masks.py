@@ -1,10 +1,16 @@
-import torch
+from typing import TYPE_CHECKING
+
 from more_itertools import consecutive_groups
 
 from emma_experience_hub.datamodels.simbot.payloads import SimBotObjectMaskType
+from emma_experience_hub.functions.rle import encode_rle
+
+
+if TYPE_CHECKING:
+    import torch
 
 
-def alexa_compress_segmentation_mask(mask: torch.Tensor) -> SimBotObjectMaskType:  # noqa: WPS231
+def alexa_compress_segmentation_mask(mask: "torch.Tensor") -> SimBotObjectMaskType:  # noqa: WPS231
     """Compress the segmenmtation mask for the arena.
 
     The algorithm was provided by the Alexa Prize people.
@@ -32,7 +38,7 @@ def alexa_compress_segmentation_mask(mask: torch.Tensor) -> SimBotObjectMaskType
     return run_len_compressed
 
 
-def tensor_compress_segmntation_mask(mask: torch.Tensor) -> SimBotObjectMaskType:
+def tensor_compress_segmntation_mask(mask: "torch.Tensor") -> SimBotObjectMaskType:
     """Improved version of the compress segmentation mask."""
     simplified_mask: list[int] = mask.bool().flatten().nonzero().flatten().tolist()
 
@@ -45,6 +51,32 @@ def tensor_compress_segmntation_mask(mask: torch.Tensor) -> SimBotObjectMaskType
     return compressed_mask
 
 
-def compress_segmentation_mask(mask: torch.Tensor) -> SimBotObjectMaskType:
+def compress_bbox_segmentation_mask(
+    bbox: tuple[float, float, float, float], width: int, height: int
+) -> SimBotObjectMaskType:
+    """Compress the segmentation mask for a bounding box, without creating the mask.
+
+    This gives the same result as filling the box within a `(width, height)` mask and compressing
+    that, including how the coordinates are truncated and clipped by the slicing.
+    """
+    x_min, y_min, x_max, y_max = bbox
+
+    row_start, row_end, _ = slice(int(y_min), int(y_max) + 1).indices(width)
+    column_start, column_end, _ = slice(int(x_min), int(x_max) + 1).indices(height)
+
+    if row_end <= row_start or column_end <= column_start:
+        return []
+
+    # If the box covers entire rows, it is a single run
+    if column_start == 0 and column_end == height:
+        return [[row_start * height, (row_end - row_start) * height]]
+
+    run_length = column_end - column_start
+    return [
+        [row_idx * height + column_start, run_length] for row_idx in range(row_start, row_end)
+    ]
+
+
+def compress_segmentation_mask(mask: "torch.Tensor") -> SimBotObjectMaskType:
     """Compress the segmenmtation mask for the arena."""
-    return tensor_compress_segmntation_mask(mask)
+    return encode_rle(mask.cpu())
@@ -18,7 +18,8 @@ from emma_experience_hub.datamodels.simbot.payloads import (
     SimBotMoveForwardPayload,
     SimBotRotatePayload,
 )
-from emma_experience_hub.functions.coordinates import get_closest_position_index_to_reference
+from emma_experience_hub.functions.coordinates import RoomSpatialIndex, get_short_path_order
+from emma_experience_hub.functions.simbot.search_coverage import SearchCoverageCache
 
 
 class SearchPlanner(ABC):
@@ -57,9 +58,8 @@ class SearchPlanner(ABC):
 
     def _create_goto_viewpoint_action(self, viewpoint_name: str) -> SimBotAction:
         """Create action for going to a view point."""
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.GotoViewpoint,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.GotoViewpoint,
             raw_output=f"goto {viewpoint_name}{PREDICTED_ACTION_DELIMITER}",
             payload=SimBotGotoViewpointPayload(
                 object=SimBotGotoViewpoint(goToPoint=viewpoint_name)
@@ -68,9 +68,8 @@ class SearchPlanner(ABC):
 
     def _create_goto_arena_location_action(self, location: ArenaLocation) -> SimBotAction:
         """Create action for going to a given position."""
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.GotoPosition,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.GotoPosition,
             raw_output=f"goto position{PREDICTED_ACTION_DELIMITER}",
             payload=SimBotGotoPositionPayload(
                 object=SimBotGotoPosition(position=location.position, rotation=location.rotation)
@@ -83,9 +82,8 @@ class SearchPlanner(ABC):
             raw_output = f"turn left {END_OF_TRAJECTORY_TOKEN}{PREDICTED_ACTION_DELIMITER}"
         else:
             raw_output = f"turn left{PREDICTED_ACTION_DELIMITER}"
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.RotateLeft,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.RotateLeft,
             raw_output=raw_output,
             payload=SimBotRotatePayload(direction="Left", magnitude=self.rotation_magnitude),
         )
@@ -96,9 +94,8 @@ class SearchPlanner(ABC):
             raw_output = f"look around {END_OF_TRAJECTORY_TOKEN}{PREDICTED_ACTION_DELIMITER}"
         else:
             raw_output = f"look around{PREDICTED_ACTION_DELIMITER}"
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.LookAround,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.LookAround,
             raw_output=raw_output,
             payload=SimBotLookAroundPayload(),
         )
@@ -106,9 +103,8 @@ class SearchPlanner(ABC):
     def _create_dummy_action(self) -> SimBotAction:
         """Dummy move forward action."""
         raw_output = f"move forward{PREDICTED_ACTION_DELIMITER}"
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.MoveForward,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.MoveForward,
             raw_output=raw_output,
             payload=SimBotMoveForwardPayload(magnitude=0),
         )
@@ -117,11 +113,13 @@ class SearchPlanner(ABC):
 class BasicSearchPlanner(SearchPlanner):
     """Basic search plan.
 
-    Keep rotating from the current position.
+    Keep rotating from the current position. If `use_look_around` is set, look around instead of
+    rotating, so that every frame from the position can be grounded at once.
     """
 
-    def __init__(self, rotation_magnitude: float = 90):
+    def __init__(self, rotation_magnitude: float = 90, use_look_around: bool = False):
         super().__init__(rotation_magnitude=rotation_magnitude)
+        self.use_look_around = use_look_around
 
     def run(
         self,
@@ -130,7 +128,7 @@ class BasicSearchPlanner(SearchPlanner):
     ) -> list[SimBotAction]:
         """Get the actions produced by the planner."""
         # For search and no match, do a Look Around
-        if session.current_turn.intent.is_searching_inferred_object:
+        if session.current_turn.intent.is_searching_inferred_object or self.use_look_around:
             return [self._create_look_around_action()]
         return self._create_rotation_actions()
 
@@ -156,11 +154,13 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
         use_current_position: bool = True,
         rotation_magnitude: float = 90,
         gfh_location_type: GFHLocationType = GFHLocationType.location,
+        use_look_around: bool = False,
     ) -> None:
-        super().__init__(rotation_magnitude=rotation_magnitude)
+        super().__init__(rotation_magnitude=rotation_magnitude, use_look_around=use_look_around)
         self.search_budget = get_search_budget()
         self.use_current_position = use_current_position
         self.gfh_location_type = gfh_location_type
+        self.coverage_cache = SearchCoverageCache(self.search_budget)
 
     def get_coverage_sets(
         self, coords: typing.NDArray[np.float64], current_room: str
@@ -203,9 +203,10 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
             coverage_sets[coverage_sets[selected_idx] > 0, :] = 0
             coverage_sets[:, coverage_sets[selected_idx] > 0] = 0
 
-        logger.debug(f"[SEARCH] Number of selected viewpoints = {len(selected_viewpoints)}")
-        logger.debug(
-            f"[SEARCH] Number of viewpoints not covered = {np.where(coverage_sets.sum(0) > 0)[0].shape[0]}"
+        logger.debug("[SEARCH] Number of selected viewpoints = {}", len(selected_viewpoints))
+        logger.opt(lazy=True).debug(
+            "[SEARCH] Number of viewpoints not covered = {}",
+            lambda: np.where(coverage_sets.sum(0) > 0)[0].shape[0],
         )
         return selected_viewpoints
 
@@ -267,6 +268,8 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
         location_from_gfh: bool = False,
     ) -> list[SimBotAction]:
         """Return the necessary actions needed to be done in a single viewpoint."""
+        if self.use_look_around:
+            return [self._create_look_around_action(add_stop_token=False)]
         return self._create_rotation_actions()
 
     def run(
@@ -274,11 +277,19 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
         session: SimBotSession,
         gfh_location: Optional[ArenaLocation] = None,
     ) -> list[SimBotAction]:
-        """Get the actions produced by the planner."""
-        current_room = session.current_turn.environment.current_room
-        (name_candidates, location_candidates, first_selected_idx) = self.get_vertex_candidates(
-            session
+        """Get the actions produced by the planner.
+
+        The coverage between the viewpoints in the room is cached per room layout, so only the
+        starting location needs to be handled for each request.
+        """
+        environment = session.current_turn.environment
+        room_coverage = self.coverage_cache.get_room_coverage(
+            environment.current_room, environment.current_room_spatial_index
         )
+
+        start_position = environment.current_position if self.use_current_position else None
+        start_viewpoint = None
+        tour_start = environment.current_position.as_list()
         first_location_from_gfh = False
         planned_actions: list[SimBotAction] = []
         if gfh_location is not None:
@@ -288,38 +299,52 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
                 gfh_location=gfh_location,
                 planned_actions=planned_actions,
             )
-            (
-                name_candidates,
-                location_candidates,
-                first_selected_idx,
-            ) = self.add_gfh_location_to_vertex_candidates(
-                name_candidates, location_candidates, gfh_starting_location
-            )
+            if isinstance(gfh_starting_location, ArenaLocation):
+                start_position = gfh_starting_location.position
+                tour_start = start_position.as_list()
+            else:
+                start_position = None
+                start_viewpoint = gfh_starting_location
+                tour_start = environment.current_room_spatial_index.get_coords(start_viewpoint)
 
         # We need 3 turns for each planned location + 1 more for the last viewpoint
         planned_actions.extend(
             self.get_actions_for_position(location_from_gfh=first_location_from_gfh)
         )
-        location_candidates_array = np.array(location_candidates)
-        name_candidates_array = np.array(name_candidates)
 
-        coverage_sets = self.get_coverage_sets(
-            location_candidates_array, current_room=current_room
+        # Select the maximum coverage location, after searching from the starting location
+        selected_viewpoints = self.order_selected_viewpoints(
+            room_coverage.plan(start_position=start_position, start_viewpoint=start_viewpoint),
+            tour_start=tour_start,
+            room_index=environment.current_room_spatial_index,
         )
-        # Select the maximum coverage location, force the first one to be the robot location
-        selected_room_locations = self.select_based_on_maximum_coverage(
-            coverage_sets, current_room=current_room, first_selected_idx=first_selected_idx
-        )
-        if selected_room_locations:
-            for name in name_candidates_array[selected_room_locations]:
-                planned_actions.append(self._create_goto_viewpoint_action(name))
-                planned_actions.extend(self.get_actions_for_position())
-
-        planned_actions.append(self._create_turn_left_action(add_stop_token=True))
+        logger.debug("[SEARCH] Number of selected viewpoints = {}", len(selected_viewpoints))
+        for name in selected_viewpoints:
+            planned_actions.append(self._create_goto_viewpoint_action(name))
+            planned_actions.extend(self.get_actions_for_position())
+
+        if self.use_look_around:
+            # The last look around ends the search, instead of rotating back to the start
+            planned_actions[-1] = self._create_look_around_action(add_stop_token=True)
+        else:
+            planned_actions.append(self._create_turn_left_action(add_stop_token=True))
 
-        logger.debug(f"[SEARCH] Plan = {planned_actions}")
+        logger.debug("[SEARCH] Plan = {}", planned_actions)
         return planned_actions
 
+    def order_selected_viewpoints(
+        self,
+        selected_viewpoints: list[str],
+        tour_start: list[float],
+        room_index: RoomSpatialIndex,
+    ) -> list[str]:
+        """Order the selected viewpoints before visiting them, starting from the tour start.
+
+        Viewpoints are visited in the order they were selected, which covers the most of the room
+        soonest.
+        """
+        return selected_viewpoints
+
     def _create_rotation_actions(self) -> list[SimBotAction]:
         """Create actions to perform the look around."""
         actions = [
@@ -343,13 +368,8 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
     def _get_viewpoint_closest_to_location(
         self, gfh_location: ArenaLocation, session: SimBotSession
     ) -> str:
-        viewpoints_in_current_room = session.current_turn.environment.viewpoints_in_current_room
-        viewpoint_index = get_closest_position_index_to_reference(
-            gfh_location.position, viewpoints_in_current_room.values()
-        )
-        # Use the index to get the name of the viewpoint
-        viewpoint_name = list(viewpoints_in_current_room.keys())[viewpoint_index]
-        return viewpoint_name
+        room_index = session.current_turn.environment.current_room_spatial_index
+        return room_index.get_nearest(gfh_location.position)
 
     def _get_gfh_starting_location(
         self,
@@ -374,3 +394,22 @@ class GreedyMaximumVertexCoverSearchPlanner(BasicSearchPlanner):
             name_candidates.pop(current_pos_index)
             location_candidates.pop(current_pos_index)
         return name_candidates, location_candidates
+
+
+class GreedyMaximumVertexCoverTourSearchPlanner(GreedyMaximumVertexCoverSearchPlanner):
+    """Greedy maximum vertex cover search planner, which visits the viewpoints in a short tour.
+
+    The same viewpoints are selected as the greedy planner, but they are visited in the order that
+    minimises the distance travelled from where the search starts.
+    """
+
+    def order_selected_viewpoints(
+        self,
+        selected_viewpoints: list[str],
+        tour_start: list[float],
+        room_index: RoomSpatialIndex,
+    ) -> list[str]:
+        """Order the selected viewpoints to give a short path from the tour start."""
+        selected_coords = [room_index.get_coords(name) for name in selected_viewpoints]
+        tour_order = get_short_path_order(tour_start, selected_coords)
+        return [selected_viewpoints[viewpoint_idx] for viewpoint_idx in tour_order]
@@ -0,0 +1,116 @@
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from numpy import typing
+
+from emma_experience_hub.common.settings.simbot import SimBotRoomSearchBudget
+from emma_experience_hub.datamodels.common import Position
+from emma_experience_hub.functions.coordinates import RoomSpatialIndex
+
+
+class RoomSearchCoverage:
+    """Which viewpoints in a room can be seen from each other, and the greedy plans over them.
+
+    The viewpoints within a room do not change during a mission, so the coverage between them is
+    computed once. Greedy plans only depend on which viewpoints the search starts out covering, so
+    they are memoised on that.
+    """
+
+    def __init__(
+        self, room_index: RoomSpatialIndex, search_budget: SimBotRoomSearchBudget
+    ) -> None:
+        self.viewpoint_names = room_index.names
+        self.viewpoint_coords = room_index.coords
+        self.search_budget = search_budget
+
+        # Fast pairwise euclidean distance instead of computing 1-by-1.
+        pairwise_distances = np.sqrt(
+            (  # noqa: WPS221
+                (self.viewpoint_coords[:, :, None] - self.viewpoint_coords[:, :, None].T) ** 2
+            ).sum(1)
+        )
+        self.coverage = pairwise_distances <= search_budget.distance_threshold
+
+        self._plans: dict[tuple[bytes, int], list[int]] = {}
+
+    def get_viewpoints_covered_from_position(self, position: Position) -> typing.NDArray[np.bool_]:
+        """Get the viewpoints that are covered from a position that is not a viewpoint."""
+        distances = np.sqrt(((self.viewpoint_coords - np.asarray(position.as_list())) ** 2).sum(1))
+        return distances <= self.search_budget.distance_threshold
+
+    def plan(
+        self,
+        start_position: Optional[Position] = None,
+        start_viewpoint: Optional[str] = None,
+    ) -> list[str]:
+        """Get the viewpoints to visit, in order, after searching from the start.
+
+        If there is a start, the search from it uses up one of the viewpoint budget, and any
+        viewpoint covered by it does not need to be visited.
+        """
+        num_viewpoints = self.search_budget.viewpoint_budget
+        initially_covered = np.zeros(len(self.viewpoint_names), dtype=bool)
+
+        if start_viewpoint is not None:
+            initially_covered = self.coverage[self.viewpoint_names.index(start_viewpoint)]
+            num_viewpoints -= 1
+        elif start_position is not None:
+            initially_covered = self.get_viewpoints_covered_from_position(start_position)
+            num_viewpoints -= 1
+
+        plan_key = (np.packbits(initially_covered).tobytes(), num_viewpoints)
+        if plan_key not in self._plans:
+            self._plans[plan_key] = self._select_greedy_maximum_coverage(
+                initially_covered, num_viewpoints
+            )
+
+        return [self.viewpoint_names[viewpoint_idx] for viewpoint_idx in self._plans[plan_key]]
+
+    def _select_greedy_maximum_coverage(
+        self, initially_covered: typing.NDArray[np.bool_], num_viewpoints: int
+    ) -> list[int]:
+        """Repeatedly select the uncovered viewpoint which covers the most viewpoints.
+
+        Only the viewpoints which are still uncovered count towards the coverage of each candidate.
+        Ties are broken by the order of the viewpoints.
+        """
+        uncovered = ~initially_covered
+        selected_viewpoints: list[int] = []
+
+        for _ in range(num_viewpoints):
+            num_covered_per_viewpoint = (
+                self.coverage & uncovered[:, None] & uncovered[None, :]
+            ).sum(1)
+            if not num_covered_per_viewpoint.any():
+                break
+
+            selected_idx = int(np.argmax(num_covered_per_viewpoint))
+            selected_viewpoints.append(selected_idx)
+            uncovered &= ~self.coverage[selected_idx]
+
+        return selected_viewpoints
+
+
+class SearchCoverageCache:
+    """Cache the search coverage for each room layout that has been seen.
+
+    Room layouts are identified by their spatial index, which is shared by every session with the
+    same viewpoints. Entries are dropped once the spatial index is no longer used.
+    """
+
+    def __init__(self, search_budget: dict[str, SimBotRoomSearchBudget]) -> None:
+        self.search_budget = search_budget
+        self._room_coverage: WeakKeyDictionary[
+            RoomSpatialIndex, RoomSearchCoverage
+        ] = WeakKeyDictionary()
+
+    def get_room_coverage(
+        self, room_name: str, room_index: RoomSpatialIndex
+    ) -> RoomSearchCoverage:
+        """Get the search coverage for the room, building it if the layout is new."""
+        room_coverage = self._room_coverage.get(room_index)
+        if room_coverage is None:
+            room_coverage = RoomSearchCoverage(room_index, self.search_budget[room_name])
+            self._room_coverage[room_index] = room_coverage
+        return room_coverage
@@ -1,12 +1,11 @@
 from typing import Literal, Optional, Union, overload
 
-import torch
 from loguru import logger
 from pydantic import BaseModel, Field
 
 from emma_experience_hub.datamodels import EmmaExtractedFeatures
 from emma_experience_hub.datamodels.simbot.payloads import SimBotObjectMaskType
-from emma_experience_hub.functions.simbot.masks import compress_segmentation_mask
+from emma_experience_hub.functions.simbot.masks import compress_bbox_segmentation_mask
 
 
 class SimBotSceneObjectTokens(BaseModel):
@@ -48,24 +47,14 @@ def get_mask_from_special_tokens(
     return_coords: bool = False,
 ) -> Union[SimBotObjectMaskType, tuple[SimBotObjectMaskType, tuple[float, ...]]]:
     """Get the object mask from the visual token."""
-    # Get the bbox coordinates for the correct frame index
-    object_coordinates_bbox = extracted_features[frame_index - 1].bbox_coords
+    frame_features = extracted_features[frame_index - 1]
 
     # Get the coordinates for the specified object
-    (x_min, y_min, x_max, y_max) = object_coordinates_bbox[object_index - 1].tolist()
-
-    # Create an empty mask for the object
-    mask = torch.zeros(
-        (
-            extracted_features[frame_index - 1].width,
-            extracted_features[frame_index - 1].height,
-        )
-    )
-
-    # Populate the bbox region in the mask
-    mask[int(y_min) : int(y_max) + 1, int(x_min) : int(x_max) + 1] = 1  # noqa: WPS221
+    (x_min, y_min, x_max, y_max) = frame_features.bbox_coords[object_index - 1].tolist()
 
-    compressed_mask = compress_segmentation_mask(mask)
+    compressed_mask = compress_bbox_segmentation_mask(
+        (x_min, y_min, x_max, y_max), frame_features.width, frame_features.height
+    )
 
     if return_coords:
         return compressed_mask, (x_min, y_min, x_max, y_max)
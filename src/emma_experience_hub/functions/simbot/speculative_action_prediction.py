@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Generic, NamedTuple, Optional, TypeVar
+
+from loguru import logger
+
+from emma_common.datamodels import DialogueUtterance
+from emma_experience_hub.api.observability.metrics import metrics
+
+
+T = TypeVar("T")
+
+
+class ActionPredictionInputs(NamedTuple):
+    """Everything that the action prediction for a turn depends on."""
+
+    turn_ids: tuple[str, ...]
+    relevant_turn_ids: tuple[str, ...]
+    dialogue_history: list[DialogueUtterance]
+    force_stop_token: bool
+    inventory_entity: Optional[str]
+
+
+class _SpeculativePrediction(NamedTuple):
+    """A prediction which was started before it was known to be needed."""
+
+    inputs: ActionPredictionInputs
+    future: "Future[Any]"
+
+
+class SpeculativeActionPredictions(Generic[T]):
+    """Action predictions which are started while CR is still running.
+
+    If CR confirms that the agent should act, the prediction is used as long as its inputs have
+    not changed since it was started. Otherwise, it is cancelled if it has not started running,
+    or its result is dropped. Either way, it is counted as wasted.
+    """
+
+    def __init__(self, max_workers: int = 4, max_sessions: int = 64) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="speculation"
+        )
+        self._max_sessions = max_sessions
+        self._predictions: OrderedDict[str, _SpeculativePrediction] = OrderedDict()
+        self._lock = Lock()
+
+    def start(
+        self, session_id: str, inputs: ActionPredictionInputs, predict_fn: Callable[[], T]
+    ) -> None:
+        """Start the prediction in the background, replacing any previous one for the session."""
+        future = self._executor.submit(predict_fn)
+        metrics.increment("speculative_action_predictions_started")
+
+        with self._lock:
+            previous_prediction = self._predictions.pop(session_id, None)
+            self._predictions[session_id] = _SpeculativePrediction(inputs=inputs, future=future)
+            evicted_predictions = []
+            while len(self._predictions) > self._max_sessions:
+                evicted_predictions.append(self._predictions.popitem(last=False)[1])
+
+        if previous_prediction is not None:
+            evicted_predictions.append(previous_prediction)
+        for evicted_prediction in evicted_predictions:
+            self._waste(evicted_prediction)
+
+    def claim(self, session_id: str, inputs: ActionPredictionInputs) -> Optional[T]:
+        """Get the result of the prediction for the session, if it was made from the same inputs.
+
+        This waits for the prediction to finish, since it was started before it was needed.
+        """
+        with self._lock:
+            prediction = self._predictions.pop(session_id, None)
+
+        if prediction is None:
+            return None
+
+        if prediction.inputs != inputs:
+            logger.debug("Inputs changed since the speculative action prediction was started")
+            self._waste(prediction)
+            return None
+
+        try:
+            prediction_result = prediction.future.result()
+        except Exception:
+            logger.exception("Speculative action prediction failed")
+            metrics.increment("speculative_action_predictions_wasted")
+            return None
+
+        metrics.increment("speculative_action_predictions_used")
+        return prediction_result
+
+    def discard(self, session_id: str) -> None:
+        """Discard the prediction for the session, because it is not needed."""
+        with self._lock:
+            prediction = self._predictions.pop(session_id, None)
+
+        if prediction is not None:
+            self._waste(prediction)
+
+    def shutdown(self) -> None:
+        """Stop the workers, cancelling any predictions that have not started running."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _waste(self, prediction: _SpeculativePrediction) -> None:
+        """Cancel the prediction if possible, and count it as wasted."""
+        prediction.future.cancel()
+        metrics.increment("speculative_action_predictions_wasted")
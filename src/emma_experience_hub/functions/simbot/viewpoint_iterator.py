@@ -9,7 +9,6 @@ from emma_experience_hub.datamodels.simbot.payloads import (
     SimBotGotoViewpoint,
     SimBotGotoViewpointPayload,
 )
-from emma_experience_hub.functions.coordinates import get_closest_position_index_to_reference
 
 
 class ViewpointPlanner:
@@ -39,23 +38,17 @@ class ViewpointPlanner:
     ) -> tuple[list[str], typing.NDArray[np.float64]]:
         """Get the viewpoints in the current room sorted alphabetically."""
         # Get the viewpoints in the current room
-        room_viewpoints = session.current_turn.environment.viewpoints_in_current_room
-        viewpoint_names = list(room_viewpoints.keys())
-        viewpoint_locations = list(room_viewpoints.values())
+        room_index = session.current_turn.environment.current_room_spatial_index
 
         # Sort the viewpoints by name
-        indices = np.argsort(viewpoint_names)
-        sorted_viewpoint_names = [viewpoint_names[index] for index in indices]
-        sorted_viewpoint_locations = np.array(
-            [viewpoint_locations[index].as_list() for index in indices]
-        )
-        return sorted_viewpoint_names, sorted_viewpoint_locations
+        indices = np.argsort(room_index.names)
+        sorted_viewpoint_names = [room_index.names[index] for index in indices]
+        return sorted_viewpoint_names, room_index.coords[indices]
 
     def _create_goto_viewpoint_action(self, viewpoint_name: str) -> SimBotAction:
         """Create action for going to a view point."""
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.GotoViewpoint,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.GotoViewpoint,
             raw_output=f"goto {viewpoint_name}{PREDICTED_ACTION_DELIMITER}{END_OF_TRAJECTORY_TOKEN}",
             payload=SimBotGotoViewpointPayload(
                 object=SimBotGotoViewpoint(goToPoint=viewpoint_name)
@@ -64,15 +57,7 @@ class ViewpointPlanner:
 
     def _get_viewpoint_closest_to_location(self, session: SimBotSession) -> str:
         """Get the name of the viewpoint closest to the current position."""
-        environment = session.current_turn.environment
-        current_position = environment.current_position
-        viewpoints_in_current_room = environment.viewpoints_in_current_room
-        viewpoint_index = get_closest_position_index_to_reference(
-            current_position, viewpoints_in_current_room.values()
-        )
-        # Use the index to get the name of the viewpoint
-        viewpoint_name = list(viewpoints_in_current_room.keys())[viewpoint_index]
-        return viewpoint_name
+        return session.current_turn.environment.get_closest_viewpoint_name()
 
     def _get_next_viewpoint_action(self, session: SimBotSession) -> SimBotAction:
         """Get the actions produced by the planner."""
@@ -82,7 +67,7 @@ class ViewpointPlanner:
             location_candidates, name_candidates
         )
 
-        logger.info(f"[VIEWPOINT PLANNER] Sorted viewpoints: {sorted_name_candidates}")
+        logger.info("[VIEWPOINT PLANNER] Sorted viewpoints: {}", sorted_name_candidates)
         # Get the closest viewpoint to the current position
         closest_viewpoint = self._get_viewpoint_closest_to_location(session)
         closest_index = sorted_name_candidates.index(closest_viewpoint)
@@ -99,7 +84,7 @@ class ViewpointPlanner:
         sorted_name_candidates = self._sort_viewpoints_by_distance(
             location_candidates, name_candidates
         )
-        logger.info(f"[VIEWPOINT PLANNER] Sorted viewpoints: {sorted_name_candidates}")
+        logger.info("[VIEWPOINT PLANNER] Sorted viewpoints: {}", sorted_name_candidates)
 
         # Get the closest viewpoint to the current position
         closest_viewpoint = self._get_viewpoint_closest_to_location(session)
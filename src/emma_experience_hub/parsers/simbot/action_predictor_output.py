@@ -4,10 +4,7 @@ from loguru import logger
 from overrides import overrides
 
 from emma_experience_hub.constants.model import MODEL_EOS_TOKEN, PREDICTED_ACTION_DELIMITER
-from emma_experience_hub.constants.simbot import (
-    get_simbot_objects_to_indices_map,
-    get_simbot_room_names,
-)
+from emma_experience_hub.constants.simbot import get_simbot_room_names
 from emma_experience_hub.datamodels import EmmaExtractedFeatures
 from emma_experience_hub.datamodels.simbot.actions import SimBotAction, SimBotActionType
 from emma_experience_hub.datamodels.simbot.enums import SimBotDummyRawActions
@@ -36,17 +33,15 @@ from emma_experience_hub.parsers.parser import NeuralParser
 class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
     """Parse the correct action from the model output."""
 
-    available_room_names: set[str] = get_simbot_room_names()
-
     _payget_to_action_type: dict[type[SimBotPayload], str] = {
         payload: action_type
         for action_type, payload in SimBotActionType.action_type_to_payload_model().items()
     }
 
-    _object_label_to_idx: dict[str, int] = get_simbot_objects_to_indices_map()
-    _lowercase_label_to_object_label: dict[str, str] = {
-        object_label.lower(): object_label for object_label in _object_label_to_idx.keys()
-    }
+    @property
+    def available_room_names(self) -> set[str]:
+        """Get the names of all the rooms in the arena."""
+        return get_simbot_room_names()
 
     @overrides(check_signature=False)
     def __call__(
@@ -56,7 +51,7 @@ class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
         num_frames_in_current_turn: int = 1,
     ) -> SimBotAction:
         """Convert the decoded trajectory to a sequence of SimBot actions."""
-        logger.debug(f"Decoded trajectory: `{decoded_trajectory}`")
+        logger.debug("Decoded trajectory: `{}`", decoded_trajectory)
         dummy_action = self.should_return_dummy_action(decoded_trajectory)
         if dummy_action is not None:
             logger.debug("The decoded trajectory matches with a dummy action")
@@ -102,9 +97,8 @@ class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
         self, deconstructed_action: SimBotDeconstructedAction
     ) -> SimBotAction:
         """Return an executable low level navigation action."""
-        return SimBotAction(
-            id=0,
-            type=deconstructed_action.action_type.base_type,
+        return SimBotAction.from_payload(
+            action_type=deconstructed_action.action_type.base_type,
             payload=deconstructed_action.action_type.payload_model(),
             raw_output=deconstructed_action.raw_action,
         )
@@ -121,9 +115,8 @@ class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
             num_frames_in_current_turn=num_frames_in_current_turn,
             extracted_features=extracted_features,
         )
-        return SimBotAction(
-            id=0,
-            type=deconstructed_action.action_type,
+        return SimBotAction.from_payload(
+            action_type=deconstructed_action.action_type,
             raw_output=deconstructed_action.raw_action,
             payload=SimBotObjectInteractionPayload(
                 object=SimBotInteractionObject(
@@ -142,9 +135,8 @@ class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
     ) -> SimBotAction:
         """Return an executable goto action."""
         if deconstructed_action.class_name in self.available_room_names:
-            return SimBotAction(
-                id=0,
-                type=SimBotActionType.GotoRoom,
+            return SimBotAction.from_payload(
+                action_type=SimBotActionType.GotoRoom,
                 raw_output=deconstructed_action.raw_action,
                 payload=SimBotGotoRoomPayload(
                     object=SimBotGotoRoom(officeRoom=deconstructed_action.class_name)
@@ -157,9 +149,8 @@ class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
             extracted_features=extracted_features,
         )
 
-        return SimBotAction(
-            id=0,
-            type=SimBotActionType.GotoObject,
+        return SimBotAction.from_payload(
+            action_type=SimBotActionType.GotoObject,
             raw_output=deconstructed_action.raw_action,
             payload=SimBotGotoObjectPayload(
                 object=SimBotGotoObject(
@@ -174,9 +165,8 @@ class SimBotActionPredictorOutputParser(NeuralParser[SimBotAction]):
         """Should we for some reason return a dummy action?"""
         decoded_trajectory_str = decoded_trajectory.replace(MODEL_EOS_TOKEN, "")
         if decoded_trajectory_str == SimBotDummyRawActions.DummyLookDown.value:
-            return SimBotAction(
-                id=0,
-                type=SimBotActionType.LookDown,
+            return SimBotAction.from_payload(
+                action_type=SimBotActionType.LookDown,
                 raw_output=decoded_trajectory,
                 payload=SimBotLookPayload(
                     direction="Down",
@@ -26,7 +26,7 @@ class SimBotCROutputParser(NeuralParser[SimBotIntent[SimBotCRIntentType]]):
             - <act><missing_inventory> object_name
             - <search>
         """
-        logger.debug(f"CR output text: `{output_text}`")
+        logger.debug("CR output text: `{}`", output_text)
 
         # Split the raw output text by the given delimiter. We assume it's a " " separating the
         # special tokens and the object_name.
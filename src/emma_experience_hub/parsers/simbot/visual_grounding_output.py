@@ -15,7 +15,7 @@ class SimBotVisualGroundingOutputParser(Parser[list[str], Optional[SimBotSceneOb
 
     def __call__(self, model_output: list[str]) -> Optional[SimBotSceneObjectTokens]:
         """Convert the raw model output into a deconstructed action that we can use."""
-        logger.debug(f"Raw model output: `{model_output}`")
+        logger.debug("Raw model output: `{}`", model_output)
 
         if not model_output:
             logger.info("Model was not able to find the object.")
@@ -1,7 +1,10 @@
+from concurrent.futures import Executor
+from functools import partial
 from typing import Callable, Optional
 
 from loguru import logger
 
+from emma_common.datamodels import EnvironmentStateTurn
 from emma_experience_hub.api.clients.simbot import (
     SimbotActionPredictionClient,
     SimBotFeaturesClient,
@@ -12,8 +15,15 @@ from emma_experience_hub.datamodels.simbot import (
     SimBotIntentType,
     SimBotPhysicalInteractionIntentType,
     SimBotSession,
+    SimBotSessionTurn,
+    SimBotSessionTurnIntent,
 )
 from emma_experience_hub.datamodels.simbot.payloads import SimBotObjectInteractionPayload
+from emma_experience_hub.functions.simbot import (
+    ActionPredictionInputs,
+    EnvironmentHistoryCache,
+    SpeculativeActionPredictions,
+)
 from emma_experience_hub.functions.simbot.viewpoint_iterator import ViewpointPlanner
 from emma_experience_hub.parsers.simbot import (
     SimBotActionPredictorOutputParser,
@@ -22,10 +32,15 @@ from emma_experience_hub.parsers.simbot import (
 from emma_experience_hub.pipelines.simbot.find_object import SimBotFindObjectPipeline
 
 
+# The environment state history given to the action predictor, and the raw prediction
+RawActionPrediction = tuple[list[EnvironmentStateTurn], str]
+
+
 class SimBotAgentActionGenerationPipeline:
     """Generate an environment interaction for the agent to perform on the environment.
 
-    This class does not handle choosing or generating dialog actions.
+    This class does not handle choosing or generating dialog actions. If speculative prediction is
+    enabled, the action can be predicted while CR is still deciding whether the agent should act.
     """
 
     entities_we_should_replace_the_mask = ("embiggenator",)
@@ -37,13 +52,22 @@ class SimBotAgentActionGenerationPipeline:
         action_predictor_response_parser: SimBotActionPredictorOutputParser,
         previous_action_parser: SimBotPreviousActionParser,
         find_object_pipeline: SimBotFindObjectPipeline,
+        executor: Optional[Executor] = None,
+        enable_speculative_prediction: bool = False,
     ) -> None:
         self._features_client = features_client
+        self._executor = executor
         self._action_predictor_client = action_predictor_client
         self._action_predictor_response_parser = action_predictor_response_parser
         self._previous_action_parser = previous_action_parser
         self._find_object_pipeline = find_object_pipeline
         self._viewpoint_action_planner = ViewpointPlanner()
+        self._environment_history = EnvironmentHistoryCache()
+
+        self._speculative_predictions: Optional[SpeculativeActionPredictions[RawActionPrediction]]
+        self._speculative_predictions = (
+            SpeculativeActionPredictions() if enable_speculative_prediction else None
+        )
 
     def run(self, session: SimBotSession) -> Optional[SimBotAction]:
         """Generate an action to perform on the environment."""
@@ -56,7 +80,8 @@ class SimBotAgentActionGenerationPipeline:
             )
         except KeyError:
             logger.debug(
-                f"Agent intent ({session.current_turn.intent.physical_interaction}) does not require the agent to generate an action that interacts with the environment."
+                "Agent intent ({}) does not require the agent to generate an action that interacts with the environment.",
+                session.current_turn.intent.physical_interaction,
             )
             return None
 
@@ -70,6 +95,37 @@ class SimBotAgentActionGenerationPipeline:
         """Generate an action when we want to just act."""
         return self._predict_action_from_emma_policy(session)
 
+    def speculate_action(self, session: SimBotSession) -> Callable[[], None]:
+        """Start predicting the action for the turn, before knowing whether the agent will act.
+
+        Returns a function which discards the prediction, if it turns out not to be needed.
+        """
+        if self._speculative_predictions is None:
+            return lambda: None
+
+        # Everything the prediction needs is taken from the session now, since the session keeps
+        # changing while the prediction runs in the background
+        turns_within_interaction_window = self._get_turns_for_action_prediction(session)
+        relevant_turns = self._get_relevant_turns_for_action_prediction(
+            turns_within_interaction_window
+        )
+        prediction_inputs = self._get_action_prediction_inputs(
+            session, turns_within_interaction_window, relevant_turns
+        )
+        self._speculative_predictions.start(
+            session.session_id,
+            prediction_inputs,
+            partial(
+                self._predict_raw_action, session.session_id, relevant_turns, prediction_inputs
+            ),
+        )
+        return partial(self._speculative_predictions.discard, session.session_id)
+
+    def shutdown(self) -> None:
+        """Stop predicting actions speculatively."""
+        if self._speculative_predictions is not None:
+            self._speculative_predictions.shutdown()
+
     def handle_act_previous_intent(self, session: SimBotSession) -> Optional[SimBotAction]:
         """Get the action from the previous turn."""
         # If there is a routine is in progress, continue it
@@ -96,27 +152,27 @@ class SimBotAgentActionGenerationPipeline:
 
     def _predict_action_from_emma_policy(self, session: SimBotSession) -> Optional[SimBotAction]:
         """Generate an action from the EMMA policy client."""
-        if session.current_turn.utterance_from_queue:
-            turns_within_interaction_window = session.get_turns_since_last_user_utterance()
-        else:
-            turns_within_interaction_window = session.get_turns_within_interaction_window()
-
-        environment_state_history = session.get_environment_state_history_from_turns(
-            turns_within_interaction_window,
-            self._features_client.get_features,
-        )
-
-        dialogue_history = session.get_dialogue_history_from_session_turns(
+        turns_within_interaction_window = self._get_turns_for_action_prediction(session)
+        relevant_turns = self._get_relevant_turns_for_action_prediction(
             turns_within_interaction_window
         )
-
-        raw_action_prediction = self._action_predictor_client.generate(
-            dialogue_history=dialogue_history,
-            environment_state_history=environment_state_history,
-            force_stop_token=session.current_turn.utterance_from_agent_plan,
-            inventory_entity=session.current_state.inventory.entity,
+        prediction_inputs = self._get_action_prediction_inputs(
+            session, turns_within_interaction_window, relevant_turns
         )
 
+        speculative_prediction = None
+        if self._speculative_predictions is not None:
+            speculative_prediction = self._speculative_predictions.claim(
+                session.session_id, prediction_inputs
+            )
+
+        if speculative_prediction is not None:
+            environment_state_history, raw_action_prediction = speculative_prediction
+        else:
+            environment_state_history, raw_action_prediction = self._predict_raw_action(
+                session.session_id, relevant_turns, prediction_inputs
+            )
+
         # Get the flattened list of extracted features from the state history
         extracted_features = [
             feats for turn in environment_state_history for feats in turn.features
@@ -141,6 +197,81 @@ class SimBotAgentActionGenerationPipeline:
 
         return action if self._should_execute_action(session, action) else None
 
+    def _get_turns_for_action_prediction(self, session: SimBotSession) -> list[SimBotSessionTurn]:
+        """Get the turns which are given to the action predictor."""
+        if session.current_turn.utterance_from_queue:
+            return session.get_turns_since_last_user_utterance()
+        return session.get_turns_within_interaction_window()
+
+    def _get_relevant_turns_for_action_prediction(
+        self, turns_within_interaction_window: list[SimBotSessionTurn]
+    ) -> list[SimBotSessionTurn]:
+        """Get a copy of the turns whose visual frames are given to the action predictor.
+
+        The current turn is always the last turn in the window. It is treated as acting on the
+        environment, since the action is only predicted for it if it will be, and its intent is
+        not set until intent selection has finished.
+        """
+        *previous_turns, current_turn = turns_within_interaction_window
+        relevant_turns = [
+            turn.copy(update={"actions": turn.actions.copy(deep=True)})
+            for turn in SimBotSession.get_turns_which_change_visual_frames(previous_turns)
+        ]
+        current_turn_intent = SimBotSessionTurnIntent(
+            physical_interaction=SimBotIntent(type=SimBotIntentType.act_one_match)
+        )
+        relevant_turns.append(
+            current_turn.copy(
+                update={
+                    "intent": current_turn_intent,
+                    "actions": current_turn.actions.copy(deep=True),
+                }
+            )
+        )
+        return relevant_turns
+
+    def _get_action_prediction_inputs(
+        self,
+        session: SimBotSession,
+        turns_within_interaction_window: list[SimBotSessionTurn],
+        relevant_turns: list[SimBotSessionTurn],
+    ) -> ActionPredictionInputs:
+        """Get everything that the action prediction depends on."""
+        return ActionPredictionInputs(
+            turn_ids=tuple(turn.prediction_request_id for turn in turns_within_interaction_window),
+            relevant_turn_ids=tuple(turn.prediction_request_id for turn in relevant_turns),
+            dialogue_history=session.get_dialogue_history_from_session_turns(
+                turns_within_interaction_window
+            ),
+            force_stop_token=session.current_turn.utterance_from_agent_plan,
+            inventory_entity=session.current_state.inventory.entity,
+        )
+
+    def _predict_raw_action(
+        self,
+        session_id: str,
+        relevant_turns: list[SimBotSessionTurn],
+        prediction_inputs: ActionPredictionInputs,
+    ) -> RawActionPrediction:
+        """Load the environment state history and predict the action from it.
+
+        This only uses the given turns and inputs, so that it can run in the background.
+        """
+        environment_state_history = self._environment_history.get_environment_state_history(
+            session_id,
+            relevant_turns,
+            self._features_client.get_features,
+            self._executor,
+        )
+
+        raw_action_prediction = self._action_predictor_client.generate(
+            dialogue_history=prediction_inputs.dialogue_history,
+            environment_state_history=environment_state_history,
+            force_stop_token=prediction_inputs.force_stop_token,
+            inventory_entity=prediction_inputs.inventory_entity,
+        )
+        return environment_state_history, raw_action_prediction
+
     def _should_execute_action(self, session: SimBotSession, action: SimBotAction) -> bool:
         """Should the agent execute the action predicted by the emma policy model?
 
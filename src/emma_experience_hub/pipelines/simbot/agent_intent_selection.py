@@ -15,6 +15,7 @@ from emma_experience_hub.datamodels.simbot import (
     SimBotSession,
     SimBotUserIntentType,
 )
+from emma_experience_hub.functions.simbot import CRIntentCache
 from emma_experience_hub.functions.simbot.agent_intent_selection import (
     SimBotActHandler,
     SimBotClarificationHandler,
@@ -67,6 +68,8 @@ class SimBotAgentIntentSelectionPipeline:
         _enable_search_after_no_match: bool = True,
         _enable_search_after_missing_inventory: bool = True,
         _enable_high_level_planner: bool = True,
+        speculate_action_fn: Optional[Callable[[SimBotSession], Callable[[], None]]] = None,
+        cr_intent_cache: Optional[CRIntentCache] = None,
     ) -> None:
         self.clarification_handler = SimBotClarificationHandler()
         self._features_client = features_client
@@ -80,6 +83,8 @@ class SimBotAgentIntentSelectionPipeline:
             _enable_search_after_no_match=_enable_search_after_no_match,
             _enable_search_after_missing_inventory=_enable_search_after_missing_inventory,
             _enable_high_level_planner=_enable_high_level_planner,
+            speculate_action_fn=speculate_action_fn,
+            cr_intent_cache=cr_intent_cache,
         )
         self._environment_error_pipeline = environment_error_pipeline
 
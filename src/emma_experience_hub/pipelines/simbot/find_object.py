@@ -20,6 +20,7 @@ from emma_experience_hub.functions.simbot import (
     BasicSearchPlanner,
     GrabFromHistory,
     GreedyMaximumVertexCoverSearchPlanner,
+    GreedyMaximumVertexCoverTourSearchPlanner,
     SearchPlanner,
     SimBotSceneObjectTokens,
     class_label_is_unique_in_frame,
@@ -46,6 +47,8 @@ class SimBotFindObjectPipeline:
         enable_grab_from_history: bool = True,
         _enable_scanning_found_object: bool = True,
         scan_area_threshold: float = 200,
+        enable_batched_grounding: bool = False,
+        enable_cross_room_grab_from_history: bool = False,
     ) -> None:
         self._features_client = features_client
 
@@ -54,9 +57,12 @@ class SimBotFindObjectPipeline:
 
         self._search_planner = search_planner
         self._enable_grab_from_history = enable_grab_from_history
-        self._grab_from_history = GrabFromHistory()
+        self._grab_from_history = GrabFromHistory(
+            enable_cross_room=enable_cross_room_grab_from_history
+        )
         self._enable_scanning_found_object = _enable_scanning_found_object
         self._scan_area_threshold = scan_area_threshold
+        self._enable_batched_grounding = enable_batched_grounding
 
     @classmethod
     def from_planner_type(
@@ -69,12 +75,25 @@ class SimBotFindObjectPipeline:
         gfh_location_type: GFHLocationType = GFHLocationType.location,
         _enable_scanning_found_object: bool = True,
         scan_area_threshold: float = 200,
+        enable_batched_grounding: bool = False,
+        enable_cross_room_grab_from_history: bool = False,
     ) -> "SimBotFindObjectPipeline":
-        """Instantiate the pipeline from the SearchPlannerType."""
+        """Instantiate the pipeline from the SearchPlannerType.
+
+        When batched grounding is enabled, the planners look around at each location so that all
+        the frames from the location are grounded in a single request.
+        """
         planners = {
-            SearchPlannerType.basic: BasicSearchPlanner(),
+            SearchPlannerType.basic: BasicSearchPlanner(use_look_around=enable_batched_grounding),
             SearchPlannerType.greedy_max_vertex_cover: GreedyMaximumVertexCoverSearchPlanner(
                 gfh_location_type=gfh_location_type,
+                use_look_around=enable_batched_grounding,
+            ),
+            SearchPlannerType.greedy_max_vertex_cover_tour: (
+                GreedyMaximumVertexCoverTourSearchPlanner(
+                    gfh_location_type=gfh_location_type,
+                    use_look_around=enable_batched_grounding,
+                )
             ),
         }
 
@@ -86,6 +105,8 @@ class SimBotFindObjectPipeline:
             enable_grab_from_history=enable_grab_from_history,
             _enable_scanning_found_object=_enable_scanning_found_object,
             scan_area_threshold=scan_area_threshold,
+            enable_batched_grounding=enable_batched_grounding,
+            enable_cross_room_grab_from_history=enable_cross_room_grab_from_history,
         )
 
     def run(self, session: SimBotSession) -> Optional[SimBotAction]:  # noqa: WPS212
@@ -235,8 +256,53 @@ class SimBotFindObjectPipeline:
         if scene_object_tokens is None:
             raise AssertionError("Unable to get scene object tokens from the model output.")
 
+        if self._enable_batched_grounding and len(extracted_features) > 1:
+            return self._select_largest_view_of_object(scene_object_tokens, extracted_features)
         return scene_object_tokens
 
+    def _select_largest_view_of_object(
+        self,
+        scene_object_tokens: SimBotSceneObjectTokens,
+        extracted_features: list[EmmaExtractedFeatures],
+    ) -> SimBotSceneObjectTokens:
+        """Select the frame with the largest view of the grounded object.
+
+        When every frame from a location is grounded at once, the same object can be seen in more
+        than one frame. If the object is the only one of its class in each frame, use the frame
+        where it is largest, which gives the best mask to go to.
+        """
+        if scene_object_tokens.object_index is None:
+            return scene_object_tokens
+
+        object_label = get_class_name_from_special_tokens(
+            scene_object_tokens.frame_index, scene_object_tokens.object_index, extracted_features
+        )
+        if not class_label_is_unique_in_frame(
+            scene_object_tokens.frame_index, object_label, extracted_features
+        ):
+            return scene_object_tokens
+
+        best_scene_object_tokens = scene_object_tokens
+        best_area = (
+            extracted_features[scene_object_tokens.frame_index - 1]
+            .bbox_areas[scene_object_tokens.object_index - 1]
+            .item()
+        )
+        for frame_index, frame_features in enumerate(extracted_features, start=1):
+            frame_labels = frame_features.entity_labels or []
+            if frame_labels.count(object_label) != 1:
+                continue
+
+            object_index = frame_labels.index(object_label) + 1
+            area = frame_features.bbox_areas[object_index - 1].item()
+            if area > best_area:
+                best_area = area
+                best_scene_object_tokens = SimBotSceneObjectTokens(
+                    frame_index=frame_index, object_index=object_index
+                )
+
+        return best_scene_object_tokens
+
     def _create_actions_for_found_object(
         self,
         session: SimBotSession,
@@ -369,9 +435,8 @@ class SimBotFindObjectPipeline:
         else:
             output_suffix = PREDICTED_ACTION_DELIMITER
         raw_output = f"{action_type.value} <frame_token_{frame_index}> <vis_token_{object_index}> {output_suffix}"
-        return SimBotAction(
-            id=0,
-            type=action_type,
+        return SimBotAction.from_payload(
+            action_type=action_type,
             raw_output=raw_output,
             payload=SimBotObjectInteractionPayload(
                 object=SimBotInteractionObject(
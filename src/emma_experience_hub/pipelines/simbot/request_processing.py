@@ -49,7 +49,7 @@ class SimBotRequestProcessingPipeline:
                     session_turn.speech.utterance
                 )
 
-        logger.debug(f"Current turn: {session.current_turn}")
+        logger.debug("Current turn: {}", session.current_turn)
 
         if session_turn != session.current_turn:
             logger.error(
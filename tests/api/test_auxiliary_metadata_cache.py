@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import pytest
+
+from emma_experience_hub.api.clients.simbot import SimBotAuxiliaryMetadataClient
+from emma_experience_hub.datamodels.simbot.payloads import (
+    SimBotAuxiliaryMetadataPayload,
+    SimBotAuxiliaryMetadataUri,
+)
+
+
+def test_cached_auxiliary_metadata_loads_without_the_original_file(
+    simbot_game_metadata_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    auxiliary_metadata = SimBotAuxiliaryMetadataPayload.from_efs_uri(
+        "efs://sample-game-metadata.json"
+    )
+    cache_client = SimBotAuxiliaryMetadataClient(local_cache_dir=tmp_path)
+    cache_client.save(auxiliary_metadata, "session", "request")
+
+    def resolve_path(*args: object) -> Path:  # noqa: WPS430
+        raise AssertionError("The original metadata file should not be read again.")
+
+    monkeypatch.setattr(SimBotAuxiliaryMetadataUri, "resolve_path", resolve_path)
+
+    assert cache_client.load("session", "request") == auxiliary_metadata
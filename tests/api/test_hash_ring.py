@@ -0,0 +1,50 @@
+from collections import Counter
+
+from emma_experience_hub.api.dispatcher import ConsistentHashRing
+
+
+SESSION_IDS = [f"amzn1.echo-api.session.{session_idx}" for session_idx in range(2000)]
+NODES = [f"http://127.0.0.1:{5001 + node_idx}" for node_idx in range(4)]
+
+
+def test_same_session_always_goes_to_the_same_node() -> None:
+    ring = ConsistentHashRing(NODES)
+
+    for session_id in SESSION_IDS[:100]:
+        assert ring.get_node(session_id) == ring.get_node(session_id)
+
+
+def test_sessions_are_spread_across_all_nodes() -> None:
+    ring = ConsistentHashRing(NODES)
+
+    sessions_per_node = Counter(ring.get_node(session_id) for session_id in SESSION_IDS)
+
+    assert set(sessions_per_node) == set(NODES)
+    assert min(sessions_per_node.values()) > len(SESSION_IDS) / len(NODES) / 2
+
+
+def test_removing_a_node_only_moves_its_own_sessions() -> None:
+    ring = ConsistentHashRing(NODES)
+    owners_before = {session_id: ring.get_node(session_id) for session_id in SESSION_IDS}
+
+    ring.remove(NODES[0])
+
+    for session_id, owner in owners_before.items():
+        if owner != NODES[0]:
+            assert ring.get_node(session_id) == owner
+        else:
+            assert ring.get_node(session_id) != NODES[0]
+
+
+def test_adding_a_node_back_restores_the_original_owners() -> None:
+    ring = ConsistentHashRing(NODES)
+    owners_before = {session_id: ring.get_node(session_id) for session_id in SESSION_IDS}
+
+    ring.remove(NODES[1])
+    ring.add(NODES[1])
+
+    assert owners_before == {session_id: ring.get_node(session_id) for session_id in SESSION_IDS}
+
+
+def test_empty_ring_has_no_owner() -> None:
+    assert ConsistentHashRing().get_node("session") is None
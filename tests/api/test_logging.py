@@ -0,0 +1,33 @@
+import logging
+import sys
+
+from loguru import logger
+
+from emma_experience_hub.api.observability import setup_enqueued_logging, truncate_for_logging
+
+
+def test_short_bodies_are_not_truncated() -> None:
+    assert truncate_for_logging("body", max_length=10) == "body"
+
+
+def test_long_bodies_are_truncated() -> None:
+    truncated_body = truncate_for_logging("a" * 25, max_length=10)
+
+    assert truncated_body.startswith("a" * 10)
+    assert truncated_body.endswith("(15 more characters)")
+
+
+def test_standard_logging_is_sent_to_loguru() -> None:
+    root_handlers = logging.getLogger().handlers
+    logged_messages: list[str] = []
+
+    setup_enqueued_logging()
+    logger.add(logged_messages.append, format="{message}")
+    try:
+        logging.getLogger("uvicorn").warning("Started server process")
+    finally:
+        logger.remove()
+        logger.add(sys.stderr)
+        logging.getLogger().handlers = root_handlers
+
+    assert logged_messages == ["Started server process\n"]
@@ -0,0 +1,30 @@
+from fastapi.testclient import TestClient
+from pytest import MonkeyPatch
+
+from emma_common.datamodels import DialogueUtterance, SpeakerRole
+from emma_experience_hub.api.controllers import SimBotController
+from emma_experience_hub.api.simbot import app, state
+from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.datamodels.simbot import SimBotIntent, SimBotIntentType
+
+
+def test_most_used_cr_intent_cache_utterances_are_in_the_metrics(
+    simbot_settings: SimBotSettings, monkeypatch: MonkeyPatch
+) -> None:
+    feature_flags = simbot_settings.feature_flags.copy(update={"enable_cr_intent_cache": True})
+    controller = SimBotController.from_simbot_settings(
+        simbot_settings.copy(update={"feature_flags": feature_flags})
+    )
+    monkeypatch.setitem(state, "controller", controller)
+
+    cr_intent_cache = controller.pipelines.cr_intent_cache
+    assert cr_intent_cache is not None
+    cache_key = cr_intent_cache.create_key(
+        [DialogueUtterance(utterance="Open the fridge.", role=SpeakerRole.user)], None, []
+    )
+    cr_intent_cache.set(cache_key, SimBotIntent(type=SimBotIntentType.act_one_match))
+    cr_intent_cache.get(cache_key)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.json()["cr_intent_cache_most_used_utterances"] == {"user: open the fridge": 1}
@@ -0,0 +1,84 @@
+from typing import Callable
+
+import pytest
+import torch
+
+from emma_common.datamodels import (
+    DialogueUtterance,
+    EmmaPolicyRequest,
+    EnvironmentStateTurn,
+    SpeakerRole,
+    TorchDataMixin,
+)
+from emma_experience_hub.api.clients.policy_framing import (
+    PolicyRequestFramer,
+    decode_framed_policy_request,
+)
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+
+
+def _create_request(environment_history: list[EnvironmentStateTurn]) -> EmmaPolicyRequest:
+    return EmmaPolicyRequest(
+        dialogue_history=[DialogueUtterance(utterance="look around", role=SpeakerRole.user)],
+        environment_history=environment_history,
+        force_stop_token=True,
+    )
+
+
+def test_framed_request_decodes_to_the_same_request(
+    random_features_factory: Callable[[], EmmaExtractedFeatures],
+) -> None:
+    environment_history = [
+        EnvironmentStateTurn(
+            features=[random_features_factory(), random_features_factory()], output="turn"
+        ),
+        EnvironmentStateTurn(features=[random_features_factory()], output=None),
+    ]
+    request = _create_request(environment_history)
+
+    decoded_request = decode_framed_policy_request(
+        b"".join(PolicyRequestFramer().to_frames(request))
+    )
+
+    assert decoded_request.dialogue_history == request.dialogue_history
+    assert decoded_request.force_stop_token == request.force_stop_token
+    assert len(decoded_request.environment_history) == len(environment_history)
+    for decoded_turn, turn in zip(decoded_request.environment_history, environment_history):
+        assert decoded_turn.output == turn.output
+        assert len(decoded_turn.features) == len(turn.features)
+        for decoded_features, features in zip(decoded_turn.features, turn.features):
+            assert torch.equal(decoded_features.bbox_features, features.bbox_features)
+            assert decoded_features.class_labels == features.class_labels
+
+
+def test_features_are_only_serialised_the_first_time(
+    monkeypatch: pytest.MonkeyPatch, random_features_factory: Callable[[], EmmaExtractedFeatures]
+) -> None:
+    serialised_objects = []
+    to_bytes = TorchDataMixin.to_bytes
+
+    def count_to_bytes(data: object) -> bytes:  # noqa: WPS430
+        serialised_objects.append(data)
+        return to_bytes(data)
+
+    monkeypatch.setattr(TorchDataMixin, "to_bytes", count_to_bytes)
+
+    framer = PolicyRequestFramer()
+    history_features = [random_features_factory(), random_features_factory()]
+    first_turn = EnvironmentStateTurn(features=history_features[:1], output=None)
+    b"".join(framer.to_frames(_create_request([first_turn])))
+
+    # The first turn now has an output, and a new turn has been added
+    next_turns = [
+        EnvironmentStateTurn(features=history_features[:1], output="turn"),
+        EnvironmentStateTurn(features=history_features[1:], output=None),
+    ]
+    serialised_objects.clear()
+    b"".join(framer.to_frames(_create_request(next_turns)))
+
+    serialised_features = [
+        serialised
+        for serialised in serialised_objects
+        if isinstance(serialised, EmmaExtractedFeatures)
+    ]
+    assert len(serialised_features) == 1
@@ -0,0 +1,166 @@
+from typing import Any, Callable, Optional
+
+import torch
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from emma_common.datamodels import (
+    DialogueUtterance,
+    EmmaPolicyRequest,
+    EnvironmentStateTurn,
+    SpeakerRole,
+    TorchDataMixin,
+)
+from emma_experience_hub.api.clients.policy_framing import PolicyRequestFramer
+from emma_experience_hub.api.clients.policy_references import (
+    FEATURE_REFERENCES_CONTENT_TYPE,
+    FeatureReferenceRequestBuilder,
+)
+from emma_experience_hub.api.clients.shared_memory import SharedFeatureArena
+from emma_experience_hub.api.clients.simbot import SimbotActionPredictionClient
+from emma_experience_hub.api.policy_stand_in import PolicyStandIn, create_policy_stand_in_app
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+
+
+def _create_client(
+    stand_in: PolicyStandIn,
+    endpoint: str = "http://policy",
+    shared_arena: Optional[SharedFeatureArena] = None,
+) -> SimbotActionPredictionClient:
+    return SimbotActionPredictionClient(
+        endpoint,
+        timeout=None,
+        enable_feature_references=True,
+        transport=stand_in.as_transport(),
+        shared_arena=shared_arena,
+    )
+
+
+def _generate(
+    client: SimbotActionPredictionClient, environment_history: list[EnvironmentStateTurn]
+) -> str:
+    return client.generate(
+        environment_history,
+        [DialogueUtterance(utterance="look around", role=SpeakerRole.user)],
+    )
+
+
+def test_features_are_only_sent_once(
+    random_features_factory: Callable[[], EmmaExtractedFeatures],
+) -> None:
+    stand_in = PolicyStandIn()
+    client = _create_client(stand_in)
+    history_features = [random_features_factory(), random_features_factory()]
+
+    _generate(client, [EnvironmentStateTurn(features=history_features[:1], output=None)])
+    next_turns = [
+        EnvironmentStateTurn(features=history_features[:1], output="turn"),
+        EnvironmentStateTurn(features=history_features[1:], output=None),
+    ]
+    _generate(client, next_turns)
+
+    assert len(stand_in.feature_cache) == len(history_features)
+    assert stand_in.received_bytes[1] < 2 * stand_in.received_bytes[0]
+
+    decoded_history = stand_in.received_requests[-1].environment_history
+    assert [turn.output for turn in decoded_history] == ["turn", None]
+    for decoded_turn, turn in zip(decoded_history, next_turns):
+        assert torch.equal(
+            decoded_turn.features[0].bbox_features, turn.features[0].bbox_features
+        )
+
+
+def test_missing_features_are_sent_again(
+    random_features_factory: Callable[[], EmmaExtractedFeatures],
+) -> None:
+    stand_in = PolicyStandIn()
+    client = _create_client(stand_in)
+    environment_history = [EnvironmentStateTurn(features=[random_features_factory()], output=None)]
+
+    _generate(client, environment_history)
+
+    # The server has restarted, so it no longer has the features
+    stand_in.feature_cache = PolicyStandIn().feature_cache
+    _generate(client, environment_history)
+
+    assert len(stand_in.received_requests) == 2
+    assert len(stand_in.received_bytes) == 3
+    assert len(stand_in.feature_cache) == 1
+
+
+def test_local_server_reads_features_from_shared_memory(
+    random_features_factory: Callable[[], EmmaExtractedFeatures],
+) -> None:
+    stand_in = PolicyStandIn()
+    features = random_features_factory()
+    shared_arena = SharedFeatureArena(size=1024 * 1024)
+    client = _create_client(stand_in, "http://localhost:6000", shared_arena)
+
+    try:
+        _generate(client, [EnvironmentStateTurn(features=[features], output=None)])
+    finally:
+        shared_arena.close()
+
+    assert len(stand_in.received_bytes) == 1
+    assert stand_in.received_bytes[0] < len(TorchDataMixin.to_bytes(features))
+    decoded_features = stand_in.received_requests[0].environment_history[0].features[0]
+    assert torch.equal(decoded_features.bbox_features, features.bbox_features)
+
+
+def test_overwritten_shared_features_are_attached_instead(
+    random_features_factory: Callable[[], EmmaExtractedFeatures],
+) -> None:
+    stand_in = PolicyStandIn()
+    history_features = [random_features_factory(), random_features_factory()]
+    features_size = max(len(TorchDataMixin.to_bytes(features)) for features in history_features)
+
+    # The second features wrap around the ring and overwrite the first
+    shared_arena = SharedFeatureArena(size=features_size * 3 // 2)
+    client = _create_client(stand_in, "http://localhost:6000", shared_arena)
+
+    try:
+        _generate(client, [EnvironmentStateTurn(features=history_features, output=None)])
+    finally:
+        shared_arena.close()
+
+    assert len(stand_in.received_bytes) == 2
+    assert len(stand_in.received_requests) == 1
+    assert len(stand_in.feature_cache) == len(history_features)
+
+
+def test_local_server_keeps_the_features_it_received(
+    random_features_factory: Callable[[], EmmaExtractedFeatures],
+) -> None:
+    stand_in = PolicyStandIn()
+    test_client = TestClient(create_policy_stand_in_app(stand_in))
+    reference_builder = FeatureReferenceRequestBuilder(PolicyRequestFramer())
+    policy_request = EmmaPolicyRequest(
+        dialogue_history=[DialogueUtterance(utterance="look around", role=SpeakerRole.user)],
+        environment_history=[
+            EnvironmentStateTurn(features=[random_features_factory()], output=None)
+        ],
+        force_stop_token=False,
+    )
+
+    def post(body_chunks: list[bytes]) -> Any:  # noqa: WPS430
+        return test_client.post(
+            "/generate",
+            content=b"".join(body_chunks),
+            headers={"content-type": FEATURE_REFERENCES_CONTENT_TYPE},
+        )
+
+    body_chunks, attached_digests = reference_builder.build(policy_request)
+    first_response = post(body_chunks)
+    reference_builder.mark_as_sent(attached_digests)
+    body_chunks, _ = reference_builder.build(policy_request)
+    second_response = post(body_chunks)
+
+    # The server has restarted, so it no longer has the features
+    stand_in.feature_cache = PolicyStandIn().feature_cache
+    restarted_response = post(body_chunks)
+
+    assert test_client.get("/ping").json() == "success"
+    assert first_response.status_code == second_response.status_code == status.HTTP_200_OK
+    assert len(stand_in.received_requests) == 2
+    assert restarted_response.status_code == status.HTTP_409_CONFLICT
+    assert restarted_response.json() == {"missing": attached_digests}
@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+
+from pytest_cases import fixture
+
+
+# Modules which are slow to import, and are only needed once a command actually runs
+HEAVY_MODULES = (
+    "torch",
+    "numpy",
+    "PIL",
+    "httpx",
+    "fastapi",
+    "emma_common",
+    "emma_experience_hub.api",
+    "emma_experience_hub.datamodels",
+)
+
+IMPORT_SCRIPT = """
+import json, sys
+import emma_experience_hub.commands.simbot.cli
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@fixture(scope="module")
+def cli_imported_modules() -> set[str]:
+    """Import the CLI in a fresh interpreter, so that nothing has been imported already."""
+    completed_process = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT], check=True, capture_output=True, text=True
+    )
+    return set(json.loads(completed_process.stdout.splitlines()[-1]))
+
+
+def test_cli_import_does_not_load_heavy_modules(cli_imported_modules: set[str]) -> None:
+    loaded_heavy_modules = [
+        module_name for module_name in HEAVY_MODULES if module_name in cli_imported_modules
+    ]
+
+    assert not loaded_heavy_modules
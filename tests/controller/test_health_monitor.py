@@ -0,0 +1,64 @@
+from typing import Any
+
+from pytest import MonkeyPatch
+
+from emma_experience_hub.api.clients import FeatureExtractorClient
+from emma_experience_hub.api.clients.simbot import (
+    SimbotActionPredictionClient,
+    SimBotCRIntentClient,
+    SimBotPlaceholderVisionClient,
+)
+from emma_experience_hub.api.controllers.simbot.clients import SimBotControllerClients
+from emma_experience_hub.api.controllers.simbot.health_monitor import SimBotHealthMonitor
+from emma_experience_hub.common.settings import SimBotSettings
+
+
+def _mock_remote_healthchecks(monkeypatch: MonkeyPatch, *, cr_is_healthy: bool) -> None:
+    """Mock the healthchecks for every client that makes a request."""
+
+    def healthy(*args: Any, **kwargs: Any) -> bool:  # noqa: WPS430
+        return True
+
+    def cr_healthcheck(*args: Any, **kwargs: Any) -> bool:  # noqa: WPS430
+        if not cr_is_healthy:
+            raise ConnectionError("CR service is down")
+        return True
+
+    monkeypatch.setattr(FeatureExtractorClient, "healthcheck", healthy)
+    monkeypatch.setattr(SimBotPlaceholderVisionClient, "healthcheck", healthy)
+    monkeypatch.setattr(SimbotActionPredictionClient, "healthcheck", healthy)
+    monkeypatch.setattr(SimBotCRIntentClient, "healthcheck", cr_healthcheck)
+
+
+def test_health_monitor_is_unhealthy_before_first_check(simbot_settings: SimBotSettings) -> None:
+    clients = SimBotControllerClients.from_simbot_settings(simbot_settings)
+    health_monitor = SimBotHealthMonitor(clients)
+
+    assert not health_monitor.is_healthy
+
+
+def test_health_monitor_caches_each_client(
+    simbot_settings: SimBotSettings, monkeypatch: MonkeyPatch
+) -> None:
+    _mock_remote_healthchecks(monkeypatch, cr_is_healthy=True)
+    clients = SimBotControllerClients.from_simbot_settings(simbot_settings)
+    health_monitor = SimBotHealthMonitor(clients)
+
+    assert health_monitor.refresh()
+    assert set(health_monitor.health.keys()) == set(dict(clients).keys())
+
+    for client_health in health_monitor.health.values():
+        assert client_health.is_healthy
+        assert client_health.latency is not None
+
+
+def test_health_monitor_reports_client_that_errors(
+    simbot_settings: SimBotSettings, monkeypatch: MonkeyPatch
+) -> None:
+    _mock_remote_healthchecks(monkeypatch, cr_is_healthy=False)
+    clients = SimBotControllerClients.from_simbot_settings(simbot_settings)
+    health_monitor = SimBotHealthMonitor(clients)
+
+    assert not health_monitor.refresh()
+    assert not health_monitor.health["cr_intent"].is_healthy
+    assert health_monitor.health["features"].is_healthy
@@ -0,0 +1,48 @@
+from time import sleep
+
+from hypothesis import given, settings, strategies as st
+
+from emma_experience_hub.api.controllers.simbot.executor import SimBotIOExecutor
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+from emma_experience_hub.datamodels.simbot import SimBotSession, SimBotSessionTurn
+from tests.fixtures.simbot_actions import simbot_session_turns
+
+
+executor = SimBotIOExecutor(max_workers=4, max_queue_size=2)
+
+
+@settings(deadline=None, max_examples=20)
+@given(turns=st.lists(simbot_session_turns(), min_size=1, max_size=8))
+def test_environment_history_from_executor_is_in_order(turns: list[SimBotSessionTurn]) -> None:
+    turn_positions = {id(turn): turn_idx for turn_idx, turn in enumerate(turns)}
+
+    def load_features(turn: SimBotSessionTurn) -> list[EmmaExtractedFeatures]:  # noqa: WPS430
+        # Earlier turns take longer to load, so they finish out of order
+        sleep(0.001 * (len(turns) - turn_positions[id(turn)]))
+        return []
+
+    streamed_history = SimBotSession.get_environment_state_history_from_turns(
+        turns, load_features, executor
+    )
+    inline_history = SimBotSession.get_environment_state_history_from_turns(turns, load_features)
+
+    assert streamed_history == inline_history
+    assert executor.queue_depth == 0
+
+
+@settings(deadline=None, max_examples=20)
+@given(turns=st.lists(simbot_session_turns(), min_size=3, max_size=3))
+def test_environment_history_skips_turns_which_fail_to_load(
+    turns: list[SimBotSessionTurn],
+) -> None:
+    def load_features(turn: SimBotSessionTurn) -> list[EmmaExtractedFeatures]:  # noqa: WPS430
+        if turn is turns[1]:
+            raise FileNotFoundError("Features are missing")
+        return []
+
+    environment_history = SimBotSession.get_environment_state_history_from_turns(
+        turns, load_features, executor
+    )
+
+    assert len(environment_history) == len(turns) - 1
+    assert executor.queue_depth == 0
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from time import sleep
+
+from emma_experience_hub.api.controllers.simbot.session_lock import SimBotSessionLock
+
+
+def _run_concurrently(session_lock: SimBotSessionLock, session_ids: list[str]) -> int:
+    """Hold the lock for each session from a separate thread and count the max overlap."""
+    counter_lock = Lock()
+    active = 0
+    max_active = 0
+
+    def hold_lock(session_id: str) -> None:
+        nonlocal active, max_active
+        with session_lock.acquire(session_id):
+            with counter_lock:
+                active += 1
+                max_active = max(max_active, active)
+            sleep(0.05)
+            with counter_lock:
+                active -= 1
+
+    with ThreadPoolExecutor(max_workers=len(session_ids)) as executor:
+        list(executor.map(hold_lock, session_ids))
+
+    return max_active
+
+
+def test_requests_for_the_same_session_are_serialised(tmp_path: Path) -> None:
+    session_lock = SimBotSessionLock(tmp_path)
+
+    assert _run_concurrently(session_lock, ["session"] * 4) == 1
+
+
+def test_requests_for_different_sessions_run_concurrently(tmp_path: Path) -> None:
+    session_lock = SimBotSessionLock(tmp_path)
+
+    assert _run_concurrently(session_lock, [f"session-{idx}" for idx in range(4)]) > 1
+
+
+def test_in_process_locks_are_released(tmp_path: Path) -> None:
+    session_lock = SimBotSessionLock(tmp_path)
+
+    with session_lock.acquire("session"):
+        pass
+
+    assert not session_lock._thread_locks  # noqa: WPS437
+
+
+def test_lock_files_are_removed(tmp_path: Path) -> None:
+    session_lock = SimBotSessionLock(tmp_path)
+
+    _run_concurrently(session_lock, ["session"] * 4 + [f"session-{idx}" for idx in range(4)])
+
+    assert not list(tmp_path.glob("*.lock"))
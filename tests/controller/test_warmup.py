@@ -0,0 +1,30 @@
+from pathlib import Path
+from typing import Any
+
+from emma_experience_hub.api.controllers import SimBotController
+from emma_experience_hub.api.controllers.simbot.warmup import warm_up_controller
+from emma_experience_hub.common.settings import SimBotSettings
+
+
+def _list_directories(simbot_settings: SimBotSettings) -> dict[Path, set[Path]]:
+    directories = (
+        simbot_settings.auxiliary_metadata_dir,
+        simbot_settings.auxiliary_metadata_cache_dir,
+        simbot_settings.extracted_features_cache_dir,
+    )
+    return {directory: set(directory.iterdir()) for directory in directories}
+
+
+def test_warm_up_does_not_persist_anything(
+    simbot_settings: SimBotSettings,
+    mock_feature_extraction_response: Any,
+    mock_policy_response_toggle_computer: Any,
+) -> None:
+    controller = SimBotController.from_simbot_settings(simbot_settings)
+    session_db_file = controller.clients.session_db._db_file  # noqa: WPS437
+    directories_before_warmup = _list_directories(simbot_settings)
+
+    warm_up_controller(controller)
+
+    assert _list_directories(simbot_settings) == directories_before_warmup
+    assert controller.clients.session_db._db_file == session_db_file  # noqa: WPS437
@@ -0,0 +1,112 @@
+import torch
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+from emma_experience_hub.datamodels.common import Position, RotationQuaternion
+from emma_experience_hub.datamodels.simbot.agent_memory import SimBotObjectMemory
+
+
+CROWDED_FRAME_LABELS = [f"label{label_idx}" for label_idx in range(20)]
+
+
+def _create_crowded_frames(
+    num_frames: int = 4, num_objects: int = 100
+) -> list[EmmaExtractedFeatures]:
+    """Create frames with many objects, where each label is detected many times."""
+    generator = torch.Generator().manual_seed(0)
+    crowded_frames = []
+    for _ in range(num_frames):
+        top_left = torch.randint(0, 150, (num_objects, 2), generator=generator)
+        size = torch.randint(1, 150, (num_objects, 2), generator=generator)
+        crowded_frames.append(
+            EmmaExtractedFeatures.parse_obj(
+                {
+                    "bbox_features": torch.rand(num_objects, 3, generator=generator),
+                    "bbox_coords": torch.cat([top_left, top_left + size], dim=1),
+                    "bbox_probas": torch.rand(num_objects, 4, generator=generator),
+                    "cnn_features": torch.tensor([1, 2]),
+                    "class_labels": CROWDED_FRAME_LABELS,
+                    "entity_labels": [
+                        CROWDED_FRAME_LABELS[object_idx % len(CROWDED_FRAME_LABELS)]
+                        for object_idx in range(num_objects)
+                    ],
+                    "width": 300,
+                    "height": 300,
+                }
+            )
+        )
+    return crowded_frames
+
+
+def _write_features_in_rooms(
+    extracted_features: list[EmmaExtractedFeatures], room_turns: dict[str, int]
+) -> SimBotObjectMemory:
+    """Write the same features in each room, at the given turn."""
+    memory = SimBotObjectMemory()
+    for room_name, turn_index in room_turns.items():
+        memory.write_memory_entities_in_room(
+            room_name=room_name,
+            position=Position(x=0, y=0, z=0),
+            rotation=RotationQuaternion(x=0, y=0, z=0, w=1),
+            viewpoint=f"{room_name}_1",
+            extracted_features=extracted_features,
+            turn_index=turn_index,
+        )
+    return memory
+
+
+def test_memory_entities_in_arena_are_ordered_by_recency_for_the_same_area(
+    simbot_extracted_features: list[EmmaExtractedFeatures],
+) -> None:
+    memory = _write_features_in_rooms(simbot_extracted_features, {"Lab1": 1, "Lab2": 3})
+    object_label = simbot_extracted_features[0].entity_labels[0]  # type: ignore[index]
+
+    memory_entities = memory.read_memory_entities_in_arena(object_label)
+
+    assert [room_name for room_name, _ in memory_entities] == ["Lab2", "Lab1"]
+    assert [memory_entity.last_seen_turn for _, memory_entity in memory_entities] == [3, 1]
+
+
+def test_memory_index_is_rebuilt_after_loading(
+    simbot_extracted_features: list[EmmaExtractedFeatures],
+) -> None:
+    memory = _write_features_in_rooms(simbot_extracted_features, {"Lab1": 1, "Lab2": 3})
+    loaded_memory = SimBotObjectMemory.parse_raw(memory.json())
+
+    for object_label in memory.memory["Lab1"]:
+        assert loaded_memory.read_memory_entity_in_arena(
+            object_label
+        ) == memory.read_memory_entity_in_arena(object_label)
+    assert not loaded_memory.read_memory_entity_in_arena("unseen object")
+
+
+def test_memory_writes_keep_the_largest_area_of_each_object() -> None:
+    crowded_frames = _create_crowded_frames()
+    memory = _write_features_in_rooms(crowded_frames, {"Lab1": 1})
+
+    largest_areas: dict[str, float] = {}
+    for frame_features in crowded_frames:
+        object_labels = frame_features.entity_labels or []
+        for object_label, object_area in zip(object_labels, frame_features.bbox_areas.tolist()):
+            largest_areas[object_label] = max(largest_areas.get(object_label, 0), object_area)
+
+    assert {
+        object_label: memory_entity.area
+        for object_label, memory_entity in memory.memory["Lab1"].items()
+    } == largest_areas
+
+
+def test_crowded_memory_writes_benchmark(benchmark: BenchmarkFixture) -> None:
+    crowded_frames = _create_crowded_frames()
+    memory = _write_features_in_rooms(crowded_frames, {"Lab1": 1})
+
+    benchmark(
+        memory.write_memory_entities_in_room,
+        room_name="Lab1",
+        position=Position(x=0, y=0, z=0),
+        rotation=RotationQuaternion(x=0, y=0, z=0, w=1),
+        viewpoint="Lab1_1",
+        extracted_features=crowded_frames,
+        turn_index=2,
+    )
+    assert len(memory.memory["Lab1"]) == len(CROWDED_FRAME_LABELS)
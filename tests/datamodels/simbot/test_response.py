@@ -0,0 +1,66 @@
+import json
+
+import orjson
+from hypothesis import given, strategies as st
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from emma_experience_hub.datamodels.simbot import SimBotAction, SimBotActionType, SimBotResponse
+from emma_experience_hub.datamodels.simbot.payloads import (
+    SimBotGotoRoom,
+    SimBotGotoRoomPayload,
+    SimBotInteractionObject,
+    SimBotObjectInteractionPayload,
+    SimBotObjectOutputType,
+)
+from tests.fixtures.simbot_actions import simbot_actions
+
+
+def _create_response(actions: list[SimBotAction]) -> SimBotResponse:
+    return SimBotResponse(
+        sessionId="amzn1.echo-api.session.1",
+        predictionRequestId="request-1",
+        objectOutputType=SimBotObjectOutputType.object_mask,
+        actions=actions,
+    )
+
+
+@given(actions=st.lists(simbot_actions(), min_size=1, max_size=5))
+def test_response_json_bytes_equal_pydantic_json(actions: list[SimBotAction]) -> None:
+    simbot_response = _create_response(actions)
+
+    assert orjson.loads(simbot_response.to_json_bytes()) == json.loads(
+        simbot_response.json(by_alias=True)
+    )
+
+
+def test_response_json_bytes_convert_action_types_of_statuses() -> None:
+    action = SimBotAction(
+        id=0,
+        type=SimBotActionType.GotoRoom,
+        payload=SimBotGotoRoomPayload(object=SimBotGotoRoom(officeRoom="Lab1")),
+    )
+    action.mark_as_successful()
+    simbot_response = _create_response([action])
+
+    assert orjson.loads(simbot_response.to_json_bytes()) == json.loads(
+        simbot_response.json(by_alias=True)
+    )
+
+
+def test_response_json_bytes_benchmark(benchmark: BenchmarkFixture) -> None:
+    simbot_response = _create_response(
+        [
+            SimBotAction(
+                id=0,
+                type=SimBotActionType.Pickup,
+                payload=SimBotObjectInteractionPayload(
+                    object=SimBotInteractionObject(
+                        name="Apple", colorImageIndex=0, mask=[[100, 200]] * 50
+                    )
+                ),
+            )
+        ]
+    )
+
+    response_body = benchmark(simbot_response.to_json_bytes)
+    assert orjson.loads(response_body)["actions"][0]["type"] == "Pickup"
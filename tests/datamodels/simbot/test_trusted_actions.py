@@ -0,0 +1,116 @@
+from typing import Callable, Optional
+
+from hypothesis import given, strategies as st
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_cases import parametrize
+
+from emma_experience_hub.constants.model import END_OF_TRAJECTORY_TOKEN, PREDICTED_ACTION_DELIMITER
+from emma_experience_hub.datamodels.common import Position, RotationQuaternion
+from emma_experience_hub.datamodels.simbot import SimBotAction, SimBotActionType
+from emma_experience_hub.datamodels.simbot.payloads import (
+    SimBotGotoPosition,
+    SimBotGotoPositionPayload,
+    SimBotGotoRoom,
+    SimBotGotoRoomPayload,
+    SimBotGotoViewpoint,
+    SimBotGotoViewpointPayload,
+    SimBotLookAroundPayload,
+    SimBotMoveForwardPayload,
+    SimBotObjectInteractionPayload,
+    SimBotPayload,
+    SimBotRotatePayload,
+)
+from emma_experience_hub.datamodels.simbot.session import SimBotSessionTurnActions
+from tests.fixtures.simbot_actions import simbot_object_interaction_payloads
+
+
+raw_outputs = st.sampled_from(
+    [
+        None,
+        f"turn left{PREDICTED_ACTION_DELIMITER}",
+        f"turn left {END_OF_TRAJECTORY_TOKEN}{PREDICTED_ACTION_DELIMITER}",
+        "turn left without delimiter",
+    ]
+)
+
+CONTROLLER_ACTIONS = [
+    (
+        SimBotActionType.GotoViewpoint,
+        SimBotGotoViewpointPayload(object=SimBotGotoViewpoint(goToPoint="Lab1_1")),
+    ),
+    (
+        SimBotActionType.GotoPosition,
+        SimBotGotoPositionPayload(
+            object=SimBotGotoPosition(
+                position=Position(x=1, y=0, z=2), rotation=RotationQuaternion(x=0, y=0, z=0, w=1)
+            )
+        ),
+    ),
+    (SimBotActionType.GotoRoom, SimBotGotoRoomPayload(object=SimBotGotoRoom(officeRoom="Lab1"))),
+    (SimBotActionType.RotateLeft, SimBotRotatePayload(direction="Left", magnitude=90)),
+    (SimBotActionType.LookAround, SimBotLookAroundPayload()),
+    (SimBotActionType.MoveForward, SimBotMoveForwardPayload(magnitude=0)),
+]
+
+
+def _create_validated_action(
+    action_type: SimBotActionType, payload: SimBotPayload, raw_output: Optional[str]
+) -> SimBotAction:
+    return SimBotAction(id=0, type=action_type, payload=payload, raw_output=raw_output)
+
+
+@parametrize("action_type, payload", CONTROLLER_ACTIONS)
+@given(raw_output=raw_outputs)
+def test_action_from_payload_equals_validated_action(
+    action_type: SimBotActionType, payload: SimBotPayload, raw_output: Optional[str]
+) -> None:
+    action = SimBotAction.from_payload(action_type, payload, raw_output=raw_output)
+    validated_action = _create_validated_action(action_type, payload, raw_output)
+
+    assert action.type == validated_action.type
+    assert action.raw_output == validated_action.raw_output
+    assert action.json(by_alias=True) == validated_action.json(by_alias=True)
+
+
+@given(
+    action_type=st.sampled_from(SimBotActionType.object_interaction()),
+    payload=simbot_object_interaction_payloads(),
+    raw_output=raw_outputs,
+)
+def test_object_interaction_from_payload_equals_validated_action(
+    action_type: SimBotActionType,
+    payload: SimBotObjectInteractionPayload,
+    raw_output: Optional[str],
+) -> None:
+    action = SimBotAction.from_payload(action_type, payload, raw_output=raw_output)
+    validated_action = _create_validated_action(action_type, payload, raw_output)
+
+    assert action.type == validated_action.type
+    assert action.json(by_alias=True) == validated_action.json(by_alias=True)
+
+
+@parametrize("create_action", [_create_validated_action, SimBotAction.from_payload])
+def test_create_controller_actions_benchmark(
+    create_action: Callable[[SimBotActionType, SimBotPayload, Optional[str]], SimBotAction],
+    benchmark: BenchmarkFixture,
+) -> None:
+    def create_controller_actions() -> list[SimBotAction]:  # noqa: WPS430
+        return [
+            create_action(action_type, payload, f"action{PREDICTED_ACTION_DELIMITER}")
+            for action_type, payload in CONTROLLER_ACTIONS
+        ]
+
+    actions = benchmark(create_controller_actions)
+    assert len(actions) == len(CONTROLLER_ACTIONS)
+
+
+def test_assign_turn_actions_benchmark(benchmark: BenchmarkFixture) -> None:
+    action = SimBotAction.from_payload(*CONTROLLER_ACTIONS[0])
+    turn_actions = SimBotSessionTurnActions()
+
+    def assign_actions() -> None:  # noqa: WPS430
+        turn_actions.interaction = action
+        turn_actions.interaction = None
+
+    benchmark(assign_actions)
+    assert turn_actions.interaction is None
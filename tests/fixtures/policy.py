@@ -0,0 +1,24 @@
+from typing import Callable
+
+import torch
+from pytest_cases import fixture
+
+from emma_common.datamodels import EmmaExtractedFeatures
+
+
+@fixture
+def random_features_factory() -> Callable[[], EmmaExtractedFeatures]:
+    """Factory for features with random values, so that no two features are the same."""
+
+    def create_random_features() -> EmmaExtractedFeatures:  # noqa: WPS430
+        return EmmaExtractedFeatures(
+            bbox_features=torch.randn(3, 10),
+            bbox_coords=torch.randn(3, 4),
+            bbox_probas=torch.randn(3, 10),
+            cnn_features=torch.randn(3, 10),
+            class_labels=["label1", "label2"],
+            width=100,
+            height=300,
+        )
+
+    return create_random_features
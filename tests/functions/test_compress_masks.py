@@ -6,6 +6,7 @@ from pytest_cases import fixture
 from emma_experience_hub.datamodels.simbot.agent_memory import get_area_from_compressed_mask
 from emma_experience_hub.functions.simbot.masks import (
     alexa_compress_segmentation_mask,
+    compress_bbox_segmentation_mask,
     tensor_compress_segmntation_mask,
 )
 
@@ -25,6 +26,27 @@ def create_random_mask(
     return torch.randint(0, 2, (drawn_mask_size, drawn_mask_size))
 
 
+@st.composite
+def create_random_bbox(
+    draw: st.DrawFn, mask_size: st.SearchStrategy[int] = st.integers(1, 20)
+) -> tuple[tuple[float, float, float, float], int, int]:
+    width = draw(mask_size)
+    height = draw(mask_size)
+    coordinate = st.floats(-5, 25, allow_nan=False)
+    bbox = (draw(coordinate), draw(coordinate), draw(coordinate), draw(coordinate))
+    return bbox, width, height
+
+
+def _compress_dense_bbox_mask(
+    bbox: tuple[float, float, float, float], width: int, height: int
+) -> list[list[int]]:
+    """Compress the bbox the way it used to be done, by filling a dense mask."""
+    x_min, y_min, x_max, y_max = bbox
+    mask = torch.zeros((width, height))
+    mask[int(y_min) : int(y_max) + 1, int(x_min) : int(x_max) + 1] = 1  # noqa: WPS221
+    return tensor_compress_segmntation_mask(mask)
+
+
 def test_alexa_compress_mask_benchmark(mask: torch.Tensor, benchmark: BenchmarkFixture) -> None:
     compressed_mask = benchmark(alexa_compress_segmentation_mask, mask)
     assert compressed_mask
@@ -48,3 +70,25 @@ def test_get_area_from_compressed_mask(mask: torch.Tensor) -> None:
     area_from_decompressed_mask = mask.sum().item()
     area_from_compressed_mask = get_area_from_compressed_mask(compressed_mask)
     assert area_from_decompressed_mask == area_from_compressed_mask
+
+
+def test_dense_bbox_compress_mask_benchmark(benchmark: BenchmarkFixture) -> None:
+    compressed_mask = benchmark(_compress_dense_bbox_mask, (40.0, 50.0, 210.0, 260.0), 300, 300)
+    assert compressed_mask
+
+
+def test_bbox_compress_mask_benchmark(benchmark: BenchmarkFixture) -> None:
+    compressed_mask = benchmark(
+        compress_bbox_segmentation_mask, (40.0, 50.0, 210.0, 260.0), 300, 300
+    )
+    assert compressed_mask
+
+
+@given(bbox_with_size=create_random_bbox())
+def test_bbox_compress_mask_equals_dense_mask(
+    bbox_with_size: tuple[tuple[float, float, float, float], int, int]
+) -> None:
+    bbox, width, height = bbox_with_size
+    assert compress_bbox_segmentation_mask(bbox, width, height) == _compress_dense_bbox_mask(
+        bbox, width, height
+    )
@@ -0,0 +1,91 @@
+from hypothesis import given, strategies as st
+from pytest import MonkeyPatch
+
+from emma_experience_hub.datamodels.common import Position, RotationQuaternion
+from emma_experience_hub.datamodels.simbot import session as session_module
+from emma_experience_hub.datamodels.simbot.session import SimBotSessionTurnEnvironment
+from emma_experience_hub.functions.coordinates import (
+    ViewpointLayoutKey,
+    get_closest_position_index_to_reference,
+    get_viewpoint_layout_key,
+    get_viewpoint_spatial_index,
+)
+
+
+ROOM_NAME = "Lab1"
+
+coordinate = st.floats(-10, 10, allow_nan=False)
+positions = st.builds(Position, x=coordinate, y=st.just(0), z=coordinate)
+
+
+@st.composite
+def create_viewpoints(draw: st.DrawFn) -> dict[str, Position]:
+    room_positions = draw(st.lists(positions, min_size=1, max_size=15))
+    other_positions = draw(st.lists(positions, max_size=5))
+    return {
+        **{f"{ROOM_NAME}_{idx}": position for idx, position in enumerate(room_positions)},
+        **{f"Warehouse_{idx}": position for idx, position in enumerate(other_positions)},
+    }
+
+
+@given(viewpoints=create_viewpoints(), reference=positions)
+def test_nearest_viewpoint_equals_closest_position(
+    viewpoints: dict[str, Position], reference: Position
+) -> None:
+    room_viewpoints = {
+        name: position for name, position in viewpoints.items() if name.startswith(ROOM_NAME)
+    }
+    expected_index = get_closest_position_index_to_reference(reference, room_viewpoints.values())
+
+    room_index = get_viewpoint_spatial_index(viewpoints).get_room(ROOM_NAME)
+
+    assert room_index.get_nearest(reference) == list(room_viewpoints.keys())[expected_index]
+
+
+@given(viewpoints=create_viewpoints(), reference=positions, k=st.integers(1, 5))
+def test_k_nearest_viewpoints_are_sorted_by_distance(
+    viewpoints: dict[str, Position], reference: Position, k: int
+) -> None:
+    room_index = get_viewpoint_spatial_index(viewpoints).get_room(ROOM_NAME)
+
+    k_nearest = room_index.get_k_nearest(reference, k)
+    distances = room_index.get_squared_distances(reference)
+    k_nearest_distances = [distances[room_index.names.index(name)] for name in k_nearest]
+
+    assert len(k_nearest) == min(k, len(room_index))
+    assert k_nearest[0] == room_index.get_nearest(reference)
+    assert k_nearest_distances == sorted(k_nearest_distances)
+
+
+def test_spatial_index_is_shared_by_identical_layouts() -> None:
+    viewpoints = {f"{ROOM_NAME}_{idx}": Position(x=idx, y=0, z=idx) for idx in range(5)}
+
+    spatial_index = get_viewpoint_spatial_index(viewpoints)
+
+    assert get_viewpoint_spatial_index(dict(viewpoints)) is spatial_index
+    assert spatial_index.get_room(ROOM_NAME) is spatial_index.get_room(ROOM_NAME)
+
+
+def test_environment_only_builds_the_layout_key_once(monkeypatch: MonkeyPatch) -> None:
+    viewpoints = {f"{ROOM_NAME}_{idx}": Position(x=idx, y=0, z=idx) for idx in range(5)}
+    environment = SimBotSessionTurnEnvironment(
+        current_room=ROOM_NAME,
+        current_position=Position(x=1, y=0, z=1),
+        current_rotation=RotationQuaternion(x=0, y=0, z=0, w=1),
+        unique_room_names={ROOM_NAME},
+        viewpoints=viewpoints,
+    )
+    built_layout_keys = []
+
+    def build_layout_key(viewpoints: dict[str, Position]) -> ViewpointLayoutKey:  # noqa: WPS430
+        built_layout_keys.append(viewpoints)
+        return get_viewpoint_layout_key(viewpoints)
+
+    monkeypatch.setattr(session_module, "get_viewpoint_layout_key", build_layout_key)
+
+    room_index = environment.current_room_spatial_index
+
+    assert environment.current_room_spatial_index is room_index
+    assert environment.get_closest_viewpoint_name() == f"{ROOM_NAME}_1"
+    assert len(built_layout_keys) == 1
+    assert "_viewpoint_layout_key" not in environment.dict()
@@ -0,0 +1,98 @@
+from hypothesis import given, settings
+
+from emma_common.datamodels import DialogueUtterance, SpeakerRole
+from emma_experience_hub.api.observability import metrics
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+from emma_experience_hub.datamodels.simbot import SimBotIntent, SimBotIntentType
+from emma_experience_hub.functions.simbot import CRIntentCache
+from tests.fixtures.simbot_actions import simbot_extracted_features
+
+
+def _create_utterances(utterance: str) -> list[DialogueUtterance]:
+    return [DialogueUtterance(utterance=utterance, role=SpeakerRole.user)]
+
+
+@settings(deadline=None, max_examples=20)
+@given(extracted_features=simbot_extracted_features())
+def test_same_request_with_different_formatting_is_cached(
+    extracted_features: list[EmmaExtractedFeatures],
+) -> None:
+    metrics.reset()
+    cr_intent_cache = CRIntentCache()
+    intent = SimBotIntent(type=SimBotIntentType.act_one_match)
+
+    cache_key = cr_intent_cache.create_key(
+        _create_utterances("Open the fridge."), None, extracted_features
+    )
+    similar_key = cr_intent_cache.create_key(
+        _create_utterances("open  the fridge"), None, extracted_features
+    )
+    cr_intent_cache.set(cache_key, intent)
+    cached_intent = cr_intent_cache.get(similar_key)
+
+    assert cached_intent == intent
+    assert metrics.snapshot()["counters"]["cr_intent_cache_hits"] == 1
+    assert cr_intent_cache.get_most_used_utterances() == [("user: open the fridge", 1)]
+
+
+@settings(deadline=None, max_examples=20)
+@given(extracted_features=simbot_extracted_features())
+def test_request_with_other_entities_in_view_is_not_cached(
+    extracted_features: list[EmmaExtractedFeatures],
+) -> None:
+    cr_intent_cache = CRIntentCache()
+    utterances = _create_utterances("open the fridge")
+
+    cr_intent_cache.set(
+        cr_intent_cache.create_key(utterances, None, extracted_features),
+        SimBotIntent(type=SimBotIntentType.act_one_match),
+    )
+    other_features = [
+        features.copy(update={"entity_labels": ["Unseen Entity"]})
+        for features in extracted_features
+    ]
+
+    other_entities_key = cr_intent_cache.create_key(utterances, None, other_features)
+    other_inventory_key = cr_intent_cache.create_key(utterances, "Mug", extracted_features)
+
+    assert cr_intent_cache.get(other_entities_key) is None
+    assert cr_intent_cache.get(other_inventory_key) is None
+
+
+def test_expired_intents_are_not_used() -> None:
+    cr_intent_cache = CRIntentCache(ttl=0)
+    cache_key = cr_intent_cache.create_key(_create_utterances("open the fridge"), None, [])
+
+    cr_intent_cache.set(cache_key, SimBotIntent(type=SimBotIntentType.act_one_match))
+
+    assert cr_intent_cache.get(cache_key) is None
+    assert not cr_intent_cache
+
+
+def test_least_recently_used_intent_is_dropped_when_full() -> None:
+    cr_intent_cache = CRIntentCache(max_size=2)
+    cache_keys = [
+        cr_intent_cache.create_key(_create_utterances(utterance), None, [])
+        for utterance in ("open the fridge", "pick up the mug", "find the bowl")
+    ]
+
+    for cache_key in cache_keys:
+        cr_intent_cache.set(cache_key, SimBotIntent(type=SimBotIntentType.act_one_match))
+
+    assert len(cr_intent_cache) == 2
+    assert cr_intent_cache.get(cache_keys[0]) is None
+    assert cr_intent_cache.get(cache_keys[-1]) is not None
+
+
+def test_hits_are_dropped_with_the_intent() -> None:
+    cr_intent_cache = CRIntentCache(max_size=1)
+    fridge_key, mug_key = (
+        cr_intent_cache.create_key(_create_utterances(utterance), None, [])
+        for utterance in ("open the fridge", "pick up the mug")
+    )
+
+    cr_intent_cache.set(fridge_key, SimBotIntent(type=SimBotIntentType.act_one_match))
+    cr_intent_cache.get(fridge_key)
+    cr_intent_cache.set(mug_key, SimBotIntent(type=SimBotIntentType.act_one_match))
+
+    assert not cr_intent_cache.get_most_used_utterances()
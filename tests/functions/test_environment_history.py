@@ -0,0 +1,52 @@
+from hypothesis import given, settings, strategies as st
+
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+from emma_experience_hub.datamodels.simbot import SimBotSession, SimBotSessionTurn
+from emma_experience_hub.functions.simbot import EnvironmentHistoryCache
+from tests.fixtures.simbot_actions import simbot_session_turns
+
+
+def _with_unique_request_ids(turns: list[SimBotSessionTurn]) -> list[SimBotSessionTurn]:
+    return [
+        turn.copy(update={"prediction_request_id": f"request-{turn_idx}"})
+        for turn_idx, turn in enumerate(turns)
+    ]
+
+
+@settings(deadline=None, max_examples=20)
+@given(turns=st.lists(simbot_session_turns(), min_size=2, max_size=6))
+def test_each_turn_only_loads_its_own_features(turns: list[SimBotSessionTurn]) -> None:
+    turns = _with_unique_request_ids(turns)
+    loaded_turns: list[str] = []
+
+    def load_features(turn: SimBotSessionTurn) -> list[EmmaExtractedFeatures]:  # noqa: WPS430
+        loaded_turns.append(turn.prediction_request_id)
+        return []
+
+    environment_history = EnvironmentHistoryCache()
+    for num_turns in range(1, len(turns) + 1):
+        window = turns[:num_turns]
+        assert environment_history.get_environment_state_history(
+            "session", window, load_features
+        ) == SimBotSession.get_environment_state_history_from_turns(window, lambda _: [])
+
+    assert loaded_turns == [turn.prediction_request_id for turn in turns]
+
+
+@settings(deadline=None, max_examples=20)
+@given(turns=st.lists(simbot_session_turns(), min_size=4, max_size=4))
+def test_new_window_drops_the_features_from_the_old_window(
+    turns: list[SimBotSessionTurn],
+) -> None:
+    turns = _with_unique_request_ids(turns)
+    loaded_turns: list[str] = []
+
+    def load_features(turn: SimBotSessionTurn) -> list[EmmaExtractedFeatures]:  # noqa: WPS430
+        loaded_turns.append(turn.prediction_request_id)
+        return []
+
+    environment_history = EnvironmentHistoryCache()
+    environment_history.get_environment_state_history("session", turns[:2], load_features)
+    environment_history.get_environment_state_history("session", turns[2:], load_features)
+
+    assert loaded_turns == [turn.prediction_request_id for turn in turns]
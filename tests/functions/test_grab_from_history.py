@@ -0,0 +1,94 @@
+from hypothesis import given, settings
+
+from emma_experience_hub.datamodels.common import Position, RotationQuaternion
+from emma_experience_hub.datamodels.simbot import (
+    SimBotActionType,
+    SimBotIntent,
+    SimBotIntentType,
+    SimBotSession,
+)
+from emma_experience_hub.datamodels.simbot.session import SimBotSessionTurnEnvironment
+from emma_experience_hub.functions.simbot import (
+    GrabFromHistory,
+    GreedyMaximumVertexCoverSearchPlanner,
+)
+from tests.fixtures.simbot_actions import simbot_session
+from tests.fixtures.simbot_arena_constants import create_placeholder_features_frames
+
+
+SEARCHABLE_OBJECT = "label3"
+
+VIEWPOINTS = {
+    "Lab1_1": Position(x=0, y=0, z=0),
+    "Lab2_1": Position(x=10, y=0, z=0),
+    "Lab2_2": Position(x=20, y=0, z=0),
+}
+
+
+def _move_agent_to_room(session: SimBotSession, room_name: str) -> None:
+    """Put the agent at the first viewpoint of the room for the current turn."""
+    viewpoint_name = f"{room_name}_1"
+    session.current_turn.environment = SimBotSessionTurnEnvironment(
+        current_room=room_name,
+        current_position=VIEWPOINTS[viewpoint_name],
+        current_rotation=RotationQuaternion(x=0, y=0, z=0, w=1),
+        unique_room_names={"Lab1", "Lab2"},
+        viewpoints=VIEWPOINTS,
+    )
+
+
+def _start_search_after_seeing_object_in_other_room(session: SimBotSession) -> SimBotSession:
+    """Search for an object from Lab1, which has only been seen in Lab2."""
+    session.turns = session.turns[-1:]
+    session.current_turn.actions.interaction = None
+    session.current_turn.intent.physical_interaction = SimBotIntent(
+        type=SimBotIntentType.search, entity=SEARCHABLE_OBJECT
+    )
+    session.current_state.memory.write_memory_entities_in_room(
+        room_name="Lab2",
+        position=Position(x=12, y=0, z=0),
+        rotation=RotationQuaternion(x=0, y=0, z=0, w=1),
+        viewpoint="Lab2_1",
+        extracted_features=create_placeholder_features_frames(),
+    )
+    _move_agent_to_room(session, "Lab1")
+    return session
+
+
+@settings(deadline=None, max_examples=5)
+@given(session=simbot_session())
+def test_object_seen_in_another_room_is_searched_for_after_going_to_the_room(
+    session: SimBotSession,
+) -> None:
+    session = _start_search_after_seeing_object_in_other_room(session)
+    grab_from_history = GrabFromHistory(enable_cross_room=True)
+    search_planner = GreedyMaximumVertexCoverSearchPlanner()
+
+    planned_actions = grab_from_history(session, search_planner)
+
+    assert [planned_action.type for planned_action in planned_actions] == [
+        SimBotActionType.GotoRoom
+    ]
+    assert "Lab2" in (planned_actions[0].raw_output or "")
+    assert len(session.current_state.utterance_queue) == 1
+
+    # Once in the room, the search starts from where the object was seen
+    _move_agent_to_room(session, "Lab2")
+    planned_actions = grab_from_history(session, search_planner)
+
+    assert planned_actions[0].type == SimBotActionType.GotoPosition
+
+
+@settings(deadline=None, max_examples=5)
+@given(session=simbot_session())
+def test_object_seen_in_another_room_is_searched_for_in_the_current_room_by_default(
+    session: SimBotSession,
+) -> None:
+    session = _start_search_after_seeing_object_in_other_room(session)
+
+    planned_actions = GrabFromHistory()(session, GreedyMaximumVertexCoverSearchPlanner())
+
+    assert SimBotActionType.GotoRoom not in {
+        planned_action.type for planned_action in planned_actions
+    }
+    assert not session.current_state.utterance_queue
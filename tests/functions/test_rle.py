@@ -0,0 +1,76 @@
+import numpy as np
+from hypothesis import given, strategies as st
+from hypothesis.extra.numpy import arrays
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_cases import fixture, parametrize
+
+from emma_experience_hub.functions.rle import (
+    decode_rle,
+    encode_rle,
+    encode_rle_batch,
+    rle_area,
+    rle_intersection_area,
+    rle_iou,
+    rle_union_area,
+)
+from emma_experience_hub.functions.simbot.masks import alexa_compress_segmentation_mask
+
+
+mask_shapes = st.tuples(st.integers(1, 20), st.integers(1, 20))
+mask_stack_shapes = st.tuples(st.integers(1, 5), st.integers(1, 10), st.integers(1, 10))
+
+
+@fixture(scope="module")
+def mask() -> np.ndarray:
+    """Mask for the benchmark."""
+    mask_size = 300
+    return np.random.default_rng(0).integers(0, 2, (mask_size, mask_size))
+
+
+@st.composite
+def create_mask_pair(draw: st.DrawFn) -> tuple[np.ndarray, np.ndarray]:
+    shape = draw(mask_shapes)
+    return draw(arrays(np.bool_, shape)), draw(arrays(np.bool_, shape))
+
+
+def test_encode_rle_benchmark(mask: np.ndarray, benchmark: BenchmarkFixture) -> None:
+    compressed_mask = benchmark(encode_rle, mask)
+    assert compressed_mask
+
+
+@given(mask=arrays(np.bool_, mask_shapes))
+def test_encode_rle_equals_alexa(mask: np.ndarray) -> None:
+    assert encode_rle(mask) == alexa_compress_segmentation_mask(mask.astype(int))
+
+
+@given(mask=arrays(np.bool_, mask_shapes))
+def test_decode_rle_inverts_encode(mask: np.ndarray) -> None:
+    assert np.array_equal(decode_rle(encode_rle(mask), mask.shape), mask)
+
+
+@given(mask=arrays(np.bool_, mask_shapes))
+def test_rle_area_equals_mask_sum(mask: np.ndarray) -> None:
+    assert rle_area(encode_rle(mask)) == mask.sum()
+
+
+@given(masks=arrays(np.bool_, mask_stack_shapes))
+def test_encode_rle_batch_equals_single(masks: np.ndarray) -> None:
+    assert encode_rle_batch(masks) == [encode_rle(mask) for mask in masks]
+
+
+@parametrize("masks", [[], np.zeros((0, 10, 10), dtype=np.bool_)])
+def test_encode_rle_batch_with_no_masks(masks: np.ndarray) -> None:
+    assert encode_rle_batch(masks) == []
+
+
+@given(mask_pair=create_mask_pair())
+def test_rle_overlaps_equal_dense_overlaps(mask_pair: tuple[np.ndarray, np.ndarray]) -> None:
+    mask, other_mask = mask_pair
+    rle, other_rle = encode_rle(mask), encode_rle(other_mask)
+
+    intersection_area = (mask & other_mask).sum()
+    union_area = (mask | other_mask).sum()
+
+    assert rle_intersection_area(rle, other_rle) == intersection_area
+    assert rle_union_area(rle, other_rle) == union_area
+    assert rle_iou(rle, other_rle) == (intersection_area / union_area if union_area else 0)
@@ -0,0 +1,97 @@
+from typing import Optional
+
+import numpy as np
+from hypothesis import given, strategies as st
+
+from emma_experience_hub.datamodels.common import Position
+from emma_experience_hub.functions.coordinates import RoomSpatialIndex, get_viewpoint_spatial_index
+from emma_experience_hub.functions.simbot import GreedyMaximumVertexCoverSearchPlanner
+from emma_experience_hub.functions.simbot.search_coverage import (
+    RoomSearchCoverage,
+    SearchCoverageCache,
+)
+
+
+ROOM_NAME = "Lab2"
+
+coordinate = st.floats(-10, 10, allow_nan=False)
+positions = st.builds(Position, x=coordinate, y=st.just(0), z=coordinate)
+
+
+@st.composite
+def create_room_search(draw: st.DrawFn) -> tuple[dict[str, Position], Optional[Position], bool]:
+    viewpoints = {
+        f"{ROOM_NAME}_{idx}": position
+        for idx, position in enumerate(draw(st.lists(positions, min_size=1, max_size=15)))
+    }
+    start_position = draw(st.none() | positions)
+    return viewpoints, start_position, draw(st.booleans())
+
+
+def _plan_without_cache(
+    planner: GreedyMaximumVertexCoverSearchPlanner,
+    locations: dict[str, Position],
+    first_selected_idx: Optional[int],
+) -> list[str]:
+    """Plan over all the candidates from scratch."""
+    names = list(locations.keys())
+    coverage_sets = planner.get_coverage_sets(
+        np.array([position.as_list() for position in locations.values()]),
+        current_room=ROOM_NAME,
+    )
+    selected_indices = planner.select_based_on_maximum_coverage(
+        coverage_sets, current_room=ROOM_NAME, first_selected_idx=first_selected_idx
+    )
+    return [names[selected_idx] for selected_idx in selected_indices]
+
+
+@given(room_search=create_room_search())
+def test_cached_plan_equals_plan_without_cache(
+    room_search: tuple[dict[str, Position], Optional[Position], bool]
+) -> None:
+    viewpoints, start_position, start_from_viewpoint = room_search
+    planner = GreedyMaximumVertexCoverSearchPlanner()
+    room_coverage = RoomSearchCoverage(
+        RoomSpatialIndex(viewpoints), planner.search_budget[ROOM_NAME]
+    )
+
+    if start_from_viewpoint:
+        plan = room_coverage.plan(start_viewpoint=next(iter(viewpoints.keys())))
+        expected_plan = _plan_without_cache(planner, viewpoints, first_selected_idx=0)
+    elif start_position is not None:
+        plan = room_coverage.plan(start_position=start_position)
+        expected_plan = _plan_without_cache(
+            planner, {"start_position": start_position, **viewpoints}, first_selected_idx=0
+        )
+    else:
+        plan = room_coverage.plan()
+        expected_plan = _plan_without_cache(planner, viewpoints, first_selected_idx=None)
+
+    assert plan == expected_plan
+
+
+def test_viewpoints_which_are_already_covered_are_not_counted() -> None:
+    viewpoints = {
+        f"{ROOM_NAME}_{idx}": Position(x=x_coord, y=0, z=0)
+        for idx, x_coord in enumerate((0, 4, 5, 8, 9))
+    }
+    room_coverage = RoomSearchCoverage(
+        RoomSpatialIndex(viewpoints),
+        GreedyMaximumVertexCoverSearchPlanner().search_budget[ROOM_NAME],
+    )
+
+    # Once the middle is covered, the viewpoints at either end each cover one new viewpoint
+    assert room_coverage.plan() == [f"{ROOM_NAME}_2", f"{ROOM_NAME}_0", f"{ROOM_NAME}_4"]
+
+
+def test_room_coverage_is_reused_for_the_same_layout() -> None:
+    viewpoints = {f"{ROOM_NAME}_{idx}": Position(x=idx, y=0, z=idx) for idx in range(5)}
+    coverage_cache = SearchCoverageCache(GreedyMaximumVertexCoverSearchPlanner().search_budget)
+
+    room_coverage = coverage_cache.get_room_coverage(
+        ROOM_NAME, get_viewpoint_spatial_index(viewpoints).get_room(ROOM_NAME)
+    )
+
+    assert room_coverage is coverage_cache.get_room_coverage(
+        ROOM_NAME, get_viewpoint_spatial_index(dict(viewpoints)).get_room(ROOM_NAME)
+    )
@@ -0,0 +1,161 @@
+import json
+from pathlib import Path
+
+from hypothesis import given, settings
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_cases import fixture, parametrize
+
+from emma_experience_hub.constants.model import END_OF_TRAJECTORY_TOKEN
+from emma_experience_hub.datamodels.common import Position, RotationQuaternion
+from emma_experience_hub.datamodels.simbot import SimBotAction, SimBotActionType, SimBotSession
+from emma_experience_hub.datamodels.simbot.session import SimBotSessionTurnEnvironment
+from emma_experience_hub.functions.coordinates import (
+    RoomSpatialIndex,
+    get_path_length,
+    get_short_path_order,
+    get_viewpoint_spatial_index,
+)
+from emma_experience_hub.functions.simbot import (
+    GreedyMaximumVertexCoverSearchPlanner,
+    GreedyMaximumVertexCoverTourSearchPlanner,
+)
+from tests.fixtures.simbot_actions import simbot_session
+
+
+@fixture(scope="module")
+def arena_viewpoints(simbot_fixtures_root: Path) -> dict[str, Position]:
+    """Viewpoints from the sample game metadata."""
+    game_metadata = json.loads(
+        simbot_fixtures_root.joinpath("game_metadata/sample-game-metadata.json").read_text()
+    )
+    return {
+        viewpoint_name: Position.parse_obj(position)
+        for viewpoint_name, position in game_metadata["viewPoints"].items()
+    }
+
+
+def _plan_search_tours(
+    planner: GreedyMaximumVertexCoverSearchPlanner, viewpoints: dict[str, Position]
+) -> dict[tuple[str, str], tuple[list[str], float]]:
+    """Plan the search from every viewpoint in the arena, with the path length of each plan."""
+    spatial_index = get_viewpoint_spatial_index(viewpoints)
+    room_names = {viewpoint_name.split("_")[0] for viewpoint_name in viewpoints}
+
+    search_tours = {}
+    for room_name in room_names.intersection(planner.search_budget):
+        room_index = spatial_index.get_room(room_name)
+        room_coverage = planner.coverage_cache.get_room_coverage(room_name, room_index)
+
+        for start_viewpoint in room_index.names:
+            tour_start = room_index.get_coords(start_viewpoint)
+            search_tour = planner.order_selected_viewpoints(
+                room_coverage.plan(start_viewpoint=start_viewpoint),
+                tour_start=tour_start,
+                room_index=room_index,
+            )
+            path_length = get_path_length(
+                tour_start, [room_index.get_coords(name) for name in search_tour]
+            )
+            search_tours[(room_name, start_viewpoint)] = (search_tour, path_length)
+
+    return search_tours
+
+
+def test_search_tour_is_never_longer_than_greedy_order(
+    arena_viewpoints: dict[str, Position]
+) -> None:
+    greedy_tours = _plan_search_tours(GreedyMaximumVertexCoverSearchPlanner(), arena_viewpoints)
+    short_tours = _plan_search_tours(GreedyMaximumVertexCoverTourSearchPlanner(), arena_viewpoints)
+
+    assert greedy_tours.keys() == short_tours.keys()
+    for search_start, (greedy_tour, greedy_path_length) in greedy_tours.items():
+        short_tour, short_path_length = short_tours[search_start]
+        assert sorted(short_tour) == sorted(greedy_tour)
+        assert short_path_length <= greedy_path_length + 1e-6
+
+
+def _start_session_at_viewpoint(
+    session: SimBotSession, viewpoints: dict[str, Position], start_viewpoint: str
+) -> SimBotSession:
+    """Put the agent at the viewpoint for the current turn of the session."""
+    environment = SimBotSessionTurnEnvironment(
+        current_room=start_viewpoint.split("_")[0],
+        current_position=viewpoints[start_viewpoint],
+        current_rotation=RotationQuaternion(x=0, y=0, z=0, w=1),
+        unique_room_names={viewpoint_name.split("_")[0] for viewpoint_name in viewpoints},
+        viewpoints=viewpoints,
+    )
+    session.turns[-1] = session.current_turn.copy(update={"environment": environment})
+    return session
+
+
+def _get_goto_viewpoint_outputs(planned_actions: list[SimBotAction]) -> list[str]:
+    return [
+        planned_action.raw_output or ""
+        for planned_action in planned_actions
+        if planned_action.type == SimBotActionType.GotoViewpoint
+    ]
+
+
+@settings(deadline=None, max_examples=5)
+@given(session=simbot_session())
+def test_look_around_plan_visits_the_same_viewpoints_as_rotating(
+    session: SimBotSession, arena_viewpoints: dict[str, Position]
+) -> None:
+    session = _start_session_at_viewpoint(session, arena_viewpoints, "Lab1_1")
+
+    rotation_plan = GreedyMaximumVertexCoverSearchPlanner().run(session)
+    look_around_plan = GreedyMaximumVertexCoverSearchPlanner(use_look_around=True).run(session)
+
+    goto_viewpoint_outputs = _get_goto_viewpoint_outputs(look_around_plan)
+    assert goto_viewpoint_outputs
+    assert goto_viewpoint_outputs == _get_goto_viewpoint_outputs(rotation_plan)
+
+    # Each location is searched with a single look around, and only the last one ends the search
+    look_around_actions = [
+        planned_action
+        for planned_action in look_around_plan
+        if planned_action.type != SimBotActionType.GotoViewpoint
+    ]
+    assert len(look_around_actions) == len(goto_viewpoint_outputs) + 1
+    assert all(
+        planned_action.type == SimBotActionType.LookAround
+        for planned_action in look_around_actions
+    )
+    assert [
+        END_OF_TRAJECTORY_TOKEN in (planned_action.raw_output or "")
+        for planned_action in look_around_plan
+    ] == [False] * (len(look_around_plan) - 1) + [True]
+    assert len(look_around_plan) < len(rotation_plan)
+
+
+def test_search_tour_without_selected_viewpoints_is_empty() -> None:
+    room_index = RoomSpatialIndex({"Lab2_0": Position(x=0, y=0, z=0)})
+    tour_start = [1.0, 0.0, 1.0]
+
+    assert get_short_path_order(tour_start, []) == []
+    assert get_path_length(tour_start, []) == 0
+    assert not GreedyMaximumVertexCoverTourSearchPlanner().order_selected_viewpoints(
+        [], tour_start=tour_start, room_index=room_index
+    )
+
+
+@parametrize(
+    "planner",
+    [GreedyMaximumVertexCoverSearchPlanner(), GreedyMaximumVertexCoverTourSearchPlanner()],
+    ids=["greedy", "greedy_tour"],
+)
+def test_search_tour_benchmark(
+    planner: GreedyMaximumVertexCoverSearchPlanner,
+    arena_viewpoints: dict[str, Position],
+    benchmark: BenchmarkFixture,
+) -> None:
+    search_tours = benchmark(_plan_search_tours, planner, arena_viewpoints)
+    assert search_tours
+
+    # Every search rotates 3 times from the start, 4 more times for each viewpoint (including going
+    # to it), and then once at the end
+    search_turns = [3 + 4 * len(search_tour) + 1 for search_tour, _ in search_tours.values()]
+    path_lengths = [path_length for _, path_length in search_tours.values()]
+    benchmark.extra_info["expected_search_turns"] = sum(search_turns) / len(search_turns)
+    benchmark.extra_info["expected_path_length"] = sum(path_lengths) / len(path_lengths)
@@ -0,0 +1,93 @@
+from threading import Event
+
+from emma_common.datamodels import DialogueUtterance, SpeakerRole
+from emma_experience_hub.api.observability import metrics
+from emma_experience_hub.functions.simbot import (
+    ActionPredictionInputs,
+    SpeculativeActionPredictions,
+)
+
+
+def _create_inputs(utterance: str = "pick up the apple") -> ActionPredictionInputs:
+    return ActionPredictionInputs(
+        turn_ids=("request-0", "request-1"),
+        relevant_turn_ids=("request-1",),
+        dialogue_history=[DialogueUtterance(utterance=utterance, role=SpeakerRole.user)],
+        force_stop_token=False,
+        inventory_entity=None,
+    )
+
+
+def _get_counter(name: str) -> float:
+    return metrics.snapshot()["counters"].get(name, 0)
+
+
+def test_prediction_is_used_when_the_inputs_are_unchanged() -> None:
+    metrics.reset()
+    speculative_predictions: SpeculativeActionPredictions[str] = SpeculativeActionPredictions()
+
+    speculative_predictions.start("session", _create_inputs(), lambda: "pickup apple")
+
+    assert speculative_predictions.claim("session", _create_inputs()) == "pickup apple"
+    assert _get_counter("speculative_action_predictions_used") == 1
+    assert _get_counter("speculative_action_predictions_wasted") == 0
+
+
+def test_prediction_is_wasted_when_the_inputs_change() -> None:
+    metrics.reset()
+    speculative_predictions: SpeculativeActionPredictions[str] = SpeculativeActionPredictions()
+
+    speculative_predictions.start("session", _create_inputs(), lambda: "pickup apple")
+
+    assert speculative_predictions.claim("session", _create_inputs("pick up the bowl")) is None
+    assert speculative_predictions.claim("session", _create_inputs()) is None
+    assert _get_counter("speculative_action_predictions_wasted") == 1
+
+
+def test_discarded_prediction_is_cancelled_before_it_runs() -> None:
+    metrics.reset()
+    speculative_predictions: SpeculativeActionPredictions[str] = SpeculativeActionPredictions(
+        max_workers=1
+    )
+    release_worker = Event()
+    predicted_sessions = []
+
+    def predict(session_id: str) -> str:  # noqa: WPS430
+        release_worker.wait(timeout=5)
+        predicted_sessions.append(session_id)
+        return "pickup apple"
+
+    speculative_predictions.start("blocking", _create_inputs(), lambda: predict("blocking"))
+    speculative_predictions.start("session", _create_inputs(), lambda: predict("session"))
+    speculative_predictions.discard("session")
+    release_worker.set()
+
+    assert speculative_predictions.claim("blocking", _create_inputs()) == "pickup apple"
+    assert predicted_sessions == ["blocking"]
+    assert _get_counter("speculative_action_predictions_started") == 2
+    assert _get_counter("speculative_action_predictions_wasted") == 1
+
+
+def test_predictions_which_have_not_started_are_cancelled_on_shutdown() -> None:
+    speculative_predictions: SpeculativeActionPredictions[str] = SpeculativeActionPredictions(
+        max_workers=1
+    )
+    worker_started = Event()
+    release_worker = Event()
+    predicted_sessions = []
+
+    def predict(session_id: str) -> str:  # noqa: WPS430
+        worker_started.set()
+        release_worker.wait(timeout=5)
+        predicted_sessions.append(session_id)
+        return "pickup apple"
+
+    speculative_predictions.start("blocking", _create_inputs(), lambda: predict("blocking"))
+    worker_started.wait(timeout=5)
+    speculative_predictions.start("session", _create_inputs(), lambda: predict("session"))
+    speculative_predictions.shutdown()
+    release_worker.set()
+
+    assert speculative_predictions.claim("blocking", _create_inputs()) == "pickup apple"
+    assert speculative_predictions.claim("session", _create_inputs()) is None
+    assert predicted_sessions == ["blocking"]
@@ -0,0 +1,75 @@
+import torch
+from pytest_cases import fixture
+
+from emma_experience_hub.api.controllers.simbot.clients import SimBotControllerClients
+from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.datamodels import EmmaExtractedFeatures
+from emma_experience_hub.functions.simbot import SimBotSceneObjectTokens
+from emma_experience_hub.parsers.simbot import SimBotVisualGroundingOutputParser
+from emma_experience_hub.pipelines.simbot import SimBotFindObjectPipeline
+
+
+def _create_frame(entity_labels: list[str], bbox_sizes: list[int]) -> EmmaExtractedFeatures:
+    """Create a frame where each object is a square of the given size."""
+    num_objects = len(entity_labels)
+    return EmmaExtractedFeatures.parse_obj(
+        {
+            "bbox_features": torch.ones(num_objects, 3),
+            "bbox_coords": torch.tensor(
+                [[0, 0, bbox_size, bbox_size] for bbox_size in bbox_sizes]
+            ),
+            "bbox_probas": torch.ones(num_objects, 4),
+            "cnn_features": torch.tensor([1, 2]),
+            "class_labels": entity_labels,
+            "entity_labels": entity_labels,
+            "width": 300,
+            "height": 300,
+        }
+    )
+
+
+@fixture
+def look_around_frames() -> list[EmmaExtractedFeatures]:
+    """Frames from looking around, where the apple is seen in every frame but the last."""
+    return [
+        _create_frame(["Apple", "Bowl"], [10, 50]),
+        _create_frame(["Bowl", "Apple"], [100, 40]),
+        _create_frame(["Apple", "Apple"], [80, 90]),
+        _create_frame(["Bowl"], [120]),
+    ]
+
+
+@fixture
+def find_object_pipeline(simbot_settings: SimBotSettings) -> SimBotFindObjectPipeline:
+    """Find object pipeline which grounds every frame from a location at once."""
+    clients = SimBotControllerClients.from_simbot_settings(simbot_settings)
+    return SimBotFindObjectPipeline.from_planner_type(
+        features_client=clients.features,
+        action_predictor_client=clients.action_predictor,
+        visual_grounding_output_parser=SimBotVisualGroundingOutputParser(),
+        enable_batched_grounding=True,
+    )
+
+
+def test_largest_unique_view_of_grounded_object_is_selected(
+    find_object_pipeline: SimBotFindObjectPipeline,
+    look_around_frames: list[EmmaExtractedFeatures],
+) -> None:
+    scene_object_tokens = find_object_pipeline._select_largest_view_of_object(  # noqa: WPS437
+        SimBotSceneObjectTokens(frame_index=1, object_index=1), look_around_frames
+    )
+
+    assert scene_object_tokens == SimBotSceneObjectTokens(frame_index=2, object_index=2)
+
+
+def test_grounded_object_is_kept_when_it_is_not_unique_in_its_frame(
+    find_object_pipeline: SimBotFindObjectPipeline,
+    look_around_frames: list[EmmaExtractedFeatures],
+) -> None:
+    grounded_object_tokens = SimBotSceneObjectTokens(frame_index=3, object_index=1)
+
+    scene_object_tokens = find_object_pipeline._select_largest_view_of_object(  # noqa: WPS437
+        grounded_object_tokens, look_around_frames
+    )
+
+    assert scene_object_tokens == grounded_object_tokens
@@ -0,0 +1,81 @@
+from pathlib import Path
+from typing import Any
+
+from pytest import MonkeyPatch
+from pytest_cases import fixture
+
+from emma_common.datamodels import EnvironmentStateTurn
+from emma_experience_hub.api.clients.simbot import (
+    SimbotActionPredictionClient,
+    SimBotCRIntentClient,
+)
+from emma_experience_hub.api.controllers.simbot.clients import SimBotControllerClients
+from emma_experience_hub.api.controllers.simbot.pipelines import SimBotControllerPipelines
+from emma_experience_hub.common.settings import SimBotSettings
+from emma_experience_hub.datamodels.simbot import (
+    SimBotIntentType,
+    SimBotRequest,
+    SimBotSession,
+    SimBotSessionTurn,
+)
+from tests.fixtures.simbot_api_requests import SimBotRequestCases
+from tests.fixtures.simbot_arena_constants import create_placeholder_features_frames
+
+
+@fixture
+def speculative_pipelines(simbot_settings: SimBotSettings) -> SimBotControllerPipelines:
+    """Pipelines which predict the action while CR is running."""
+    feature_flags = simbot_settings.feature_flags.copy(
+        update={"enable_speculative_action_prediction": True}
+    )
+    settings = simbot_settings.copy(update={"feature_flags": feature_flags})
+    return SimBotControllerPipelines.from_clients(
+        SimBotControllerClients.from_simbot_settings(settings), settings
+    )
+
+
+@fixture
+def policy_requests(monkeypatch: MonkeyPatch) -> list[list[EnvironmentStateTurn]]:
+    """Mock CR to act on the instruction, and keep the history given to the action predictor."""
+    environment_state_histories: list[list[EnvironmentStateTurn]] = []
+
+    def get_cr(*args: Any, **kwargs: Any) -> str:  # noqa: WPS430
+        return "<act><one_match>"
+
+    def get_action(*args: Any, **kwargs: Any) -> str:  # noqa: WPS430
+        environment_state_histories.append(kwargs["environment_state_history"])
+        return "goto breakroom<stop>."
+
+    monkeypatch.setattr(SimBotCRIntentClient, "generate", get_cr)
+    monkeypatch.setattr(SimbotActionPredictionClient, "generate", get_action)
+    return environment_state_histories
+
+
+def _create_session_with_new_instruction(simbot_game_metadata_dir: Path) -> SimBotSession:
+    """Create a session where the user has just given an instruction."""
+    simbot_request = SimBotRequest.parse_obj(
+        SimBotRequestCases().case_without_previous_actions(simbot_game_metadata_dir)
+    )
+    turn = SimBotSessionTurn.new_from_simbot_request(simbot_request, idx=0)
+    turn.intent.user = SimBotIntentType.act
+    return SimBotSession(session_id=turn.session_id, turns=[turn])
+
+
+def test_speculative_action_prediction_includes_the_current_frames(
+    speculative_pipelines: SimBotControllerPipelines,
+    policy_requests: list[list[EnvironmentStateTurn]],
+    mock_feature_extraction_response: Any,
+    simbot_game_metadata_dir: Path,
+) -> None:
+    session = _create_session_with_new_instruction(simbot_game_metadata_dir)
+
+    # Set the intents in the same way as the controller, once the speculation has started
+    agent_intents = speculative_pipelines.agent_intent_selector.run(session)
+    session.current_turn.intent.physical_interaction = agent_intents.physical_interaction
+    action = speculative_pipelines.agent_action_generator.run(session)
+
+    assert action is not None
+    assert len(policy_requests) == 1
+    assert [turn.features[0].entity_labels for turn in policy_requests[0]] == [
+        create_placeholder_features_frames()[0].entity_labels
+    ]